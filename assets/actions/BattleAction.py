@@ -1,8 +1,7 @@
-import random
-
 from engine.system import Message
 from engine.game.dungeon.action import Action
 from engine.game.monster.monster import Monster
+from engine.game.random_streams import stream, MAP
 
 class BattleAction(Action):
 
@@ -19,6 +18,18 @@ class BattleAction(Action):
         If no monsters are declared for the battle then a random
         set of monsters will be generated at the specified challenge
         rating. Otherwise monsters will override."""
+        monster_names = self.generate_monsters(game.floor_type)
+
+        # Execute
+        system.message("battle", Message("start",
+            [Monster(name) for name in monster_names]))
+        system.message("ui", Message("layout", "battle"))
+        system.message("sound", Message("bg", "data/sound/background/Theyre-Closing-In_looping.wav"))
+
+    def generate_monsters(self, floor_type):
+        """Returns the names of the monsters to fight on the given floor.
+        Declared monsters are returned as is, otherwise monsters are
+        randomly picked until the challenge rating is spent."""
         monster_names = []
         if self.monsters:
             monster_names = self.monsters
@@ -29,14 +40,14 @@ class BattleAction(Action):
                 # Get valid monsters
                 for name, monster in Monster.MONSTERS.items():
                     if monster["rating"] <= challenge and \
-                            monster["location"] == game.floor_type and \
+                            monster["location"] == floor_type and \
                             not monster["unique"]:
                         valid_monsters.append((name, monster["rating"]))
                 # If no valid monsters break
                 if not valid_monsters:
                     break
                 # Select monster
-                name, rating = random.choice(valid_monsters)
+                name, rating = stream(MAP).choice(valid_monsters)
                 monster_names.append(name)
                 challenge -= rating
 
@@ -46,7 +57,7 @@ class BattleAction(Action):
                 valid_monsters = [(name, monster["rating"])
                     for name, monster in Monster.MONSTERS.items()
                     if monster["rating"] <= challenge and \
-                    monster["location"] == game.floor_type and \
+                    monster["location"] == floor_type and \
                     not monster["unique"]]
 
                 highest_value = 0
@@ -55,10 +66,5 @@ class BattleAction(Action):
                         highest_value = value
                 valid_names = [name for name, value in valid_monsters
                                if value <= highest_value]
-                monster_names.append(random.choice(valid_names))
-
-        # Execute
-        system.message("battle", Message("start",
-            [Monster(name) for name in monster_names]))
-        system.message("ui", Message("layout", "battle"))
-        system.message("sound", Message("bg", "data/sound/background/Theyre-Closing-In_looping.wav"))
\ No newline at end of file
+                monster_names.append(stream(MAP).choice(valid_names))
+        return monster_names
@@ -1,8 +1,7 @@
-import random
-
 from engine.system import Message
 from engine.game.dungeon.action import Action
 from engine.game.item.item_factory import ItemFactory
+from engine.game.random_streams import stream, LOOT
 
 class LootAction(Action):
     LOW = "low"
@@ -26,26 +25,27 @@ class LootAction(Action):
 
         shards = 0
         items = []
+        rng = stream(LOOT)
 
         # Handle no shards or items
         if not self.shards and not self.items:
             # Generate shards
             if self.reward_tier == LootAction.LOW:
-                shards = game.floor_level * random.randint(15, 20)
+                shards = game.floor_level * rng.randint(15, 20)
             elif self.reward_tier == LootAction.MEDUIM:
-                shards = game.floor_level * random.randint(30, 35)
+                shards = game.floor_level * rng.randint(30, 35)
             elif self.reward_tier == LootAction.HIGH:
-                shards = game.floor_level * random.randint(50, 70)
+                shards = game.floor_level * rng.randint(50, 70)
 
             # Generate items
             if self.reward_tier == LootAction.MEDUIM:
                 # 30% change of getting an item of "medium" reward tier
-                if random.randint(0, 99) < 30:
+                if rng.randint(0, 99) < 30:
                     items = [ItemFactory.generate(
                         game.encounter, game.floor_type)]
             elif self.reward_tier == LootAction.HIGH:
                 # 70% change of getting an item of "high" reward tier
-                if random.randint(0, 99) < 70:
+                if rng.randint(0, 99) < 70:
                     items = [ItemFactory.generate(
                         game.encounter, game.floor_type)]
         else:
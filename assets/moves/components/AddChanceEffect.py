@@ -1,4 +1,5 @@
 from engine.game.move.component import Component
+from engine.game.random_streams import stream, COMBAT
 
 class AddChanceEffect(Component):
 
@@ -10,7 +11,7 @@ class AddChanceEffect(Component):
         self.chance = chance
 
     def on_cast(self, target, caster, players, monsters, system):
-        rand = random.randint(0, 99)
+        rand = stream(COMBAT).randint(0, 99)
         if rand > self.chance:
             return ""
         else:
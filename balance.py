@@ -0,0 +1,32 @@
+#!python3.5
+"""Plays simulated battles at a challenge rating and prints how the
+party fared. Used to tune monster ratings."""
+import argparse
+
+from engine.game.battle_balancer import BattleBalancer
+from engine.game.player.player import Player
+from engine.serialization.move import MoveDataManager
+
+def build_party(moves):
+    """Builds the starting party the same way the GameSystem does"""
+    move_dm = MoveDataManager()
+    party = [Player("Player " + str(i + 1)) for i in range(4)]
+    for player in party:
+        for i, name in enumerate(moves):
+            player.add_move(move_dm.get_move(name))
+            player.castbar[i] = player.moves[i]
+    return party
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("challenge", type=int)
+    parser.add_argument("--floor", default="catacombs")
+    parser.add_argument("--battles", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--moves", nargs="+", default=["attack"])
+    args = parser.parse_args()
+
+    balancer = BattleBalancer(build_party(args.moves), args.floor,
+        args.challenge, args.processes)
+    print(balancer.run(args.battles, args.seed))
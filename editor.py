@@ -1,4 +1,7 @@
 #!python3.4
+from engine.profiling import startup
+startup.start_from_environment()
+
 import editor.main
 
 if __name__ == '__main__':
@@ -7,6 +7,7 @@ from PyQt5 import QtGui, QtWidgets
 
 import editor.design.editor_design as design
 import editor.core as core
+from engine.profiling import startup
 
 class Editor(QtWidgets.QMainWindow, design.Ui_MainWindow):
 
@@ -23,7 +24,9 @@ class Editor(QtWidgets.QMainWindow, design.Ui_MainWindow):
 
 def init():
     app = QtWidgets.QApplication(sys.argv)
-    form = Editor()
-    form.show()
+    with startup.phase("Editor", "window"):
+        form = Editor()
+        form.show()
+    startup.finish()
     sip.setdestroyonexit(False) # Fixes a crash bug
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""Script to pack the small images of the game into sprite atlases. Run
+from the repository root with python -m editor.scripts.build_atlas after
+adding or changing images."""
+from engine.ui.draw.atlas import build, INDEX
+
+data = build()
+for page in data["atlases"]:
+    print("Packed %d images into %s" % (len(page["sprites"]), page["image"]))
+print("Wrote %s" % INDEX)
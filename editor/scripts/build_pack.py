@@ -0,0 +1,10 @@
+"""Script to bundle the game's data, images, sounds and fonts into the
+content pack. Run from the repository root with
+python -m editor.scripts.build_pack after changing any of them."""
+import os
+
+from engine.content import build, PACK
+
+index = build()
+print("Packed %d files into %s (%d bytes)" % (len(index), PACK,
+    os.path.getsize(PACK)))
@@ -0,0 +1,21 @@
+"""Script to migrate the pickle files in the data directory to the
+indexed DataStore. Run from the repository root with
+python -m editor.scripts.migrate_data [data directory]"""
+import os
+import sys
+import glob
+
+from engine.serialization.store import DataStore
+
+directory = DataStore.DATA_DIRECTORY
+if len(sys.argv) == 2:
+    directory = sys.argv[1]
+
+store = DataStore(os.path.join(directory, "game.db"), directory)
+print("Schema version: %d" % store.version())
+for filename in sorted(glob.glob(os.path.join(directory, "**", "*.p"),
+        recursive=True)):
+    collection = store.import_pickle(filename)
+    print("Migrated %s to %s (%d records)" % (filename, collection,
+        len(store.keys(collection))))
+store.close()
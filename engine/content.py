@@ -0,0 +1,196 @@
+"""Implements the ContentPack bundling the game's files into one archive
+
+The pack is built with python -m editor.scripts.build_pack and read by
+mapping it into memory, so the game opens one file instead of one per
+image, sound, font and data file. The pack holds the files one after
+another, followed by a JSON index of their offsets and sizes by path and
+a footer giving the offset and size of the index.
+
+Files in the pack are served from it even if they changed on disk since,
+so it has to be built again or removed after changing them."""
+from glob import glob
+import json
+import mmap
+import io
+import os
+import struct
+
+MAGIC = b"DUNGEONPACK1"
+FOOTER = struct.Struct("<QQ") # offset and size of the index
+PACK = "content.pak"
+CONTENT = ("data/**/*.p", "data/sound/**/*.*", "image/**/*.*",
+    "assets/fonts/*.*")
+
+def normalize(filename):
+    """Returns the path the file is kept under in the pack"""
+    return os.path.normpath(filename).replace(os.sep, "/")
+
+def build(output=PACK, patterns=CONTENT):
+    """Packs the files matching the glob patterns into output. Returns the
+    index of (offset, size) by path."""
+    filenames = sorted(set(normalize(filename) for pattern in patterns
+        for filename in glob(pattern, recursive=True)
+        if os.path.isfile(filename)))
+    index = {}
+    with open(output, "wb") as pack:
+        pack.write(MAGIC)
+        for filename in filenames:
+            with open(filename, "rb") as file:
+                data = file.read()
+            index[filename] = (pack.tell(), len(data))
+            pack.write(data)
+        offset = pack.tell()
+        data = json.dumps(index, sort_keys=True).encode("utf-8")
+        pack.write(data)
+        pack.write(FOOTER.pack(offset, len(data)))
+    return index
+
+
+class PackFile(io.RawIOBase):
+    """Read only file object over a file in a ContentPack. Each read
+    returns a new bytes copy of that part of the mapped pack, since pygame
+    and the unpickler need bytes; readinto copies into the caller's buffer
+    instead. Only the pages that are read are loaded from disk."""
+
+    def __init__(self, pack, offset, size, name):
+        super().__init__()
+        self.map = pack.map
+        self.view = pack.view
+        self.start = offset
+        self.end = offset + size
+        self.position = offset
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), self.end - self.position))
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.end - self.position
+        data = self.map[self.position:min(self.end, self.position + size)]
+        self.position += len(data)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def readline(self, size=-1):
+        end = self.map.find(b"\n", self.position, self.end)
+        end = self.end if end == -1 else end + 1
+        if size is not None and size >= 0:
+            end = min(end, self.position + size)
+        return self.read(end - self.position)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = self.start + offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        else:
+            position = self.end + offset
+        self.position = max(self.start, position)
+        return self.position - self.start
+
+    def tell(self):
+        return self.position - self.start
+
+
+class ContentPack(object):
+    """Memory mapped pack of files"""
+
+    def __init__(self, filename=PACK):
+        self.filename = filename
+        with open(filename, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        if self.map[:len(MAGIC)] != MAGIC:
+            raise ValueError("%s is not a content pack" % filename)
+        offset, size = FOOTER.unpack(self.map[-FOOTER.size:])
+        self.index = json.loads(self.map[offset:offset + size].decode(
+            "utf-8"))
+        self.opens = 0
+
+    def __contains__(self, filename):
+        return normalize(filename) in self.index
+
+    def size(self, filename):
+        return self.index[normalize(filename)][1]
+
+    def open(self, filename):
+        """Returns a PackFile of the file. Raises KeyError if the file is
+        not in the pack"""
+        name = normalize(filename)
+        offset, size = self.index[name]
+        self.opens += 1
+        return PackFile(self, offset, size, name)
+
+    def stats(self):
+        return {"files": len(self.index), "bytes": len(self.map),
+            "opens": self.opens}
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+
+# Pack of the game, opened on first use
+_pack = None
+_opened = False
+
+def get_pack():
+    """Returns the ContentPack of the game. None if it was not built"""
+    global _pack, _opened
+    if not _opened:
+        _opened = True
+        if os.path.exists(PACK):
+            _pack = ContentPack(PACK)
+    return _pack
+
+def set_pack(pack):
+    """Replaces the pack the game reads from. None reads loose files"""
+    global _pack, _opened
+    _pack = pack
+    _opened = True
+
+def source(filename):
+    """Returns what to hand pygame to load the file: a file object in the
+    pack, or the filename when it is not packed"""
+    pack = get_pack()
+    if pack is not None and filename in pack:
+        return pack.open(filename)
+    return filename
+
+def open_file(filename):
+    """Opens the file for reading bytes, from the pack if it is in it"""
+    pack = get_pack()
+    if pack is not None and filename in pack:
+        return pack.open(filename)
+    return open(filename, "rb")
+
+def exists(filename):
+    pack = get_pack()
+    return (pack is not None and filename in pack) or \
+        os.path.exists(filename)
+
+def mtime(filename):
+    """Returns when the file was last changed, which is when the pack was
+    built for packed files"""
+    pack = get_pack()
+    if pack is not None and filename in pack:
+        return os.path.getmtime(pack.filename)
+    return os.path.getmtime(filename)
+
+def size(filename):
+    pack = get_pack()
+    if pack is not None and filename in pack:
+        return pack.size(filename)
+    return os.path.getsize(filename)
@@ -0,0 +1,103 @@
+"""Implements the BattleBalancer used to measure encounter difficulty"""
+from multiprocessing import Pool
+import math
+import copy
+
+from engine.game.battle_simulator import BattleSimulator
+from engine.game.monster.monster import Monster
+from engine.game.random_streams import RandomStreams, set_streams
+from assets.actions.BattleAction import BattleAction
+
+def percentile(values, percent):
+    """Returns the nearest-rank percentile of a list of values. None if
+    there are no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = int(math.ceil(percent / 100 * len(ordered))) - 1
+    return ordered[max(index, 0)]
+
+
+class BalanceReport(object):
+    """Aggregated statistics of many simulated battles.
+    win_rate is the fraction of battles won by the players. time_to_kill
+    maps each percentile to the duration of battles the players won.
+    move_damage maps "players" and "monsters" to the share of that side's
+    damage each of its moves dealt."""
+
+    def __init__(self, results, percentiles):
+        self.battles = len(results)
+        wins = [result for result in results if result.winner == "players"]
+        if results:
+            self.win_rate = len(wins) / len(results)
+        else:
+            self.win_rate = 0
+        durations = [result.duration for result in wins]
+        self.time_to_kill = {p: percentile(durations, p)
+            for p in percentiles}
+
+        self.move_damage = {}
+        for side in ("players", "monsters"):
+            totals = {}
+            for result in results:
+                for name, damage in result.moves[side].items():
+                    totals[name] = totals.get(name, 0) + damage
+            total_damage = sum(totals.values())
+            self.move_damage[side] = {name: damage / total_damage
+                for name, damage in totals.items() if total_damage}
+
+    def __str__(self):
+        lines = ["Battles: %d" % self.battles,
+                 "Win rate: %.1f%%" % (self.win_rate * 100)]
+        for p, duration in sorted(self.time_to_kill.items()):
+            if duration is None:
+                lines.append("Time to kill p%d: -" % p)
+            else:
+                lines.append("Time to kill p%d: %.2fs" % (p, duration))
+        for side, shares in sorted(self.move_damage.items(), reverse=True):
+            for name, share in sorted(shares.items(),
+                    key=lambda item: -item[1]):
+                lines.append("%s: %.1f%% of %s damage" % (name, share * 100,
+                    side))
+        return "\n".join(lines)
+
+
+class BattleBalancer(object):
+    """Plays seeded battles of a party against monsters generated the
+    same way a BattleAction does, spread across a pool of processes."""
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, party, floor_type, challenge, processes=None,
+            simulator=None):
+        """party is a list of characters that is copied for every battle.
+        processes defaults to the number of cpus."""
+        self.party = party
+        self.floor_type = floor_type
+        self.challenge = challenge
+        self.processes = processes
+        if simulator is None:
+            self.simulator = BattleSimulator()
+        else:
+            self.simulator = simulator
+
+    def run(self, battles, seed=0):
+        """Plays the given number of battles and returns a BalanceReport.
+        Battle i is seeded with seed + i so runs can be repeated."""
+        seeds = [seed + i for i in range(battles)]
+        with Pool(self.processes) as pool:
+            results = pool.map(self.play, seeds)
+        return BalanceReport(results, self.PERCENTILES)
+
+    def play(self, seed):
+        """Plays a single battle with the given seed"""
+        set_streams(RandomStreams(seed))
+        players = copy.deepcopy(self.party)
+        return self.simulator.run(players, self.generate_monsters())
+
+    def generate_monsters(self):
+        """Returns the monsters of a battle, picked with the current random
+        streams"""
+        names = BattleAction(self.challenge).generate_monsters(
+            self.floor_type)
+        return [Monster(name) for name in names]
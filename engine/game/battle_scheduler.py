@@ -0,0 +1,85 @@
+"""Implements the BattleScheduler used to skip idle time in battles"""
+import heapq
+
+from engine.game.effect.effect import Effect
+
+class BattleScheduler(object):
+    """Priority queue of the upcoming events of each character. An event is
+    either a character's action bar filling up or its effect durations
+    stepping down by a second. Between events a character's action builds
+    at a constant rate so time can jump straight to the next one.
+
+    Each character has at most one queued event. Rescheduling a character
+    discards its previous event. Events are either turns, where the
+    character may cast and affect everyone else, or steps which only
+    involve the character itself."""
+
+    EPSILON = 1e-9 # overshoot so floating point error never stops short
+
+    def __init__(self):
+        self.now = 0
+        self.queue = []
+        self.last = {} # time each character was last advanced to
+        self.versions = {}
+        self.count = 0 # keeps events at the same time in insertion order
+
+    def add(self, character):
+        """Starts tracking a character from the current time"""
+        self.last[character] = self.now
+        self.schedule(character)
+
+    def schedule(self, character, delay=None):
+        """Queues the next event of a character. If a delay is given the
+        event is a turn, otherwise it is computed from the character's
+        action rate and effects."""
+        version = self.versions.get(character, 0) + 1
+        self.versions[character] = version
+        if delay is None:
+            delay, turn = self.next_event(character)
+        else:
+            turn = True
+        if delay is None:
+            return
+        heapq.heappush(self.queue,
+            (self.now + delay, self.count, version, turn, character))
+        self.count += 1
+
+    def pop(self):
+        """Advances the current time to the next event and returns the
+        character it belongs to and whether it is a turn. None if no
+        events are left."""
+        while self.queue:
+            time, _, version, turn, character = heapq.heappop(self.queue)
+            if version == self.versions[character]:
+                self.now = time
+                return character, turn
+        return None
+
+    def elapsed(self, character):
+        """Returns the time since the character was last advanced and marks
+        it as advanced to the current time"""
+        delta = self.now - self.last[character]
+        self.last[character] = self.now
+        return delta
+
+    def next_event(self, character):
+        """Returns the seconds until the character is ready or its effects
+        step down and whether it will be ready. The delay is None if
+        neither will happen."""
+        if character.fallen:
+            return None, False
+        step = None
+        if any(effect.duration != Effect.PERMANENT
+                for effect in character.effects):
+            step = 1 - character.overflow + self.EPSILON
+
+        remaining = character.get_stat("action") - character.action
+        rate = character.get_action_rate()
+        for effect in character.effects:
+            if effect.active:
+                rate = effect.on_build_action(rate)
+        if rate > 0:
+            turn = max(remaining, 0) / rate + self.EPSILON
+            if step is None or turn <= step:
+                return turn, True
+        return step, False
@@ -0,0 +1,197 @@
+"""Implements the BattleSimulator used to run battles without a display"""
+from collections import OrderedDict
+
+from engine.game.game_object import GameObject
+from engine.game.battle_scheduler import BattleScheduler
+from engine.game.random_streams import stream, COMBAT
+
+def choose_move(character, players, monsters):
+    """Selects a random castbar move and builds up targets the same way
+    clicking on character and monster cards does. Enemies of the
+    character are tried first."""
+    castbar = getattr(character, "castbar", character.moves)
+    moves = [move for move in castbar if move is not None]
+    if not moves:
+        return
+    rng = stream(COMBAT)
+    move = rng.choice(moves)
+
+    enemies = [m for m in monsters if not m.fallen]
+    allies = [p for p in players if not p.fallen]
+    rng.shuffle(enemies)
+    rng.shuffle(allies)
+    target = []
+    for candidate in enemies + allies:
+        if move.is_valid_target(target + [candidate], players,
+                monsters):
+            target.append(candidate)
+            if move.is_valid_cast(target, players, monsters):
+                break
+
+    if target:
+        character.selected_move = move
+        character.target = target
+
+
+class HeadlessGame(object):
+    """Stand-in for the Game object during simulation. Moves and effects
+    send their sound, animation and ui messages here, which are dropped."""
+
+    def message(self, system, message):
+        """Ignores the message"""
+        pass
+
+    def quit(self):
+        pass
+
+
+class BattleResult(object):
+    """Compact record of a simulated battle. winner is either "players",
+    "monsters" or None if the battle ran out of time. duration is the
+    simulated time in seconds. damage is a list of (name, damage) pairs for
+    the party followed by the encounter. moves maps "players" and
+    "monsters" to the damage each side dealt with each of its moves."""
+
+    def __init__(self, winner, duration, damage, moves):
+        self.winner = winner
+        self.duration = duration
+        self.damage = damage
+        self.moves = moves
+
+    def __repr__(self):
+        return "BattleResult(%s, %.2fs)" % (self.winner, self.duration)
+
+
+class BattleSimulator(object):
+    """Runs an encounter to completion with a fixed timestep. Mirrors the
+    update order of the BattleSystem but never touches pygame. Players
+    pick their moves and targets through choose_move since there is no
+    one to click on the castbar.
+
+    In scheduled mode a BattleScheduler is used instead of the fixed
+    timestep, jumping straight from one turn or effect step to the next."""
+
+    TIMESTEP = 1 / 20 # seconds of battle per simulated step
+    MAX_DURATION = 600 # seconds before the battle is called a draw
+
+    def __init__(self, timestep=TIMESTEP, max_duration=MAX_DURATION,
+            scheduled=False):
+        self.timestep = timestep
+        self.max_duration = max_duration
+        self.scheduled = scheduled
+        self.system = HeadlessGame()
+
+    def run(self, players, monsters):
+        """Simulate the battle between the players and monsters and returns
+        a BattleResult. The characters are left in their end of battle
+        state."""
+        game = GameObject()
+        game.party.players = list(players)
+        game.encounter = list(monsters)
+        damage = OrderedDict((character, 0) for character in
+            game.party.players + game.encounter)
+        moves = {"players": {}, "monsters": {}}
+
+        if self.scheduled:
+            winner, duration = self.run_scheduled(game, damage, moves)
+        else:
+            winner, duration = self.run_fixed(game, damage, moves)
+        return BattleResult(winner, duration,
+            [(character.name, dealt) for character, dealt in damage.items()],
+            moves)
+
+    def run_fixed(self, game, damage, moves):
+        """Advances every character by the timestep until the battle is
+        over. Returns the winner and duration."""
+        duration = 0
+        while duration < self.max_duration:
+            for character in damage:
+                self.step(character, self.timestep, game, damage, moves)
+            duration += self.timestep
+
+            winner = self.get_winner(game)
+            if winner:
+                return winner, duration
+        return None, duration
+
+    def run_scheduled(self, game, damage, moves):
+        """Advances from event to event until the battle is over. Returns
+        the winner and duration."""
+        scheduler = BattleScheduler()
+        for character in damage:
+            scheduler.add(character)
+
+        while True:
+            event = scheduler.pop()
+            if event is None or scheduler.now >= self.max_duration:
+                return None, min(scheduler.now, self.max_duration)
+
+            character, turn = event
+            if turn:
+                self.take_turn(character, scheduler, game, damage, moves)
+            else:
+                # Effect step, nobody else is involved
+                self.step(character, scheduler.elapsed(character), game,
+                    damage, moves)
+                scheduler.schedule(character)
+
+            winner = self.get_winner(game)
+            if winner:
+                return winner, scheduler.now
+
+    def take_turn(self, character, scheduler, game, damage, moves):
+        """Brings every character up to the current time, lets the given
+        character cast and reschedules the characters whose effects were
+        changed by the cast."""
+        effects = {other: list(other.effects) for other in damage}
+        for other in damage:
+            self.step(other, scheduler.elapsed(other), game, damage, moves)
+        # Zero steps cast the selected move, register any deaths and let
+        # the caster notice its action bar has emptied
+        self.step(character, 0, game, damage, moves)
+        for other in damage:
+            self.step(other, 0, game, damage, moves)
+
+        for other in damage:
+            if other is character:
+                if other.action >= other.get_stat("action"):
+                    # Could not cast, try again later
+                    scheduler.schedule(other, self.timestep)
+                else:
+                    scheduler.schedule(other)
+            elif other.effects != effects[other] or other.fallen:
+                scheduler.schedule(other)
+
+    def get_winner(self, game):
+        """Returns the side that won, None if the battle is not over"""
+        if all(player.fallen for player in game.party.players):
+            return "monsters"
+        if all(monster.fallen for monster in game.encounter):
+            return "players"
+        return None
+
+    def step(self, character, delta, game, damage, moves):
+        """Advances a single character by delta seconds. The damage the
+        character dealt to the other side is added to its entry in damage
+        and to the cast move in moves."""
+        players = game.party.players
+        if character in players:
+            side = "players"
+            opponents = game.encounter
+            if character.ready and not character.selected_move and \
+                    not character.fallen:
+                choose_move(character, players, game.encounter)
+        else:
+            side = "monsters"
+            opponents = players
+
+        move = character.selected_move
+        before = sum(c.current_health for c in opponents)
+        character.handle_battle(delta, game, self.system)
+        after = sum(c.current_health for c in opponents)
+        dealt = max(before - after, 0)
+        if dealt:
+            damage[character] += dealt
+            if move is not None:
+                moves[side][move.name] = moves[side].get(move.name, 0) + \
+                    dealt
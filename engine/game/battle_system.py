@@ -8,6 +8,8 @@ from engine.system import System, Message
 class BattleSystem(System):
     """System responsible for handling battle"""
 
+    simulated = True
+
     def __init__(self, game):
         super().__init__(game, "battle")
 
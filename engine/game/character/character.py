@@ -1,12 +1,12 @@
 from collections import OrderedDict
 import pickle
 import math
-import random
 import copy
 
 from engine.game.attribute.attribute import Attribute
 
 from engine.game.effect.effect import Effect
+from engine.game.random_streams import stream, COMBAT
 
 class Character(object):
     """Character is the base class for units that interact during battles.
@@ -35,9 +35,11 @@ class Character(object):
         self.stats["resist"] = 0
         self.stats["speed"] = Character.SPEED_BASE/(Character.SPEED_CAP-1)
         self.stats["action"] = 100 # defines max action
+        self.stat_cache = {} # cleared whenever stats or effects change
         self.current_health = self.stats["health"]
          # enough to do 1 ACTION_SPEED per second
         self.action = 0
+        self.previous_action = 0 # action before the last battle update
         self.ready = False
         self.scroll = 0
         self.target = [] # Used to get the target of the move
@@ -50,25 +52,29 @@ class Character(object):
 
         # Reset Action
         self.action = 0
+        self.previous_action = 0
 
     def get_cur_action(self):
         """Returns the current action"""
         return self.action
 
+    def get_shown_action(self, alpha=1):
+        """Returns the action to show alpha of the way from the last battle
+        update to the next, between the action before and after it. Action
+        that was spent is shown right away."""
+        if self.action < self.previous_action:
+            return self.action
+        return self.previous_action + \
+            (self.action - self.previous_action) * alpha
+
     def handle_battle(self, delta, game, system):
         """Handles each characters update loop"""
+        self.previous_action = self.action
         steps = math.floor(self.overflow+delta)        # Used for buffs/debuffs
         self.overflow = (self.overflow+delta)-steps    # Used for carry over
         self.decrease_durations(steps)
         # Calculated after effect speed
-        speed = self.get_stat("speed")
-        action = delta * Character.ACTION_SPEED *\
-            (Character.SPEED_CAP*speed/(Character.SPEED_BASE+speed))
-        if action == 0: # being nice as if you have speed 1
-            action = delta * Character.ACTION_SPEED *\
-                (Character.SPEED_CAP*1/\
-                (Character.SPEED_BASE+1))
-        self.build_action(action)
+        self.build_action(delta * self.get_action_rate())
 
         # Calculate ready
         if self.action >= self.get_stat("action") and not self.ready:
@@ -103,6 +109,18 @@ class Character(object):
                 self.target = []
 
 
+    def get_action_rate(self):
+        """Returns the action built per second from the current speed.
+        Effects on building action are not applied."""
+        speed = self.get_stat("speed")
+        rate = Character.ACTION_SPEED *\
+            (Character.SPEED_CAP*speed/(Character.SPEED_BASE+speed))
+        if rate == 0: # being nice as if you have speed 1
+            rate = Character.ACTION_SPEED *\
+                (Character.SPEED_CAP*1/\
+                (Character.SPEED_BASE+1))
+        return rate
+
     def kill(self):
         """Kills this character returns True if success else False
         takes into account effects"""
@@ -136,9 +154,12 @@ class Character(object):
             if effect.duration <= effect.cur_tick and effect.tick:
                 effect.cur_tick -= effect.tick
                 effect.on_tick()
+        count = len(self.effects)
         self.effects = list(filter(lambda eff: eff.active and \
             (eff.duration == Effect.PERMANENT or eff.duration > 0),
             self.effects))
+        if len(self.effects) != count:
+            self.invalidate_stats()
 
         removed = filter(lambda effect:
             not effect.active or (effect.duration != Effect.PERMANENT and \
@@ -165,7 +186,7 @@ class Character(object):
         for effect in self.effects:
             if effect.active:
                 damage = effect.on_damage(source, damage, damage_type)
-        damage = int(damage - self.get_stat("defense") * (random.randint(100-Character.DAMAGE_VARIATION, 100+Character.DAMAGE_VARIATION)/100))
+        damage = int(damage - self.get_stat("defense") * (stream(COMBAT).randint(100-Character.DAMAGE_VARIATION, 100+Character.DAMAGE_VARIATION)/100))
         if damage <= 0:
             damage = 1
         for effect in source.effects:
@@ -181,7 +202,7 @@ class Character(object):
                 continue
             heal = effect.on_heal(battle, source, heal)
         heal = round(heal)
-        heal = int(heal*(random.randint(100-Character.HEAL_VARIATION,
+        heal = int(heal*(stream(COMBAT).randint(100-Character.HEAL_VARIATION,
             100+Character.HEAL_VARIATION)/100))
         if self.fallen:
             heal = 0
@@ -210,10 +231,21 @@ class Character(object):
         for effect in old_effects:
             if isinstance(effect, Attribute):
                 self.effects.append(effect)
+        self.invalidate_stats()
 
     def get_stat(self, stat_type):
         """Can be only used for health, attack, defense, speed,
-        resist, magic"""
+        resist, magic. Cached until the stats or effects change unless an
+        effect is not cacheable."""
+        stat = self.stat_cache.get(stat_type)
+        if stat is None:
+            stat = self.calculate_stat(stat_type)
+            if all(effect.cacheable for effect in self.effects):
+                self.stat_cache[stat_type] = stat
+        return stat
+
+    def calculate_stat(self, stat_type):
+        """Calculates the stat taking into account effects"""
         stat = self.stats[stat_type]
         for effect in self.effects:
             if not effect.active:
@@ -221,11 +253,17 @@ class Character(object):
             stat = effect.on_get_stat(stat, stat_type)
         return int(stat)
 
+    def invalidate_stats(self):
+        """Clears the cached stats. Must be called whenever something
+        get_stat depends on is changed."""
+        self.stat_cache = {}
+
     def get_cur_health(self):
         return self.current_health
 
     def add_effect(self, effect):
         effect = copy.deepcopy(effect)
+        self.invalidate_stats()
         for eff in self.effects:
             if eff.name == effect.name:
                 eff.on_refresh(effect)
@@ -237,6 +275,7 @@ class Character(object):
         for eff in self.effects[:]:
             if eff.name == ename:
                 self.effects.remove(eff)
+                self.invalidate_stats()
                 return True
         return False
 
@@ -256,6 +295,7 @@ class Character(object):
 
     def set_speed(self, speed):
         self.stats["speed"] = speed
+        self.invalidate_stats()
 
     def get_speed(self):
         return self.stats["speed"]
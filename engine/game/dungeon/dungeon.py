@@ -1,17 +1,18 @@
 import logging
-from random import randint, sample
 from functools import reduce
 
 import engine.game.monster.monster as monster
 import engine.game.item.item as item
 import engine.game.player.player as player
 import engine.game.dungeon.location as location
+from engine.game.random_streams import stream, MAP
 
 class Dungeon(object):
   """Dungeon object holds all the possible routes as well as in charge of moving"""
 
   def __init__(self, level_type, difficulty, **kwargs):
     self.level = level_type
+    rng = stream(MAP)
     #self.power = power
     self.difficulty = difficulty
     self.depth = 7
@@ -47,20 +48,20 @@ class Dungeon(object):
     # create the inbetween nodes
     frame = {}
     for i in range(self.depth):
-      frame[i] = [location.Location("event", self.level) for i in range(randint(self.min_width, self.max_width))]
+      frame[i] = [location.Location("event", self.level) for i in range(rng.randint(self.min_width, self.max_width))]
 
     for loc in frame[0]:
       self.start.set_neighbour(loc) # attach start to nodes
 
     # create distributions
     if self.branch_distribution == "normal":
-      bdist = lambda x, y: randint(x, y)
+      bdist = lambda x, y: rng.randint(x, y)
     elif self.branch_distribution == "low":
-      bdist = lambda x, y: min(randint(x, y), randint(x, y))
+      bdist = lambda x, y: min(rng.randint(x, y), rng.randint(x, y))
     elif self.branch_distribution == "high":
-      bdist = lambda x, y: max(randint(x, y), randint(x, y))
+      bdist = lambda x, y: max(rng.randint(x, y), rng.randint(x, y))
     elif self.branch_distribution == "bell":
-      bdist = lambda x, y: sorted([randint(x, y), randint(x, y), randint(x, y)])[1]
+      bdist = lambda x, y: sorted([rng.randint(x, y), rng.randint(x, y), rng.randint(x, y)])[1]
 
     for i in range(self.depth-1): # attach nodes to the end minus the last nodes
       used = set()
@@ -68,7 +69,7 @@ class Dungeon(object):
         branch = bdist(self.min_branch, self.max_branch)
         if branch > len(frame[i+1]): # overflow
           branch = len(frame[i+1])
-        for neighbour in sample(frame[i+1], branch):
+        for neighbour in rng.sample(frame[i+1], branch):
           loc.set_neighbour(neighbour)
           used.add(neighbour)
 
@@ -85,13 +86,13 @@ class Dungeon(object):
     # populate monsters
     # get monsters distributions
     if self.mon_distribution == "normal":
-      mdist = lambda x, y: randint(x, y)
+      mdist = lambda x, y: rng.randint(x, y)
     elif self.mon_distribution == "low":
-      mdist = lambda x, y: min(randint(x, y), randint(x, y))
+      mdist = lambda x, y: min(rng.randint(x, y), rng.randint(x, y))
     elif self.mon_distribution == "high":
-      mdist = lambda x, y: max(randint(x, y), randint(x, y))
+      mdist = lambda x, y: max(rng.randint(x, y), rng.randint(x, y))
     elif self.mon_distribution == "bell":
-      mdist = lambda x, y: sorted([randint(x, y), randint(x, y), randint(x, y)])[1]
+      mdist = lambda x, y: sorted([rng.randint(x, y), rng.randint(x, y), rng.randint(x, y)])[1]
 
     monster = mdist(self.min_monster, self.max_monster)
     if monster > len(nodes):
@@ -99,67 +100,67 @@ class Dungeon(object):
         # nodes cannot be added
       logging.warning("All nodes are full only creating %d monster from %d monster"%(len(nodes), monster))
       monster = len(nodes)
-    for node in sample(nodes, monster):
+    for node in rng.sample(nodes, monster):
       node.set_type("monster")
       nodes.remove(node)
 
     # # populate shops
     # # get shop distributions
     # if self.shop_distribution == "normal":
-    #   sdist = lambda x, y: randint(x, y)
+    #   sdist = lambda x, y: rng.randint(x, y)
     # elif self.shop_distribution == "low":
-    #   sdist = lambda x, y: min(randint(x, y), randint(x, y))
+    #   sdist = lambda x, y: min(rng.randint(x, y), rng.randint(x, y))
     # elif self.shop_distribution == "high":
-    #   sdist = lambda x, y: max(randint(x, y), randint(x, y))
+    #   sdist = lambda x, y: max(rng.randint(x, y), rng.randint(x, y))
     # elif self.shop_distribution == "bell":
-    #   sdist = lambda x, y: sorted([randint(x, y), randint(x, y), randint(x, y)])[1]
+    #   sdist = lambda x, y: sorted([rng.randint(x, y), rng.randint(x, y), rng.randint(x, y)])[1]
 
     # shops = sdist(self.min_shops, self.max_shops)
     # if shops > len(nodes): # check for overflow means that if there is no space certain
     #                                     # nodes cannot be added
     #   logging.warning("All nodes are full only creating %d shops from %d shops"%(len(nodes), shops))
     #   shops = len(nodes)
-    # for node in sample(nodes, shops):
+    # for node in rng.sample(nodes, shops):
     #   node.set_type("shop")
     #   nodes.remove(node)
 
     # # populate alters
     # # get shop distributions
     # if self.alter_distribution == "normal":
-    #   adist = lambda x, y: randint(x, y)
+    #   adist = lambda x, y: rng.randint(x, y)
     # elif self.alter_distribution == "low":
-    #   adist = lambda x, y: min(randint(x, y), randint(x, y))
+    #   adist = lambda x, y: min(rng.randint(x, y), rng.randint(x, y))
     # elif self.alter_distribution == "high":
-    #   adist = lambda x, y: max(randint(x, y), randint(x, y))
+    #   adist = lambda x, y: max(rng.randint(x, y), rng.randint(x, y))
     # elif self.alter_distribution == "bell":
-    #   adist = lambda x, y: sorted([randint(x, y), randint(x, y), randint(x, y)])[1]
+    #   adist = lambda x, y: sorted([rng.randint(x, y), rng.randint(x, y), rng.randint(x, y)])[1]
 
     # alters = adist(self.min_alters, self.max_alters)
     # if alters > len(nodes): # check for overflow means that if there is no space certain
     #                                     # nodes cannot be added
     #   logging.warning("All nodes are full only creating %d alters from %d alters"%(len(nodes), alters))
     #   alters = len(nodes)
-    # for node in sample(nodes, alters):
+    # for node in rng.sample(nodes, alters):
     #   node.set_type("alter")
     #   nodes.remove(node)
 
     # # populate items
     # # get shop distributions
     # if self.item_distribution == "normal":
-    #   idist = lambda x, y: randint(x, y)
+    #   idist = lambda x, y: rng.randint(x, y)
     # elif self.item_distribution == "low":
-    #   idist = lambda x, y: min(randint(x, y), randint(x, y))
+    #   idist = lambda x, y: min(rng.randint(x, y), rng.randint(x, y))
     # elif self.item_distribution == "high":
-    #   idist = lambda x, y: max(randint(x, y), randint(x, y))
+    #   idist = lambda x, y: max(rng.randint(x, y), rng.randint(x, y))
     # elif self.item_distribution == "bell":
-    #   idist = lambda x, y: sorted([randint(x, y), randint(x, y), randint(x, y)])[1]
+    #   idist = lambda x, y: sorted([rng.randint(x, y), rng.randint(x, y), rng.randint(x, y)])[1]
 
     # items = idist(self.min_items, self.max_items)
     # if items > len(nodes): # check for overflow means that if there is no space certain
     #                                     # nodes cannot be added
     #   logging.warning("All nodes are full only creating %d items from %d items"%(len(nodes), items))
     #   items = len(nodes)
-    # for node in sample(nodes, items):
+    # for node in rng.sample(nodes, items):
     #   node.set_type("item")
     #   nodes.remove(node)
     # for loc in frame.values():
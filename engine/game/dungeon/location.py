@@ -1,15 +1,15 @@
 from itertools import chain
-from random import choice, randint
 import xml.etree.ElementTree as tree
 import re
 
 import engine.game.dungeon.dialog as dialog
-from engine.serialization.scenario import EventDataManager
+from engine.serialization.registry import lazy
+from engine.game.random_streams import stream, MAP
 
 class Location(object):
 	"""Location object is the node for each part of a dungeon"""
 
-	event_dm = EventDataManager()
+	EVENTS = lazy("data/scenario.p") # events by floor and room type
 
 	def __init__(self, room_type, floor_type):
 		# can be event, entrance, exit, shop, alter, item
@@ -51,10 +51,10 @@ class Location(object):
 		on room_type and floor_type"""
 		# Gather a list of available events
 		available = []
-		available.extend(self.event_dm.events()["any"][self.room_type])
-		available.extend(self.event_dm.events()[self.floor_type][self.room_type])
+		available.extend(self.EVENTS["any"][self.room_type])
+		available.extend(self.EVENTS[self.floor_type][self.room_type])
 
-		self.event = choice(available)
+		self.event = stream(MAP).choice(available)
 
 	def __repr__(self):
 		return self.room_type
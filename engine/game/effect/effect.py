@@ -3,6 +3,10 @@ class Effect:
     PERMANENT = "permanent" # Given to permanent Effects
                             # can be removed with remove()
 
+    # Set to False if on_get_stat can change without the owner's effects
+    # changing, for instance if it depends on time or health
+    cacheable = True
+
     def __init__(self, name, duration, tick=None):
         """ Effects are actions that trigger after a certain action is made
         'name' is the identifier used to identify the effect
@@ -35,6 +39,8 @@ class Effect:
         """
         self.duration = 0
         self.active = False
+        if self.owner:
+            self.owner.invalidate_stats()
 
     def on_remove(self):
         pass
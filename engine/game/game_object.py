@@ -1,5 +1,6 @@
 """Define GameObject"""
 from engine.game.party.party import Party
+from engine.game.random_streams import RandomStreams
 
 class GameObject(object):
     """Game object used to hold all the data required for
@@ -7,8 +8,11 @@ class GameObject(object):
 
     DUNGEON_TYPES = ["catacomb"]
 
-    def __init__(self):
+    def __init__(self, seed=None):
+        """seed is used for the random streams of the run. A random seed
+        is picked if none is given."""
         super().__init__()
+        self.streams = RandomStreams(seed)
         self.difficulty = "normal"
         self.floor_level = 1
         self.floor_type = ""
@@ -1,6 +1,4 @@
 """Implements the Game System"""
-from random import randint
-
 import pygame
 
 from engine.serialization.move import MoveDataManager
@@ -9,16 +7,23 @@ from engine.system import System, Message
 from engine.game.dungeon.dungeon import Dungeon
 from engine.game.player.player import Player
 from engine.game.party.party import Party
+from engine.game.random_streams import stream, set_streams, MAP
 from engine.ui.core.manager import Manager
+from engine.ui.core.input import dispatcher
 
 class GameSystem(System):
     """System responsible for handling game related events"""
 
+    simulated = True
+
     def __init__(self, game):
         super().__init__(game, "game")
-        self.move_dm = MoveDataManager()
 
     def init(self, game):
+        # Loaded here rather than on construction so the background
+        # preload started before the game runs can load it first
+        self.move_dm = MoveDataManager()
+        set_streams(game.streams)
         game.difficulty = "normal"
         game.current_dungeon = Dungeon("catacombs", game.difficulty)
         game.floor_type = game.current_dungeon.level
@@ -32,15 +37,22 @@ class GameSystem(System):
 
     def handle_events(self, game):
         """Helper function to handle game events"""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        dispatcher.dispatch(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.game.quit()
                 return
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.game.profiler.toggle_overlay()
         game.mouse_x, game.mouse_y = pygame.mouse.get_pos()
         game.mouse_button = pygame.mouse.get_pressed()
 
-    def update(self, delta, game):
+    def update_frame(self, delta, game):
+        # Input is read every frame, however often the game is simulated
         self.handle_events(game)
+
+    def update(self, delta, game):
         messages = self.flush_messages()
         for message in messages:
             self.dispatch(message, game, self.game)
@@ -58,7 +70,7 @@ class GameSystem(System):
             dialogue = message.args[0]
             cur = game.current_location.get_dialogue(dialogue)
             while cur.fail:
-                if randint(0, 99) > cur.chance:
+                if stream(MAP).randint(0, 99) > cur.chance:
                     cur = game.current_location.get_dialogue(cur.fail)
                 else:
                     break
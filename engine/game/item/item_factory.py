@@ -1,22 +1,22 @@
-import random
 import xml.etree.ElementTree as tree
 import copy
 import math
 
-from engine.serialization.serialization import deserialize
+from engine.serialization.registry import lazy
 from engine.game.item.item import Item
+from engine.game.random_streams import stream, LOOT
 
-RARE_ATTRIBUTES = deserialize("data/item/attributes/rare_attributes.p")
-LEGENDARY_ATTRIBUTES = deserialize("data/item/attributes/legendary_attributes.p")
-UNIQUE_ATTRIBUTES = deserialize("data/item/attributes/unique_attributes.p")
-BASE_ITEMS = deserialize("data/item/base_items.p")
-ITEMS = deserialize("data/item/items.p")
+RARE_ATTRIBUTES = lazy("data/item/attributes/rare_attributes.p")
+LEGENDARY_ATTRIBUTES = lazy("data/item/attributes/legendary_attributes.p")
+UNIQUE_ATTRIBUTES = lazy("data/item/attributes/unique_attributes.p")
+BASE_ITEMS = lazy("data/item/base_items.p")
+ITEMS = lazy("data/item/items.p")
 
 class ItemFactory(object):
     """Item factory contains methods that generate items.
     Generation can be done randomly, or statically"""
 
-    ITEM_SETS = deserialize("data/item/item_sets.p")
+    ITEM_SETS = lazy("data/item/item_sets.p")
 
     DEFAULT_RARITY = {
         "common": 50,
@@ -35,12 +35,13 @@ class ItemFactory(object):
                 valid_items.extend(cls.ITEM_SETS[monster.name])
         if floor in cls.ITEM_SETS:
             valid_items.extend(cls.ITEM_SETS[floor])
-        item_name = random.choice(valid_items)
+        rng = stream(LOOT)
+        item_name = rng.choice(valid_items)
         item = copy.deepcopy(ITEMS[item_name])
         if item.itype == "extra": # extra items must be rare or better
-            roll = random.randint(51, 100)
+            roll = rng.randint(51, 100)
         else:
-            roll = random.randint(0, 100)
+            roll = rng.randint(0, 100)
 
         # Rolls confirmed
         if roll <= cls.DEFAULT_RARITY["common"]:
@@ -51,7 +52,7 @@ class ItemFactory(object):
             item.stat = {key : math.ceil(value*1.1) \
                 for key, value in item.stats.items()}
             item.rarity = "rare"
-            desc, attribute = copy.deepcopy(random.choice(
+            desc, attribute = copy.deepcopy(rng.choice(
                 list(RARE_ATTRIBUTES.items())))
             # Rename
             item.attributes.append(attribute)
@@ -63,10 +64,10 @@ class ItemFactory(object):
             item.stat = {key : math.ceil(value*1.2) \
                 for key, value in item.stats.items()}
             item.rarity = "legendary"
-            _, attribute = copy.deepcopy(random.choice( # ignore the first attr
+            _, attribute = copy.deepcopy(rng.choice( # ignore the first attr
                 list(RARE_ATTRIBUTES.items())))
             item.attributes.append(attribute)
-            desc, attribute = copy.deepcopy(random.choice(
+            desc, attribute = copy.deepcopy(rng.choice(
                 list(LEGENDARY_ATTRIBUTES.items())))
             item.attributes.append(attribute)
             item.name = "%s %s" % (desc, item.name)
@@ -1,4 +1,3 @@
-import random
 import xml.etree.ElementTree as tree
 import copy
 import os
@@ -7,9 +6,10 @@ from pygame import image, Surface, SRCALPHA, BLEND_RGBA_MULT
 from pygame.transform import scale
 
 import engine.game.character.character as character
-from engine.serialization.serialization import deserialize
+from engine.serialization.registry import lazy
+from engine.game.random_streams import stream, COMBAT
 
-MOVES = deserialize("data/moves.p")
+MOVES = lazy("data/moves.p")
 
 def parse_monsters(filename):
     """Takes a filename and returns a dict of dicts containing all monster
@@ -45,7 +45,7 @@ class Monster(character.Character):
     is responsible for holding a Monster's stats as well as generating
     itself."""
 
-    MONSTERS = deserialize("data/monster.p")
+    MONSTERS = lazy("data/monster.p")
 
     def __init__(self, name):
         """Basic Monster constructor"""
@@ -58,6 +58,7 @@ class Monster(character.Character):
         self.graphic = monster_def["graphic"].copy()
         self.rating = monster_def["rating"]
         self.stats.update(monster_def["stats"])
+        self.invalidate_stats()
         self.current_health = self.stats["health"]
 
         # add moves
@@ -76,7 +77,8 @@ class Monster(character.Character):
         super().handle_battle(delta, game, system)
         if self.ready:
             if self.active_moves:
-                self.selected_move = random.choice(self.active_moves)
+                self.selected_move = stream(COMBAT).choice(
+                    self.active_moves)
 
 
 # For testing
@@ -1,7 +1,7 @@
 """Compilation of the moves built to be used in the game"""
 
 from engine.game.move.move import Move
-from engine.serialization.serialization import deserialize
+from engine.serialization.registry import lazy
 
 __all__ = ["MOVES"]
 
@@ -22,4 +22,4 @@ SKILL_TREE['cleave'] = []
 SKILL_TREE['backstab'] = []
 SKILL_TREE['double stab'] = []
 
-MOVES = deserialize("data/moves.p")
\ No newline at end of file
+MOVES = lazy("data/moves.p")
\ No newline at end of file
@@ -1,4 +1,4 @@
-import random
+from engine.game.random_streams import stream, COMBAT
 
 class Move(object):
     """Contains a character's move's definition and how it interacts
@@ -78,7 +78,7 @@ class Move(object):
                 caster, players, monsters)
             crit_bound = component.get_crit(crit_bound, selected,
                 caster, players, monsters)
-        roll = random.randint(0, 99)
+        roll = stream(COMBAT).randint(0, 99)
         if roll < miss_bound:
             move = self.miss_components
         elif miss_bound <= roll < crit_bound:
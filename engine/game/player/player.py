@@ -1,9 +1,25 @@
 from collections import OrderedDict
 from engine.game.move.built_moves import SKILL_TREE, MOVES
-from random import choice, sample
+from engine.game.random_streams import stream, LOOT, MAP
 
 import engine.game.character.character as character
 
+class Equipment(OrderedDict):
+    """The equipment slots of a player. Putting an item into a slot clears
+    the player's cached stats, whoever changes it."""
+
+    def __init__(self, owner=None):
+        super().__init__()
+        self.owner = owner
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        # Not set yet while being unpickled
+        owner = getattr(self, "owner", None)
+        if owner is not None:
+            owner.invalidate_stats()
+
+
 class Player(character.Character):
     """The friendly characters encountered in.out of battle. The Player object
     is responsible for holding a Players's stats as well as handling equipment,
@@ -26,9 +42,10 @@ class Player(character.Character):
         self.experience = 0
         self.level = 1
         self.race = race
-        self.gender = choice(["male", "female"])
+        rng = stream(MAP)
+        self.gender = rng.choice(["male", "female"])
         self.castbar = [None for i in range(10)]
-        self.equipment = OrderedDict()
+        self.equipment = Equipment(self)
         self.equipment["hand1"] = None
         self.equipment["hand2"] = None
         self.equipment["body"] = None
@@ -39,9 +56,9 @@ class Player(character.Character):
         self.equipment["extra2"] = None
         self.level_up_moves = None
         if self.gender == "male":
-            self.portrait = choice(Player.MALE_PORTRAITS)
+            self.portrait = rng.choice(Player.MALE_PORTRAITS)
         else:
-            self.portrait = choice(Player.FEMALE_PORTRAITS)
+            self.portrait = rng.choice(Player.FEMALE_PORTRAITS)
 
     def equip(self, item, slot):
         """Try to equip item into the slot"""
@@ -55,9 +72,9 @@ class Player(character.Character):
     def set_castbar(self, move, index):
         self.castbar[index] = move
 
-    def get_stat(self, stat_type):
-        """Can be only used for health, attack, defense, speed,
-        resist, magic takes into account"""
+    def calculate_stat(self, stat_type):
+        """Calculates the stat taking into account equipment and
+        effects"""
         stat = self.stats[stat_type]
         for item in self.equipment.values():
             if item:
@@ -99,10 +116,13 @@ class Player(character.Character):
         for name in current_moves:
             available_moves = available_moves.union(set(SKILL_TREE[name]))
         available_moves.difference_update(current_moves)
+        # Sorted since set order changes between runs
+        available_moves = sorted(available_moves)
         if len(available_moves) >= 3:
-            move_names = sample(available_moves, 3)
+            move_names = stream(LOOT).sample(available_moves, 3)
         else:
-            move_names = sample(available_moves, len(available_moves))
+            move_names = stream(LOOT).sample(available_moves,
+                len(available_moves))
         self.level_up_moves = [MOVES[name] for name in move_names]
 
     def can_level_up(self, shards):
@@ -128,6 +148,7 @@ class Player(character.Character):
         # Increase base stats of character
         for stype, value in increase_stats.items():
             self.stats[stype] += value
+        self.invalidate_stats()
 
         # Add move to the player
         self.add_move(move)
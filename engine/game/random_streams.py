@@ -0,0 +1,40 @@
+"""Defines the RandomStreams used to make runs reproducible"""
+import random
+import sys
+
+COMBAT = "combat" # damage, healing, move rolls and targeting
+LOOT = "loot" # items, shards and level up moves
+MAP = "map" # dungeon layout, events, encounters and the party
+
+class RandomStreams(object):
+    """Holds one random.Random per stream all derived from a single seed.
+    Each stream is seeded separately so drawing more numbers from one
+    stream never changes what another stream produces."""
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.randrange(sys.maxsize)
+        self.seed = seed
+        self.streams = {}
+
+    def get(self, name):
+        """Returns the stream with the given name, creating it if needed"""
+        if name not in self.streams:
+            self.streams[name] = random.Random("%s:%s" % (self.seed, name))
+        return self.streams[name]
+
+
+# Streams used by the game, replaced at the start of every run
+_streams = RandomStreams()
+
+def set_streams(streams):
+    """Makes the given RandomStreams the ones used by the game"""
+    global _streams
+    _streams = streams
+
+def get_streams():
+    return _streams
+
+def stream(name):
+    """Returns the random.Random of the current run for the stream"""
+    return _streams.get(name)
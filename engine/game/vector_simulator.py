@@ -0,0 +1,293 @@
+"""Implements the VectorBattleSimulator used to run many battles at once"""
+import numpy
+
+from engine.game.battle_simulator import BattleSimulator, BattleResult, \
+    HeadlessGame, choose_move
+from engine.game.character.character import Character
+from engine.game.effect.effect import Effect
+from engine.game.random_streams import stream, COMBAT
+from assets.effects.DoT import DoT
+
+class BattleArrays(object):
+    """Structure of arrays holding the battle state of many encounters.
+    There is one row per combatant and one column per effect slot. Rows of
+    the same encounter are contiguous, players first.
+
+    The character objects stay the source of truth for anything the arrays
+    do not hold. store writes a row back into its character and load reads
+    it again after the character was changed outside of the arrays."""
+
+    def __init__(self, encounters, slots):
+        self.characters = []
+        self.encounters = [] # (players, monsters) per encounter
+        self.bounds = [] # (start, stop) rows per encounter
+        encounter = []
+        side = []
+        for index, (players, monsters) in enumerate(encounters):
+            players = list(players)
+            monsters = list(monsters)
+            start = len(self.characters)
+            self.characters.extend(players + monsters)
+            self.encounters.append((players, monsters))
+            self.bounds.append((start, len(self.characters)))
+            encounter.extend([index] * (len(players) + len(monsters)))
+            side.extend([0] * len(players) + [1] * len(monsters))
+
+        rows = len(self.characters)
+        self.encounter = numpy.array(encounter, dtype=int)
+        self.side = numpy.array(side, dtype=int)
+        self.action = numpy.zeros(rows)
+        self.max_action = numpy.zeros(rows)
+        self.rate = numpy.zeros(rows)
+        self.health = numpy.zeros(rows)
+        self.defense = numpy.zeros(rows)
+        self.overflow = numpy.zeros(rows)
+        self.fallen = numpy.zeros(rows, dtype=bool)
+        self.damage = numpy.zeros(rows)
+        self.allocate(rows, slots)
+        for row in range(rows):
+            self.load(row)
+
+    def allocate(self, rows, slots):
+        """Creates empty effect columns"""
+        self.used = numpy.zeros((rows, slots), dtype=bool)
+        self.permanent = numpy.zeros((rows, slots), dtype=bool)
+        self.duration = numpy.zeros((rows, slots))
+        self.tick = numpy.zeros((rows, slots))
+        self.cur_tick = numpy.zeros((rows, slots))
+        self.dot = numpy.zeros((rows, slots)) # vectorized damage per tick
+        self.python_tick = numpy.zeros((rows, slots), dtype=bool)
+        self.effects = numpy.empty((rows, slots), dtype=object)
+
+    def grow(self, slots):
+        """Adds effect columns keeping the current effects"""
+        old = (self.used, self.permanent, self.duration, self.tick,
+            self.cur_tick, self.dot, self.python_tick, self.effects)
+        rows, old_slots = self.used.shape
+        self.allocate(rows, slots)
+        new = (self.used, self.permanent, self.duration, self.tick,
+            self.cur_tick, self.dot, self.python_tick, self.effects)
+        for old_array, new_array in zip(old, new):
+            new_array[:, :old_slots] = old_array
+
+    def load(self, row):
+        """Reads the row from its character. Finished effects are pruned
+        from the character first, the same way decrease_durations does."""
+        character = self.characters[row]
+        character.effects = [effect for effect in character.effects
+            if effect.active and (effect.duration == Effect.PERMANENT or
+            effect.duration > 0)]
+        self.action[row] = character.action
+        self.max_action[row] = character.get_stat("action")
+        self.health[row] = character.current_health
+        self.defense[row] = character.get_stat("defense")
+        self.overflow[row] = character.overflow
+        self.fallen[row] = character.fallen
+        rate = character.get_action_rate()
+        for effect in character.effects:
+            rate = effect.on_build_action(rate)
+        self.rate[row] = rate
+
+        if len(character.effects) > self.used.shape[1]:
+            self.grow(max(len(character.effects), self.used.shape[1] * 2))
+        # Damage over time is only vectorized if nothing hooks the damage
+        hooked = any(type(effect).on_damage is not Effect.on_damage or
+            type(effect).on_deal_damage is not Effect.on_deal_damage
+            for effect in character.effects)
+        self.used[row] = False
+        self.dot[row] = 0
+        self.python_tick[row] = False
+        for slot, effect in enumerate(character.effects):
+            self.used[row, slot] = True
+            self.effects[row, slot] = effect
+            self.permanent[row, slot] = effect.duration == Effect.PERMANENT
+            if not self.permanent[row, slot]:
+                self.duration[row, slot] = effect.duration
+            self.tick[row, slot] = effect.tick or 0
+            self.cur_tick[row, slot] = effect.cur_tick
+            if effect.tick:
+                if type(effect) is DoT and effect.dtype and not hooked:
+                    self.dot[row, slot] = effect.value
+                else:
+                    self.python_tick[row, slot] = True
+        self.effects[row, len(character.effects):] = None
+
+    def store(self, row):
+        """Writes the row back into its character"""
+        character = self.characters[row]
+        character.action = float(self.action[row])
+        character.current_health = int(self.health[row])
+        character.overflow = float(self.overflow[row])
+        for slot, effect in enumerate(character.effects):
+            if effect.duration != Effect.PERMANENT:
+                effect.duration = float(self.duration[row, slot])
+                effect.cur_tick = float(self.cur_tick[row, slot])
+
+    def signature(self, row):
+        """Returns a snapshot of the parts of a character that a cast can
+        change, used to tell which rows need to be loaded again"""
+        character = self.characters[row]
+        return (character.current_health, character.fallen,
+            [(effect, effect.duration, effect.active)
+             for effect in character.effects])
+
+    def rows(self, encounter):
+        """Returns the rows of the encounter"""
+        return range(*self.bounds[encounter])
+
+
+class VectorBattleSimulator(object):
+    """Runs many encounters side by side using BattleArrays. Action build
+    up, effect durations and damage over time advance for every combatant
+    in one vectorized step. Characters fall back to their Move, Component
+    and Effect objects only when they are ready to cast, are dying, or have
+    a ticking effect that can not be vectorized. It has no scheduled mode,
+    which BattleSimulator provides for single battles."""
+
+    EFFECT_SLOTS = 4 # effect columns to start with, grown when needed
+
+    def __init__(self, timestep=BattleSimulator.TIMESTEP,
+            max_duration=BattleSimulator.MAX_DURATION, seed=None):
+        """seed is used for vectorized rolls. If none is given it is drawn
+        from the combat stream."""
+        self.timestep = timestep
+        self.max_duration = max_duration
+        self.system = HeadlessGame()
+        if seed is None:
+            seed = stream(COMBAT).getrandbits(64)
+        self.rng = numpy.random.default_rng(seed)
+
+    def run(self, players, monsters):
+        """Simulate a single battle. See run_all"""
+        return self.run_all([(players, monsters)])[0]
+
+    def run_all(self, encounters):
+        """Simulates every (players, monsters) encounter and returns a list
+        of BattleResults in the same order"""
+        arrays = BattleArrays(encounters, self.EFFECT_SLOTS)
+        count = len(arrays.encounters)
+        running = numpy.ones(count, dtype=bool)
+        winners = [None] * count
+        durations = numpy.full(count, float(self.max_duration))
+        moves = [{"players": {}, "monsters": {}} for i in range(count)]
+
+        time = 0
+        while running.any() and time < self.max_duration:
+            live = running[arrays.encounter] & ~arrays.fallen
+            self.advance(arrays, live)
+            self.resolve(arrays, live, moves)
+            time += self.timestep
+
+            alive = numpy.bincount(arrays.encounter * 2 + arrays.side,
+                weights=(~arrays.fallen).astype(float), minlength=count * 2)
+            players_won = running & (alive[1::2] == 0)
+            monsters_won = running & (alive[0::2] == 0) & ~players_won
+            for index in numpy.flatnonzero(players_won):
+                winners[index] = "players"
+            for index in numpy.flatnonzero(monsters_won):
+                winners[index] = "monsters"
+            durations[players_won | monsters_won] = time
+            running &= ~(players_won | monsters_won)
+
+        for index in range(count):
+            for row in arrays.rows(index):
+                arrays.store(row)
+        return [BattleResult(winners[index], float(durations[index]),
+            [(arrays.characters[row].name, int(arrays.damage[row]))
+             for row in arrays.rows(index)], moves[index])
+            for index in range(count)]
+
+    def advance(self, arrays, live):
+        """Advances every live row by the timestep"""
+        # Effect durations go down a second at a time
+        arrays.overflow[live] += self.timestep
+        steps = numpy.floor(arrays.overflow) * live
+        arrays.overflow -= steps
+        timed = arrays.used & ~arrays.permanent & (steps[:, None] > 0)
+        arrays.duration -= numpy.where(timed, steps[:, None], 0)
+
+        ticking = timed & (arrays.tick > 0) & \
+            (arrays.duration <= arrays.cur_tick)
+        arrays.cur_tick -= numpy.where(ticking, arrays.tick, 0)
+        rows, slots = numpy.nonzero(ticking & (arrays.dot > 0))
+        if len(rows):
+            # Same formula as Character.deal_damage
+            variation = self.rng.integers(100 - Character.DAMAGE_VARIATION,
+                100 + Character.DAMAGE_VARIATION + 1, len(rows)) / 100
+            damage = numpy.trunc(arrays.dot[rows, slots] -
+                arrays.defense[rows] * variation)
+            numpy.subtract.at(arrays.health, rows, numpy.maximum(damage, 1))
+        for row, slot in zip(*numpy.nonzero(ticking & arrays.python_tick)):
+            arrays.store(row)
+            arrays.effects[row, slot].on_tick()
+            arrays.load(row)
+
+        for row in numpy.flatnonzero((timed & (arrays.duration <= 0)).any(1)):
+            arrays.store(row)
+            arrays.characters[row].invalidate_stats()
+            arrays.load(row)
+
+        arrays.action[live] += arrays.rate[live] * self.timestep
+        numpy.clip(arrays.action, 0, arrays.max_action, out=arrays.action)
+
+    def resolve(self, arrays, live, moves):
+        """Falls back to the character objects for dying and ready rows"""
+        for row in numpy.flatnonzero(live & (arrays.health <= 0)):
+            arrays.store(row)
+            character = arrays.characters[row]
+            if not character.kill():
+                character.current_health = 1
+            arrays.load(row)
+
+        ready = live & ~arrays.fallen & (arrays.action >= arrays.max_action)
+        for row in numpy.flatnonzero(ready):
+            # Earlier casts this step may have killed the character
+            if not arrays.fallen[row] and arrays.health[row] > 0:
+                self.cast(arrays, row, moves[arrays.encounter[row]])
+
+    def cast(self, arrays, row, moves):
+        """Lets the character of the row select and cast a move"""
+        index = arrays.encounter[row]
+        players, monsters = arrays.encounters[index]
+        signatures = {}
+        for other in arrays.rows(index):
+            arrays.store(other)
+            signatures[other] = arrays.signature(other)
+
+        character = arrays.characters[row]
+        if not character.ready:
+            character.start_turn()
+        if arrays.side[row] == 0:
+            opponents = monsters
+            if not character.selected_move:
+                choose_move(character, players, monsters)
+        else:
+            opponents = players
+            active_moves = getattr(character, "active_moves",
+                character.moves)
+            if active_moves:
+                character.selected_move = stream(COMBAT).choice(
+                    active_moves)
+
+        move = character.selected_move
+        if move and move.is_valid_cast(character.target, players, monsters):
+            for effect in character.effects:
+                if effect.active:
+                    effect.on_cast(character, move)
+            before = sum(c.current_health for c in opponents)
+            move.cast(character.target, character, players, monsters,
+                self.system)
+            dealt = max(before - sum(c.current_health for c in opponents), 0)
+            arrays.damage[row] += dealt
+            if dealt:
+                side = moves["players" if arrays.side[row] == 0 else
+                    "monsters"]
+                side[move.name] = side.get(move.name, 0) + dealt
+            character.action = 0
+            character.ready = False
+            character.selected_move = None
+            character.target = []
+
+        for other in arrays.rows(index):
+            if other == row or arrays.signature(other) != signatures[other]:
+                arrays.load(other)
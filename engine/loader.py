@@ -0,0 +1,130 @@
+"""Implements the AssetLoader that decodes images and sounds in the
+background
+
+Files are decoded on a worker thread and handed over to the main thread
+by finalize, which the UISystem calls every frame. Images are converted
+for the display there, which has to happen on the main thread. Asking for
+an asset that is still being decoded waits for it, and one that was never
+requested is loaded on the spot."""
+from queue import Queue, Empty
+import threading
+import logging
+import time
+
+import pygame
+from pygame import mixer
+
+from engine import content
+
+IMAGE = "image"
+SOUND = "sound"
+
+class AssetLoader(object):
+    """Loads assets requested as (IMAGE, filename, scale) or
+    (SOUND, filename) keys"""
+
+    FINALIZE_BUDGET = 0.004 # seconds finalize may spend per frame
+
+    def __init__(self):
+        self.requests = Queue()
+        self.done = Queue()
+        self.pending = set() # keys requested and not finalized yet
+        self.assets = {} # finalized assets waiting to be taken
+        self.thread = None
+        self.counts = {"requested": 0, "prefetched": 0, "waited": 0,
+            "synchronous": 0, "failed": 0}
+
+    def request(self, key):
+        """Queues the asset to be decoded unless it is already. Callers
+        keeping the assets they took check their own caches first."""
+        if key in self.pending or key in self.assets:
+            return
+        self.pending.add(key)
+        self.counts["requested"] += 1
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.work,
+                name="asset-loader", daemon=True)
+            self.thread.start()
+        self.requests.put(key)
+
+    def __contains__(self, key):
+        """Returns if the asset is being decoded or waiting to be taken"""
+        return key in self.pending or key in self.assets
+
+    def ready(self, keys):
+        """Returns if none of the keys are still being decoded"""
+        return not any(key in self.pending for key in keys)
+
+    def work(self):
+        while True:
+            key = self.requests.get()
+            try:
+                self.done.put((key, self.decode(key), None))
+            except Exception as error:
+                self.done.put((key, None, error))
+
+    @staticmethod
+    def decode(key):
+        """Decodes the asset. Safe to call off the main thread"""
+        if key[0] == SOUND:
+            return mixer.Sound(file=content.source(key[1]))
+        image = pygame.image.load(content.source(key[1]), key[1])
+        scale = key[2]
+        if scale != 1:
+            image = pygame.transform.scale(image,
+                (image.get_width() * scale, image.get_height() * scale))
+        return image
+
+    def finalize(self, budget=FINALIZE_BUDGET):
+        """Hands the decoded assets over to the main thread, for up to
+        budget seconds. None finalizes all of them"""
+        start = time.perf_counter()
+        while budget is None or time.perf_counter() - start < budget:
+            try:
+                self.finish(*self.done.get_nowait())
+            except Empty:
+                return
+
+    def finish(self, key, asset, error):
+        self.pending.discard(key)
+        if error is not None:
+            # Left to fail again where the asset is used
+            self.counts["failed"] += 1
+            logging.warning("Could not prefetch %s: %s" % (key[1], error))
+            return
+        if key[0] == IMAGE:
+            asset = asset.convert_alpha()
+        self.assets[key] = asset
+        self.counts["prefetched"] += 1
+
+    def take(self, key):
+        """Returns the asset, waiting for it if it is being decoded and
+        loading it if it was never requested. The loader lets go of it, so
+        callers keep their own reference."""
+        if key in self.pending:
+            self.counts["waited"] += 1
+            while key in self.pending:
+                self.finish(*self.done.get())
+        asset = self.assets.pop(key, None)
+        if asset is None:
+            self.counts["synchronous"] += 1
+            asset = self.decode(key)
+            if key[0] == IMAGE:
+                asset = asset.convert_alpha()
+        return asset
+
+    def image(self, filename, scale=1):
+        return self.take((IMAGE, filename, scale))
+
+    def sound(self, filename):
+        return self.take((SOUND, filename))
+
+    def stats(self):
+        """Returns how the assets were loaded so far"""
+        stats = dict(self.counts)
+        stats["pending"] = len(self.pending)
+        return stats
+
+
+# Loader shared by the systems
+loader = AssetLoader()
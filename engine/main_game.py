@@ -1,17 +1,42 @@
 """Defines the Game object"""
 from collections import OrderedDict
+import os
 
 import pygame
 
 from engine.game.game_object import GameObject
+from engine.profiling import startup
+from engine.profiling.frame import FrameProfiler
 
 class Game(object):
 
-    def __init__(self):
+    FRAME_RATE = 60 # most frames drawn per second
+    MAX_TICKS = 5 # most simulation ticks run per frame before slowing down
+
+    def __init__(self, seed=None, dirty_rects=False, tick_rate=None):
+        """With dirty_rects only the regions of the display that changed
+        are redrawn and presented each frame.
+
+        With a tick_rate the simulated systems are updated that many times
+        a second with the same delta, however fast frames are drawn; the
+        other systems, and every system's update_frame, run once per frame.
+        alpha tells them how far the frame is between the last tick and the
+        next one. Without it every system is updated once per frame."""
         super().__init__()
         self.systems = OrderedDict()
         self.running = True
         self.prevtime = 0
+        self.tick = None if tick_rate is None else 1000 / tick_rate
+        self.accumulator = 0 # milliseconds not simulated yet
+        self.ticks = 0
+        self.alpha = 1
+        self.seed = seed # seeds the game object's random streams
+        # FRAME_PROFILE names a .csv or .json file frame times are dumped to
+        self.profiler = FrameProfiler(os.environ.get("FRAME_PROFILE"))
+        self.dirty_rects = dirty_rects
+        self.regions = [] # regions to present this frame
+        self.overlays = [] # regions drawn over the ui this frame
+        self.last_overlays = []
 
     def add_system(self, system):
         self.systems[system.name] = system
@@ -20,33 +45,92 @@ class Game(object):
         """Run the game"""
 
         # Initiate pygame, screen, game object, clock
-        pygame.mixer.pre_init(44100, -16, 2, 2048)
-        pygame.mixer.init()
-        pygame.init()
-        screen = pygame.display.set_mode((1280, 720))
-        game = GameObject()
+        with startup.phase("pygame", "init"):
+            pygame.mixer.pre_init(44100, -16, 2, 2048)
+            pygame.mixer.init()
+            pygame.init()
+            screen = pygame.display.set_mode((1280, 720))
+        game = GameObject(self.seed)
         clock = pygame.time.Clock()
         for system in self.systems:
-            self.systems[system].init(game)
+            with startup.phase(system, "system"):
+                self.systems[system].init(game)
+        startup.finish()
 
         # Game loop
+        self.prevtime = pygame.time.get_ticks()
         while self.running:
+            self.profiler.start_frame()
             delta = pygame.time.get_ticks() - self.prevtime
             self.prevtime = pygame.time.get_ticks()
-            for system in self.systems:
-                self.systems[system].update(delta, game)
-            pygame.display.flip()
-            clock.tick(60)
+            self.update(delta, game)
+            overlay = self.profiler.render(screen)
+            if overlay is not None:
+                self.mark_dirty(overlay)
+            if self.dirty_rects:
+                pygame.display.update(self.regions)
+                self.last_overlays = self.overlays
+                self.regions = []
+                self.overlays = []
+            else:
+                pygame.display.flip()
+            self.profiler.end_frame()
+            clock.tick(self.FRAME_RATE)
 
         for system in self.systems:
             self.systems[system].quit(game)
+        if self.profiler.dump:
+            self.profiler.write(self.profiler.dump)
         pygame.quit()
 
+    def update(self, delta, game):
+        """Updates the systems for a frame delta milliseconds long"""
+        with self.profiler.measure("systems", "input"):
+            for system in self.systems:
+                self.systems[system].update_frame(delta, game)
+        if self.tick is None:
+            for system in self.systems:
+                with self.profiler.measure("systems", system):
+                    self.systems[system].update(delta, game)
+            return
+
+        # Time past MAX_TICKS is dropped so a slow frame does not leave
+        # more ticks to catch up on the next one
+        self.accumulator = min(self.accumulator + delta,
+            self.tick * self.MAX_TICKS)
+        while self.accumulator >= self.tick and self.running:
+            self.accumulator -= self.tick
+            self.ticks += 1
+            for system in self.systems:
+                if self.systems[system].simulated:
+                    with self.profiler.measure("systems", system):
+                        self.systems[system].update(self.tick, game)
+        self.alpha = self.accumulator / self.tick
+        for system in self.systems:
+            if not self.systems[system].simulated:
+                with self.profiler.measure("systems", system):
+                    self.systems[system].update(delta, game)
+
     def message(self, system, message):
         """Sends a message to another system by name. Takes a system name
         as a string and the message object to pass."""
+        self.profiler.count_message(system)
         self.systems[system].message(message)
 
+    def present(self, rects):
+        """Presents the rects of the display at the end of the frame when
+        drawing dirty rects"""
+        self.regions.extend(rects)
+
+    def mark_dirty(self, rect=None):
+        """Called by systems that draw over the ui. The rect is presented
+        this frame and redrawn by the ui on the next one. None marks the
+        whole display."""
+        if rect is None:
+            rect = pygame.display.get_surface().get_rect()
+        self.overlays.append(pygame.Rect(rect))
+        self.regions.append(pygame.Rect(rect))
+
     def quit(self):
         """Tells the system to quit on the next game loop"""
         self.running = False
\ No newline at end of file
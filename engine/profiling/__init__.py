@@ -0,0 +1 @@
+"""Tools to measure where the game spends its time"""
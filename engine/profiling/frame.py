@@ -0,0 +1,137 @@
+"""Implements the FrameProfiler used to attribute frame time to systems"""
+from collections import deque
+from contextlib import contextmanager
+import json
+import time
+import csv
+import os
+
+import pygame
+
+from engine.ui.draw.font import get_font, font_stats
+
+class FrameProfiler(object):
+    """Keeps a rolling window of frame records. Each record holds the
+    milliseconds spent in every system update and Manager.render, and the
+    number of messages sent to every system during the frame.
+
+    If a dump file is given the window is written to it every
+    DUMP_INTERVAL frames, as CSV or JSON depending on the extension. The
+    overlay shows the window's averages on top of the game."""
+
+    WINDOW = 300 # frames kept
+    DUMP_INTERVAL = 300 # frames between dumps
+    OVERLAY_LINES = 12 # slowest entries shown on the overlay
+
+    def __init__(self, dump=None, window=WINDOW):
+        self.dump = dump
+        self.frames = deque(maxlen=window)
+        self.count = 0
+        self.overlay = False
+        self.font = None
+        self.start_frame()
+
+    def start_frame(self):
+        """Starts a new frame record"""
+        self.current = {"frame": self.count, "time": 0, "systems": {},
+            "managers": {}, "messages": {}}
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def measure(self, group, name):
+        """Adds the milliseconds spent in the with block to the entry of
+        the current frame. group is either "systems" or "managers"."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entries = self.current[group]
+            entries[name] = entries.get(name, 0) + \
+                (time.perf_counter() - start) * 1000
+
+    def count_message(self, system):
+        messages = self.current["messages"]
+        messages[system] = messages.get(system, 0) + 1
+
+    def end_frame(self):
+        """Closes the current frame record"""
+        self.current["time"] = (time.perf_counter() - self.started) * 1000
+        self.frames.append(self.current)
+        self.count += 1
+        if self.dump and self.count % self.DUMP_INTERVAL == 0:
+            self.write(self.dump)
+
+    def averages(self, group):
+        """Returns the average value of each entry of the group over the
+        window"""
+        totals = {}
+        for frame in self.frames:
+            for name, value in frame[group].items():
+                totals[name] = totals.get(name, 0) + value
+        return {name: total / len(self.frames)
+            for name, total in totals.items()}
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+
+    def columns(self):
+        """Returns the CSV columns needed for the frames in the window"""
+        names = {"systems": set(), "managers": set(), "messages": set()}
+        for frame in self.frames:
+            for group in names:
+                names[group].update(frame[group])
+        return ["frame", "time"] + ["%s:%s" % (group, name)
+            for group in ("systems", "managers", "messages")
+            for name in sorted(names[group])]
+
+    def write(self, filename):
+        """Writes the window to a CSV or JSON file"""
+        if os.path.splitext(filename)[1] == ".json":
+            with open(filename, "w") as file:
+                json.dump(list(self.frames), file)
+            return
+
+        columns = self.columns()
+        with open(filename, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            for frame in self.frames:
+                row = [frame["frame"], frame["time"]]
+                for column in columns[2:]:
+                    group, name = column.split(":", 1)
+                    row.append(frame[group].get(name, 0))
+                writer.writerow(row)
+
+    def render(self, surface):
+        """Draws the overlay if it is toggled on. Returns the rect drawn
+        on, None if nothing was drawn."""
+        if not self.overlay or not self.frames:
+            return None
+        if self.font is None:
+            self.font = get_font(20)
+
+        frame_time = sum(frame["time"] for frame in self.frames) / \
+            len(self.frames)
+        lines = ["frame %.2fms" % frame_time]
+        entries = [("%s %.2fms" % (name, value), value)
+            for group in ("systems", "managers")
+            for name, value in self.averages(group).items()]
+        entries.sort(key=lambda entry: -entry[1])
+        lines.extend(text for text, value in
+            entries[:self.OVERLAY_LINES])
+        messages = self.averages("messages")
+        lines.append("messages " + ", ".join("%s %.1f" % (name, count)
+            for name, count in sorted(messages.items())))
+        fonts = font_stats()
+        lines.append("fonts %d (%dKB of files)" % (fonts["fonts"],
+            fonts["file_bytes"] // 1024))
+
+        height = self.font.get_linesize()
+        background = pygame.Surface((360, height * len(lines) + 8),
+            pygame.SRCALPHA)
+        background.fill((0, 0, 0, 180))
+        rect = surface.blit(background, (surface.get_width() - 364, 4))
+        for i, line in enumerate(lines):
+            surface.blit(self.font.render(line, False, (255, 255, 255)),
+                (surface.get_width() - 360, 8 + i * height))
+        return rect
@@ -0,0 +1,211 @@
+"""Implements the StartupProfiler used to measure game and editor startup
+
+Profiling is turned on with environment variables read by
+start_from_environment, which the entry points call before their imports:
+
+    STARTUP_PROFILE  file the JSON report is written to
+    STARTUP_BUDGET   JSON file of budgets in milliseconds, keyed by phase
+                     name or category. Startup fails when one is exceeded.
+    STARTUP_EXIT     quit as soon as startup is over, for automated runs
+"""
+from contextlib import contextmanager
+import importlib.machinery
+import functools
+import tracemalloc
+import json
+import time
+import sys
+import os
+
+class StartupProfiler(object):
+    """Records the wall time and memory of each startup phase. Phases can
+    be nested, a phase's seconds include its children while self_seconds
+    do not. Category totals add up self_seconds so nothing is counted
+    twice."""
+
+    def __init__(self, budgets=None):
+        """budgets maps phase names or categories to milliseconds"""
+        self.budgets = budgets or {}
+        self.phases = []
+        self.stack = [] # child seconds of each open phase
+        self.started = time.perf_counter()
+        self.finished = None
+        self.tracing = not tracemalloc.is_tracing()
+        if self.tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name, category):
+        """Records the time and memory spent in the with block"""
+        record = {"name": name, "category": category,
+            "depth": len(self.stack)}
+        self.phases.append(record)
+        self.stack.append(0)
+        memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += seconds
+            record["seconds"] = seconds
+            record["self_seconds"] = seconds - children
+            record["memory"] = tracemalloc.get_traced_memory()[0] - memory
+
+    def finish(self):
+        """Marks the end of startup"""
+        self.finished = time.perf_counter()
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        if self.tracing:
+            tracemalloc.stop()
+
+    def categories(self):
+        """Returns the total self seconds of each category"""
+        totals = {}
+        for record in self.phases:
+            totals[record["category"]] = totals.get(record["category"], 0) \
+                + record.get("self_seconds", 0)
+        return totals
+
+    def violations(self):
+        """Returns a list of (key, milliseconds, budget) for every phase
+        name or category that went over its budget"""
+        measured = {key: seconds * 1000
+            for key, seconds in self.categories().items()}
+        for record in self.phases:
+            measured[record["name"]] = max(measured.get(record["name"], 0),
+                record.get("seconds", 0) * 1000)
+        measured["total"] = ((self.finished or time.perf_counter()) -
+            self.started) * 1000
+        return [(key, measured[key], budget)
+            for key, budget in sorted(self.budgets.items())
+            if measured.get(key, 0) > budget]
+
+    def report(self):
+        """Returns the machine readable report as a dictionary"""
+        finished = self.finished or time.perf_counter()
+        return {
+            "total_seconds": finished - self.started,
+            "peak_memory": getattr(self, "peak_memory", None),
+            "categories": self.categories(),
+            "phases": self.phases,
+            "violations": [{"key": key, "milliseconds": milliseconds,
+                "budget": budget}
+                for key, milliseconds, budget in self.violations()]
+        }
+
+    def write(self, filename):
+        with open(filename, "w") as file:
+            json.dump(self.report(), file, indent=2)
+
+
+class ImportTimer(object):
+    """Meta path finder that records a phase for every import of a module
+    in the game's packages. The auto-discovery packages in assets are
+    recorded as the discovery category."""
+
+    PACKAGES = ("engine", "assets", "editor", "data")
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.split(".")[0] not in self.PACKAGES:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return None
+
+        category = "import"
+        if fullname.startswith("assets.") and spec.submodule_search_locations:
+            category = "discovery"
+        exec_module = spec.loader.exec_module
+        def timed_exec_module(module):
+            with self.profiler.phase(fullname, category):
+                exec_module(module)
+        spec.loader.exec_module = timed_exec_module
+        return spec
+
+
+# Profiler of the current run, None when not profiling
+_profiler = None
+_import_timer = None
+_settings = {}
+
+def start(budgets=None):
+    """Starts profiling the startup. Returns the StartupProfiler"""
+    global _profiler, _import_timer
+    _profiler = StartupProfiler(budgets)
+    _import_timer = ImportTimer(_profiler)
+    sys.meta_path.insert(0, _import_timer)
+    return _profiler
+
+def start_from_environment():
+    """Starts profiling if STARTUP_PROFILE or STARTUP_BUDGET is set"""
+    report = os.environ.get("STARTUP_PROFILE")
+    budget = os.environ.get("STARTUP_BUDGET")
+    if not report and not budget:
+        return None
+    budgets = None
+    if budget:
+        with open(budget) as file:
+            budgets = json.load(file)
+    _settings["report"] = report
+    _settings["exit"] = bool(os.environ.get("STARTUP_EXIT"))
+    return start(budgets)
+
+def get_profiler():
+    return _profiler
+
+def phase(name, category):
+    """Records a phase if startup is being profiled"""
+    if _profiler is None:
+        return _nothing()
+    return _profiler.phase(name, category)
+
+@contextmanager
+def _nothing():
+    yield
+
+def profiled(category, name=None):
+    """Decorator recording each call of the function as a phase. name is a
+    function given the same arguments that returns the phase name"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return function(*args, **kwargs)
+            if name is None:
+                phase_name = function.__qualname__
+            else:
+                phase_name = name(*args, **kwargs)
+            with _profiler.phase(phase_name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def finish():
+    """Ends profiling at the end of startup. Writes the report, exits with
+    an error if a budget was exceeded and exits normally if STARTUP_EXIT
+    was set"""
+    global _profiler, _import_timer
+    if _profiler is None:
+        return
+    profiler = _profiler
+    profiler.finish()
+    sys.meta_path.remove(_import_timer)
+    _profiler = None
+    _import_timer = None
+
+    if _settings.get("report"):
+        profiler.write(_settings["report"])
+    violations = profiler.violations()
+    for key, milliseconds, budget in violations:
+        print("Startup budget exceeded: %s took %.1fms, budget %.1fms"
+            % (key, milliseconds, budget), file=sys.stderr)
+    if violations:
+        sys.exit(1)
+    if _settings.get("exit"):
+        sys.exit(0)
@@ -1,7 +1,9 @@
 """Defines the DataManager abstract class"""
+import threading
 import sys
 
-from engine.serialization.serialization import deserialize, serialize
+from engine.serialization.serialization import serialize
+from engine.serialization.store import get_store, load
 
 class DataManager(object):
     """In charge of making sure all objects loaded from pickle files
@@ -10,11 +12,25 @@ class DataManager(object):
 
     # Flyweights
     cache = {}
+    # Lock of each file held while it is loaded, so DataManagers and the
+    # background preload never load a file twice
+    locks = {}
+    locks_lock = threading.Lock()
 
     def __init__(self, filename):
-        if not self.cache.get(filename):
-            self.cache[filename] = deserialize(filename)
         self.filename = filename
+        self.load_cached(filename)
+
+    @classmethod
+    def load_cached(cls, filename):
+        """Returns the cached data of the file, loading it if it is not"""
+        with cls.locks_lock:
+            lock = cls.locks.setdefault(filename, threading.Lock())
+        with lock:
+            data = cls.cache.get(filename)
+            if data is None:
+                data = cls.cache[filename] = load(filename)
+            return data
 
     def __del__(self):
         """Deletes cached object if no more references"""
@@ -30,10 +46,21 @@ class DataManager(object):
         self.cache[self.filename] = value
 
     def write(self):
-        serialize(self.cache[self.filename], self.filename)
+        self.save(self.cache[self.filename], self.filename)
 
     @classmethod
     def writeall(self):
         """Saves all the cached functions at once."""
         for file in self.cache:
-            serialize(self.cache[file], file)
\ No newline at end of file
+            self.save(self.cache[file], file)
+
+    @staticmethod
+    def save(value, filename):
+        """Writes the value to its collection in the DataStore if the game
+        data was migrated, otherwise to the pickle file"""
+        store = get_store()
+        collection = store and store.collection(filename)
+        if collection is not None:
+            store.write(collection, value)
+        else:
+            serialize(value, filename)
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""Implements the LazyData registry used to load game data on demand"""
+from collections.abc import MutableMapping
+import threading
+
+from engine.serialization.dmanager import DataManager
+from engine.serialization.store import get_store
+
+class LazyData(MutableMapping):
+    """Dictionary of game data that is only read from its file on first
+    access. While the data is not fully loaded, single keys are read
+    straight from the DataStore when the game data was migrated to one.
+
+    Use lazy to get the shared LazyData of a file instead of creating one
+    so every module sees the same objects. The loaded dictionary is shared
+    with DataManager as well."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.data = None
+        self.records = {} # keys read on their own before a full load
+        self.lock = threading.RLock()
+
+    def loaded(self):
+        return self.data is not None
+
+    def get_data(self):
+        """Returns the whole dictionary, loading it if needed"""
+        with self.lock:
+            if self.data is None:
+                data = DataManager.load_cached(self.filename)
+                # Keep handing out the objects that were already read
+                data.update(self.records)
+                self.data = data
+                self.records = {}
+            return self.data
+
+    def preload(self):
+        self.get_data()
+
+    def __getitem__(self, key):
+        if self.data is not None:
+            return self.data[key]
+        with self.lock:
+            if self.data is None:
+                if key not in self.records:
+                    store = get_store()
+                    collection = store and store.collection(self.filename)
+                    if collection is None or not store.has(collection):
+                        return self.get_data()[key]
+                    self.records[key] = store.get(collection, key)
+                return self.records[key]
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.get_data()[key] = value
+
+    def __delitem__(self, key):
+        del self.get_data()[key]
+
+    def __iter__(self):
+        return iter(self.get_data())
+
+    def __len__(self):
+        return len(self.get_data())
+
+    def __repr__(self):
+        if self.data is None:
+            return "LazyData(%s, not loaded)" % self.filename
+        return "LazyData(%s, %d entries)" % (self.filename, len(self.data))
+
+
+# Every LazyData by filename
+_registry = {}
+
+def lazy(filename):
+    """Returns the LazyData of the file"""
+    if filename not in _registry:
+        _registry[filename] = LazyData(filename)
+    return _registry[filename]
+
+def preload(filenames=None, background=True):
+    """Loads the given data files, all registered ones by default. In the
+    background a daemon thread does the loading and is returned so the
+    caller can join it."""
+    if filenames is None:
+        datasets = list(_registry.values())
+    else:
+        datasets = [lazy(filename) for filename in filenames]
+
+    def run():
+        for data in datasets:
+            data.preload()
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="preload", daemon=True)
+    thread.start()
+    return thread
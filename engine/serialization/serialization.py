@@ -1,9 +1,13 @@
 import dill as pickle
 
+from engine import content
+from engine.profiling.startup import profiled
+
 def serialize(obj, filename):
     with open(filename, "wb") as file:
         pickle.dump(obj, file)
 
+@profiled("deserialize", lambda filename: filename)
 def deserialize(filename):
-    with open(filename, "rb") as file:
+    with content.open_file(filename) as file:
         return pickle.load(file)
@@ -0,0 +1,196 @@
+"""Implements the DataStore used to keep game data in an indexed database"""
+import os
+import sqlite3
+import threading
+
+import dill as pickle
+
+from engine.serialization.serialization import deserialize
+
+class DataStore(object):
+    """SQLite database of game data records. Records are grouped in
+    collections named after the pickle file they came from, relative to
+    the data directory and without the extension, e.g. "moves" or
+    "item/base_items". Each record holds a single move, monster, item or
+    floor of events and can be read or written by key.
+
+    Collections that are dictionaries get one record per key. Anything else
+    is kept as a single record under VALUE_KEY."""
+
+    SCHEMA_VERSION = 1
+    VALUE_KEY = "" # key of collections that are not dictionaries
+    DATA_DIRECTORY = "data"
+    FILENAME = "data/game.db"
+
+    # Statements run to bring a database up to the version at the index + 1
+    MIGRATIONS = [
+        ["""CREATE TABLE records (
+                collection TEXT NOT NULL,
+                key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (collection, key))""",
+         """CREATE TABLE collections (
+                name TEXT PRIMARY KEY,
+                keyed INTEGER NOT NULL)"""],
+    ]
+
+    def __init__(self, filename=FILENAME, directory=DATA_DIRECTORY):
+        self.filename = filename
+        self.directory = directory
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.migrate()
+
+    def close(self):
+        self.connection.close()
+
+    def version(self):
+        """Returns the schema version of the database"""
+        return self.connection.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self):
+        """Upgrades the database schema to SCHEMA_VERSION"""
+        version = self.version()
+        if version > self.SCHEMA_VERSION:
+            raise ValueError("%s has schema version %d, expected at most %d"
+                % (self.filename, version, self.SCHEMA_VERSION))
+        with self.lock, self.connection:
+            for statements in self.MIGRATIONS[version:self.SCHEMA_VERSION]:
+                for statement in statements:
+                    self.connection.execute(statement)
+            self.connection.execute("PRAGMA user_version = %d"
+                % self.SCHEMA_VERSION)
+
+    def collection(self, filename):
+        """Returns the collection name of a pickle file. None if the file is
+        not in the data directory"""
+        path = os.path.relpath(filename, self.directory)
+        if path.startswith(os.pardir):
+            return None
+        return os.path.splitext(path)[0].replace(os.sep, "/")
+
+    def has(self, collection):
+        """Returns if the collection was written to the database"""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT 1 FROM collections WHERE name = ?",
+                (collection,)).fetchone() is not None
+
+    def keys(self, collection):
+        """Returns the keys of the collection in their original order"""
+        with self.lock:
+            return [key for key, in self.connection.execute(
+                "SELECT key FROM records WHERE collection = ? "
+                "ORDER BY position", (collection,))]
+
+    def get(self, collection, key):
+        """Returns the record with the given key. Raises a KeyError if
+        there is none"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM records WHERE collection = ? AND key = ?",
+                (collection, key)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    def put(self, collection, key, value):
+        """Writes a single record, leaving the rest of the collection as
+        it is"""
+        data = pickle.dumps(value)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO collections VALUES (?, 1)",
+                (collection,))
+            row = self.connection.execute(
+                "SELECT position FROM records WHERE collection = ? "
+                "AND key = ?", (collection, key)).fetchone()
+            if row is None:
+                position = self.connection.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM records "
+                    "WHERE collection = ?", (collection,)).fetchone()[0]
+            else:
+                position = row[0]
+            self.connection.execute(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                (collection, key, position, data))
+
+    def delete(self, collection, key):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM records WHERE collection = ? AND key = ?",
+                (collection, key))
+
+    def load(self, collection):
+        """Returns the whole collection as it was written"""
+        with self.lock:
+            keyed, = self.connection.execute(
+                "SELECT keyed FROM collections WHERE name = ?",
+                (collection,)).fetchone()
+            rows = self.connection.execute(
+                "SELECT key, data FROM records WHERE collection = ? "
+                "ORDER BY position", (collection,)).fetchall()
+        if not keyed:
+            return pickle.loads(rows[0][1])
+        return {key: pickle.loads(data) for key, data in rows}
+
+    def write(self, collection, value):
+        """Writes the whole collection. Only the records that changed since
+        the last write are touched."""
+        keyed = isinstance(value, dict)
+        if keyed:
+            items = value.items()
+        else:
+            items = [(self.VALUE_KEY, value)]
+        records = [(key, position, pickle.dumps(record))
+            for position, (key, record) in enumerate(items)]
+
+        with self.lock, self.connection:
+            stored = {key: (position, data) for key, position, data in
+                self.connection.execute(
+                    "SELECT key, position, data FROM records "
+                    "WHERE collection = ?", (collection,))}
+            self.connection.execute(
+                "INSERT OR REPLACE INTO collections VALUES (?, ?)",
+                (collection, int(keyed)))
+            for key, position, data in records:
+                if stored.pop(key, None) != (position, data):
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                        (collection, key, position, data))
+            for key in stored:
+                self.connection.execute(
+                    "DELETE FROM records WHERE collection = ? AND key = ?",
+                    (collection, key))
+
+    def import_pickle(self, filename):
+        """Copies a pickle file into its collection. Returns the name of the
+        collection"""
+        collection = self.collection(filename)
+        if collection is None:
+            raise ValueError("%s is not in %s" % (filename, self.directory))
+        self.write(collection, deserialize(filename))
+        return collection
+
+
+# Store shared by the game and the editor, opened on first use
+_store = None
+
+def get_store():
+    """Returns the DataStore of the data directory. None if the game data
+    has not been migrated to a database yet"""
+    global _store
+    if _store is None and os.path.exists(DataStore.FILENAME):
+        _store = DataStore()
+    return _store
+
+def load(filename):
+    """Reads a data file, preferring its collection in the DataStore over
+    the pickle file itself"""
+    store = get_store()
+    if store is not None:
+        collection = store.collection(filename)
+        if collection is not None and store.has(collection):
+            return store.load(collection)
+    return deserialize(filename)
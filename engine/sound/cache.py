@@ -0,0 +1,18 @@
+"""Defines the SoundCache used to keep decoded sound effects around"""
+from pygame import mixer
+
+from engine.ui.draw.cache import SurfaceCache
+
+class SoundCache(SurfaceCache):
+    """Least recently used cache of sounds bounded by the memory their
+    decoded samples take up. Sounds count as no bytes once the mixer has
+    been shut down."""
+
+    @staticmethod
+    def get_bytes(sound):
+        settings = mixer.get_init()
+        if settings is None:
+            return 0
+        frequency, size, channels = settings
+        return round(sound.get_length() * frequency) * channels * \
+            (abs(size) // 8)
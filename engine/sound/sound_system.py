@@ -1,4 +1,7 @@
 from engine.system import System, Message
+from engine import content
+from engine.loader import loader
+from engine.sound.cache import SoundCache
 
 from pygame import mixer
 
@@ -9,32 +12,48 @@ class SoundSystem(System):
     play - non-force play a sound
     force - force play a sound
     ui - reserved channel for playing ui sounds
-    bg - Sets the background music"""
-    cache = {}
+    bg - Sets the background music
+
+    Background music is streamed from its file. mixer.music streams one
+    track at a time, so tracks cannot crossfade: the music playing fades
+    out and then the next track fades in. Sound effects are kept decoded in
+    a SoundCache."""
+
+    CACHE_BUDGET = 8 * 1024 * 1024 # bytes of decoded sound effects kept
+    FADE = 1000 # milliseconds music takes to fade out or in
 
     def __init__(self, game):
         super().__init__(game, "sound")
+        self.cache = SoundCache("sounds", self.CACHE_BUDGET)
+        self.music = None # filename of the music playing
+        self.next_music = None # filename of the music to fade in next
+        self.volume = 0
 
     def init(self, game):
         mixer.set_num_channels(8)
-        mixer.set_reserved(2)
+        mixer.set_reserved(1)
         self.ui_channel = mixer.Channel(0)
-        self.bg_channel = mixer.Channel(1)
-        self.set_bg(self.load_sound("data/sound/background/Puzzle-Game.wav"))
+        self.set_bg("data/sound/background/Puzzle-Game.wav")
 
     def update(self, delta, game):
         messages = self.flush_messages()
         for message in messages:
             self.dispatch(message)
+        self.update_music(delta)
 
     def load_sound(self, filename):
-        if not self.cache.get(filename):
-            self.cache[filename] = mixer.Sound(filename)
-        return self.cache[filename]
+        sound = self.cache.get(filename)
+        if sound is None:
+            sound = loader.sound(filename)
+            self.cache.put(filename, sound)
+        return sound
 
     def dispatch(self, message):
         """Function for determining what action to call depending on the
         message"""
+        if message.mtype == "bg":
+            self.set_bg(message.args[0])
+            return
         sound = self.load_sound(message.args[0])
         if message.mtype == "play":
             self.play_sound(sound)
@@ -42,8 +61,6 @@ class SoundSystem(System):
             self.force_sound(sound)
         elif message.mtype == "ui":
             self.play_ui(sound)
-        elif message.mtype == "bg":
-            self.set_bg(sound)
 
     def play_sound(self, sound):
         """Non forcefully play a sound"""
@@ -61,6 +78,33 @@ class SoundSystem(System):
         """Add sound to the ui queue"""
         self.ui_channel.play(sound)
 
-    def set_bg(self, sound):
-        """Set music of background queue"""
-        self.bg_channel.play(sound, loops=-1)
\ No newline at end of file
+    def set_bg(self, filename):
+        """Set music of background queue. The music playing fades out
+        first"""
+        if filename == self.music:
+            self.next_music = None
+        else:
+            self.next_music = filename
+
+    def update_music(self, delta):
+        """Fades the music playing out, then starts the next one and fades
+        it in"""
+        if self.next_music is not None:
+            if self.music is None or self.volume <= 0:
+                mixer.music.load(content.source(self.next_music),
+                    self.next_music)
+                mixer.music.play(loops=-1)
+                self.music = self.next_music
+                self.next_music = None
+                self.volume = 0
+            else:
+                self.volume = max(0, self.volume - delta / self.FADE)
+        elif self.music is not None and self.volume < 1:
+            self.volume = min(1, self.volume + delta / self.FADE)
+        mixer.music.set_volume(self.volume)
+
+    def stats(self):
+        """Returns the sound effect cache counters and the music playing"""
+        stats = self.cache.stats()
+        stats["music"] = self.music
+        return stats
@@ -11,6 +11,10 @@ class Message(object):
 class System(object):
     """Interface for creating a new system in the Game"""
 
+    # Updated on the Game's fixed simulation ticks instead of every frame
+    # when the Game has a tick rate
+    simulated = False
+
     def __init__(self, game, name):
         """Initialize a new System"""
         super().__init__()
@@ -26,6 +30,11 @@ class System(object):
         """Override. Called every game cycle"""
         pass
 
+    def update_frame(self, delta, game):
+        """Override. Called every rendered frame before any system is
+        updated, even for simulated systems. Used for input."""
+        pass
+
     def quit(self, game):
         """Override. Called at the end of the game"""
         pass
@@ -6,6 +6,7 @@ import anime
 
 from engine.system import System, Message
 from engine.ui.draw.simple import draw_text
+from engine.ui.draw.font import get_font
 import engine.ui.manager as manager
 
 class AnimationSystem(System):
@@ -16,10 +17,8 @@ class AnimationSystem(System):
 
     def init(self, game):
         self.animations = []
-        self.message_font = pygame.font.Font(
-            "assets/fonts/VT323-Regular.ttf", 24)
-        self.battle_font = pygame.font.Font(
-            "assets/fonts/VT323-Regular.ttf", 40)
+        self.message_font = get_font(24)
+        self.battle_font = get_font(40)
 
     def update(self, delta, game):
         messages = self.flush_messages()
@@ -28,8 +27,13 @@ class AnimationSystem(System):
 
         surface = pygame.display.get_surface()
         for animation in self.animations[:]:
+            # Where it was drawn last frame and where it is drawn now
+            previous = animation.get_bounding_rect()
+            if previous is not None:
+                self.game.mark_dirty(previous)
             animation.update()
             animation.render(surface)
+            self.game.mark_dirty(animation.get_bounding_rect())
             if not animation.is_dirty():
                 self.animations.remove(animation)
 
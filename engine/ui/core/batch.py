@@ -0,0 +1,44 @@
+"""Defines the RenderBatch used to draw each layer with Surface.blits"""
+import pygame
+
+class RenderBatch(object):
+    """Stands in for a surface while a manager renders. Blits are queued
+    and drawn in order with a single Surface.blits call when the batch is
+    flushed. Anything else, including blits with blend flags, flushes the
+    queue first and is passed on to the surface so the drawing order is
+    kept."""
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.queue = []
+        self.blitted = 0 # blits drawn through Surface.blits
+        self.flushes = 0
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if special_flags:
+            self.flush()
+            return self.surface.blit(source, dest, area, special_flags)
+        if area is None:
+            self.queue.append((source, dest))
+            size = source.get_size()
+        else:
+            self.queue.append((source, dest, area))
+            size = pygame.Rect(area).size
+        return pygame.Rect(tuple(dest[:2]), size)
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*blit) for blit in blit_sequence]
+        return rects if doreturn else None
+
+    def flush(self):
+        """Draws the queued blits"""
+        if not self.queue:
+            return
+        self.surface.blits(self.queue, doreturn=False)
+        self.blitted += len(self.queue)
+        self.flushes += 1
+        self.queue = []
+
+    def __getattr__(self, name):
+        self.flush()
+        return getattr(self.surface, name)
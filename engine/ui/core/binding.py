@@ -0,0 +1,43 @@
+"""Defines the Binding class used to update elements only on change"""
+
+# Every Binding update, by whether the element had to be changed
+redraws = {"performed": 0, "skipped": 0}
+
+_UNSET = object()
+
+class Binding(object):
+    """Ties a model value to an element. The getter reads the value from
+    whatever is passed to update, and the setter, typically an element's
+    set_text or set_percent, is only called when the value differs from
+    the one it was last given."""
+
+    def __init__(self, getter, setter):
+        self.getter = getter
+        self.setter = setter
+        self.value = _UNSET
+
+    def update(self, *args):
+        """Reads the value and passes it on if it changed. Returns if the
+        setter was called"""
+        value = self.getter(*args)
+        if value == self.value:
+            redraws["skipped"] += 1
+            return False
+        self.value = value
+        self.setter(value)
+        redraws["performed"] += 1
+        return True
+
+    def reset(self):
+        """Makes the next update call the setter whatever the value is"""
+        self.value = _UNSET
+
+
+def update_bindings(bindings, *args):
+    """Updates every binding with the same arguments"""
+    for binding in bindings:
+        binding.update(*args)
+
+def binding_stats():
+    """Returns the performed and skipped redraws so far"""
+    return dict(redraws)
@@ -0,0 +1,241 @@
+"""Defines the RecordingSurface, DirtyRenderer and RetainedSurface used to
+avoid redrawing what did not change
+
+Draw calls are compared by the identity of the surfaces they blit, so a
+surface must never be drawn on after it was first shown. Elements that
+change their look draw onto a new surface, or a copy of the old one, and
+show that instead. Setting DIRTY_CHECK compares the pixels of every blitted
+surface with the previous frame's as well, logging a warning and redrawing
+whenever one was changed in place."""
+from difflib import SequenceMatcher
+import logging
+import zlib
+import os
+
+import pygame
+
+CHECK = bool(os.environ.get("DIRTY_CHECK"))
+
+class RecordingSurface(object):
+    """Stands in for the display surface while managers render. Blits and
+    fills are recorded instead of drawn so they can be compared with the
+    previous frame and replayed only where something changed. Anything
+    else is passed on to the display surface.
+
+    A blit is recorded by the identity of its source surface, see the
+    module docstring."""
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.bounds = surface.get_rect()
+        self.ops = []
+        self.keys = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is not None:
+            area = pygame.Rect(area)
+            size = area.size
+        else:
+            size = source.get_size()
+        position = tuple(dest[:2])
+        rect = pygame.Rect(position, size).clip(self.bounds)
+        self.ops.append((rect, "blit", source, position, area, special_flags))
+        self.keys.append(("blit", id(source), position,
+            area and tuple(area), special_flags))
+        return rect
+
+    def fill(self, color, rect=None, special_flags=0):
+        if rect is None:
+            rect = self.bounds
+        rect = pygame.Rect(rect).clip(self.bounds)
+        color = tuple(pygame.Color(color))
+        self.ops.append((rect, "fill", color, rect, None, special_flags))
+        self.keys.append(("fill", color, tuple(rect), special_flags))
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*blit) for blit in blit_sequence]
+        return rects if doreturn else None
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+
+def replay(surface, ops, offset=(0, 0)):
+    """Draws recorded ops onto the surface, moved by minus the offset.
+    Consecutive blits without blend flags are drawn with one Surface.blits
+    call."""
+    x, y = offset
+    queue = []
+    for rect, kind, source, position, area, special_flags in ops:
+        if kind == "blit" and not special_flags:
+            queue.append((source, (position[0] - x, position[1] - y), area))
+            continue
+        if queue:
+            surface.blits(queue, doreturn=False)
+            queue = []
+        if kind == "blit":
+            surface.blit(source, (position[0] - x, position[1] - y), area,
+                special_flags)
+        else:
+            surface.fill(source, position.move(-x, -y), special_flags)
+    if queue:
+        surface.blits(queue, doreturn=False)
+
+
+class InPlaceCheck(object):
+    """Finds surfaces that were drawn on in place between two frames by
+    comparing checksums of their pixels. Only used with DIRTY_CHECK as it
+    reads every blitted surface each frame."""
+
+    def __init__(self):
+        self.checksums = {}
+
+    def modified(self, ops):
+        """Returns the rects of the blits whose source changed since the
+        previous call"""
+        checksums = {}
+        rects = []
+        for rect, kind, source, position, area, special_flags in ops:
+            if kind != "blit":
+                continue
+            key = id(source)
+            if key not in checksums:
+                checksums[key] = zlib.crc32(pygame.image.tostring(source,
+                    "RGBA"))
+            if self.checksums.get(key, checksums[key]) != checksums[key]:
+                logging.warning("A %dx%d surface shown at %s was drawn on in "
+                    "place" % (source.get_width(), source.get_height(),
+                    position))
+                rects.append(rect)
+        self.checksums = checksums
+        return rects
+
+
+class DirtyRenderer(object):
+    """Compares the recorded draw calls of each frame with the previous
+    frame's and redraws only the regions where they differ"""
+
+    FULL_AREA = 0.5 # share of the display above which all of it is redrawn
+
+    def __init__(self, check=CHECK):
+        self.previous = None
+        self.check = InPlaceCheck() if check else None
+
+    def invalidate(self):
+        """Redraws the whole display on the next frame"""
+        self.previous = None
+
+    def record(self, surface):
+        """Returns the RecordingSurface to render the frame on"""
+        return RecordingSurface(surface)
+
+    def changed(self, recording):
+        """Returns the rects covered by draw calls that were added, removed
+        or reordered since the previous frame"""
+        rects = []
+        if self.check is not None:
+            rects.extend(self.check.modified(recording.ops))
+        if self.previous is None:
+            return [recording.bounds]
+        if self.previous.keys == recording.keys:
+            return rects
+        matcher = SequenceMatcher(None, self.previous.keys, recording.keys,
+            autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag != "equal":
+                rects.extend(op[0] for op in self.previous.ops[i1:i2])
+                rects.extend(op[0] for op in recording.ops[j1:j2])
+        return rects
+
+    def merge(self, rects, bounds):
+        """Joins overlapping rects. Returns the whole display if they cover
+        most of it"""
+        merged = []
+        for rect in rects:
+            rect = pygame.Rect(rect).clip(bounds)
+            if not rect.w or not rect.h:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        area = sum(rect.w * rect.h for rect in merged)
+        if area > bounds.w * bounds.h * self.FULL_AREA:
+            return [pygame.Rect(bounds)]
+        return merged
+
+    def render(self, recording, extra=()):
+        """Draws the changed regions of the recording, and the extra rects,
+        onto the display. Returns the rects that were redrawn."""
+        surface = recording.surface
+        rects = self.merge(self.changed(recording) + list(extra),
+            recording.bounds)
+        for rect in rects:
+            surface.set_clip(rect)
+            surface.fill((0, 0, 0))
+            replay(surface, [op for op in recording.ops
+                if op[0].colliderect(rect)])
+        surface.set_clip(None)
+        self.previous = recording
+        return rects
+
+
+class RetainedSurface(object):
+    """Offscreen copy of a recording, used by managers in retained mode.
+    The recorded draw calls are only drawn onto a new offscreen surface when
+    they differ from the last frame's; otherwise the last one is blitted as
+    is. A new surface is made on every change so a DirtyRenderer above can
+    tell it apart.
+
+    Recordings with blend flags or translucent fills would not look the same
+    drawn offscreen first, so they are replayed directly instead."""
+
+    def __init__(self, check=CHECK):
+        self.recording = None
+        self.check = InPlaceCheck() if check else None
+        self.surface = None
+        self.offset = (0, 0)
+        self.draws = 0 # frames the offscreen surface was redrawn
+        self.reuses = 0 # frames it was blitted as is
+
+    def invalidate(self):
+        self.recording = None
+
+    @staticmethod
+    def cacheable(recording):
+        for rect, kind, source, position, area, special_flags in \
+                recording.ops:
+            if special_flags or (kind == "fill" and source[3] < 255):
+                return False
+        return True
+
+    def render(self, recording, target):
+        """Draws the recording onto the target, through the offscreen
+        surface when possible"""
+        modified = self.check is not None and \
+            self.check.modified(recording.ops)
+        if self.recording is not None and not modified and \
+                self.recording.keys == recording.keys:
+            self.reuses += 1
+            target.blit(self.surface, self.offset)
+            return
+        if not recording.ops:
+            self.recording = recording
+            self.surface = pygame.Surface((0, 0))
+            return
+        if not self.cacheable(recording):
+            self.recording = None
+            replay(target, recording.ops)
+            return
+
+        bounds = recording.ops[0][0].unionall([op[0] for op in recording.ops])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        replay(surface, recording.ops, bounds.topleft)
+        self.draws += 1
+        self.recording = recording
+        self.surface = surface
+        self.offset = bounds.topleft
+        target.blit(surface, self.offset)
@@ -0,0 +1,99 @@
+"""Defines the InputDispatcher that updates Zones from mouse events"""
+import weakref
+
+import pygame
+
+class InputDispatcher(object):
+    """Keeps the Zones in a grid of cells and updates their state only
+    when a mouse event happens, testing only the zones in the cells the
+    mouse left and entered.
+
+    Zones are active while the elements owning them are rendered, so only
+    the zones of the current layout are updated. A zone that was not
+    rendered last frame is tested once when it is shown again."""
+
+    CELL = 64 # width and height of a grid cell in pixels
+
+    def __init__(self):
+        self.cells = {} # WeakSets of zones by (column, row)
+        self.frame = 0
+        self.position = (0, 0)
+        self.pressed = False
+        self.events = 0
+        self.tests = 0
+
+    def cells_of(self, rect):
+        """Returns the cells the rect covers"""
+        if not rect.w or not rect.h:
+            return []
+        return [(column, row)
+            for column in range(rect.left // self.CELL,
+                (rect.right - 1) // self.CELL + 1)
+            for row in range(rect.top // self.CELL,
+                (rect.bottom - 1) // self.CELL + 1)]
+
+    def cell_at(self, x, y):
+        return (x // self.CELL, y // self.CELL)
+
+    def index(self, zone):
+        """Files the zone under the cells its rect covers"""
+        for cell in zone.cells:
+            zones = self.cells.get(cell)
+            if zones is not None:
+                zones.discard(zone)
+        zone.cells = self.cells_of(zone.rect)
+        for cell in zone.cells:
+            zones = self.cells.get(cell)
+            if zones is None:
+                zones = self.cells[cell] = weakref.WeakSet()
+            zones.add(zone)
+        self.test(zone)
+
+    def activate(self, zone):
+        """Called every frame the zone is rendered"""
+        if zone.frame < self.frame - 1:
+            self.test(zone)
+        zone.frame = self.frame
+
+    def test(self, zone):
+        self.tests += 1
+        zone.test(self.position[0], self.position[1], self.pressed)
+
+    def move(self, position):
+        cells = {self.cell_at(*self.position), self.cell_at(*position)}
+        self.position = position
+        self.notify(cells)
+
+    def press(self, pressed):
+        self.pressed = pressed
+        self.notify([self.cell_at(*self.position)])
+
+    def notify(self, cells):
+        """Tests the active zones in the cells"""
+        for cell in cells:
+            for zone in list(self.cells.get(cell, ())):
+                if zone.frame >= self.frame - 1:
+                    self.test(zone)
+
+    def dispatch(self, events):
+        """Starts a frame and updates the zones the mouse events affect"""
+        self.frame += 1
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                self.events += 1
+                self.move(tuple(event.pos))
+            elif event.type in (pygame.MOUSEBUTTONDOWN,
+                    pygame.MOUSEBUTTONUP) and event.button == 1:
+                self.events += 1
+                if tuple(event.pos) != self.position:
+                    self.move(tuple(event.pos))
+                self.press(event.type == pygame.MOUSEBUTTONDOWN)
+
+    def stats(self):
+        """Returns the mouse events handled and zone tests made so far"""
+        return {"events": self.events, "tests": self.tests,
+            "zones": len(set().union(*self.cells.values()))}
+
+
+# Dispatcher the Zones register with
+dispatcher = InputDispatcher()
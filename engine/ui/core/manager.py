@@ -4,15 +4,23 @@ import logging
 from collections import OrderedDict
 
 from engine.ui.core.renderable import Renderable
+from engine.ui.core.dirty import RecordingSurface, RetainedSurface
 
 class Manager(Renderable):
     """The Manager class is responsible for handling the rendering
     of renderable objects and the updating of zones. It defines
-    update and render methods and renderables and zones as attributes."""
+    update and render methods and renderables and zones as attributes.
+
+    Managers with retained set render their renderables onto an offscreen
+    surface that is reused until what they draw changes. The renderables
+    still run every frame so hovering and clicking keep working."""
+
+    retained = False
 
     def __init__(self, name, x, y):
         super().__init__(name, x, y)
         self.renderables = OrderedDict()
+        self.retained_surface = RetainedSurface()
 
     def add_renderable(self, renderable):
         """Add a renderable to the running list of renderables"""
@@ -40,6 +48,16 @@ class Manager(Renderable):
     def render(self, surface, game, system):
         """Render will take a surface to be passed onto its renderables
         renderer takes the game object to be passed on as it pleases."""
+        if not self.retained:
+            self.render_children(surface, game, system)
+            return
+        recording = RecordingSurface(surface)
+        self.render_children(recording, game, system)
+        self.retained_surface.render(recording, surface)
+
+    def render_children(self, surface, game, system):
+        """Updates and renders the renderables. Override instead of render
+        to keep retained mode working."""
         self.update(game, system)
         for r in self.renderables.values():
             r.render(surface, game, system)
@@ -1,10 +1,14 @@
 """Defines the Zone class"""
 import pygame
 
+from engine.ui.core.input import dispatcher
+
 class Zone(object):
     """Zone object defines clickable zones on the screen that can
     execute events (functions). It is not responsible for the rendering
-    of the elements on the screen."""
+    of the elements on the screen.
+
+    Its state is set by the InputDispatcher when mouse events happen."""
 
     NEUTRAL = 0
     HOVERED = 1
@@ -18,18 +22,29 @@ class Zone(object):
         super(Zone, self).__init__()
         self.rect = pygame.Rect(rect)
         self.state = Zone.NEUTRAL
+        self.seen = Zone.NEUTRAL # state when last updated
+        self.cells = []
+        self.frame = -2 # last frame the zone was active
+        dispatcher.index(self)
 
     def update_rect(self, rect):
         self.rect = rect
+        dispatcher.index(self)
 
-    def update(self, game):
-        """Takes the game object and figures out the state for the zone"""
-        # if previously clicked and button is no longer clicked we call
-        # on click
-        if self.rect.collidepoint(game.mouse_x, game.mouse_y):
+    def test(self, x, y, pressed):
+        """Sets the state for the mouse at x, y"""
+        if self.rect.collidepoint(x, y):
             state = Zone.HOVERED
-            if game.mouse_button[0]:
+            if pressed:
                 state = Zone.CLICKED
         else:
             state = Zone.NEUTRAL
-        self.state = state
\ No newline at end of file
+        self.state = state
+
+    def update(self, game):
+        """Called every frame the zone is shown. Returns the state the
+        zone had when last updated"""
+        dispatcher.activate(self)
+        previous = self.seen
+        self.seen = self.state
+        return previous
@@ -0,0 +1,151 @@
+"""Sprite atlases packing the small images of the game into a few pages
+
+The atlases are built by editor/scripts/build_atlas.py, which writes the
+pages and a JSON index of where each image is on them. draw_image hands
+out subsurfaces of the pages for the images in the index, so they come
+from a handful of files and source surfaces. Pages are scaled up whole
+the first time an image is asked for at a scale, which gives the same
+pixels as scaling the images one by one. Pages are kept in the image cache
+with the sprites cut from them, and are evicted along with them. The
+atlases have to be built again when the images change."""
+import json
+import os
+
+import pygame
+
+from engine import content
+from engine.ui.draw.cache import image_cache
+from engine.ui.draw.disk import persistent
+
+INDEX = "image/atlas/index.json"
+GROUPS = ("image/icon", "image/item", "image/monster", "image/player",
+    "image/ui")
+MAX_SPRITE = 256 # images wider or taller than this are left out
+WIDTH = 512 # width of a page
+MAX_HEIGHT = 1024 # height a page is filled up to before starting another
+
+def pack(sizes, width=WIDTH, max_height=MAX_HEIGHT):
+    """Packs the sizes into shelves on pages, tallest first. Returns the
+    (page, x, y) of each size, in order."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    page = x = y = shelf = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x, y, shelf = 0, y + shelf, 0
+        if y + h > max_height:
+            page, x, y, shelf = page + 1, 0, 0, 0
+        positions[i] = (page, x, y)
+        x += w
+        shelf = max(shelf, h)
+    return positions
+
+def build(groups=GROUPS, index=INDEX):
+    """Packs the png images of each group directory into pages next to the
+    index and writes the index. Returns the index as a dictionary."""
+    directory = os.path.dirname(index)
+    os.makedirs(directory, exist_ok=True)
+    atlases = []
+    for group in groups:
+        images = []
+        for name in sorted(os.listdir(group)):
+            filename = group + "/" + name
+            if not name.endswith(".png"):
+                continue
+            image = pygame.image.load(filename)
+            if image.get_width() <= MAX_SPRITE and \
+                    image.get_height() <= MAX_SPRITE:
+                images.append((filename, image))
+        if not images:
+            continue
+        positions = pack([image.get_size() for _, image in images])
+        pages = {}
+        for (filename, image), (page, x, y) in zip(images, positions):
+            pages.setdefault(page, []).append((filename, image, x, y))
+        for page, sprites in sorted(pages.items()):
+            height = max(y + image.get_height()
+                for _, image, x, y in sprites)
+            surface = pygame.Surface((WIDTH, height), pygame.SRCALPHA, 32)
+            surface.fill((0, 0, 0, 0))
+            for filename, image, x, y in sprites:
+                surface.blit(image, (x, y))
+            page_filename = "%s/%s-%d.png" % (directory,
+                os.path.basename(group), page)
+            pygame.image.save(surface, page_filename)
+            atlases.append({"image": page_filename, "sprites": {
+                filename: [x, y, image.get_width(), image.get_height()]
+                for filename, image, x, y in sprites}})
+    data = {"version": 1, "atlases": atlases}
+    with open(index, "w") as file:
+        json.dump(data, file, indent=1, sort_keys=True)
+    return data
+
+
+class Atlas(object):
+    """Hands out the images of the atlases in an index as subsurfaces.
+    Works without an index, holding no images then."""
+
+    PAGE = "atlas page" # first item of the cache keys of pages
+
+    def __init__(self, index=INDEX, cache=image_cache):
+        """Scaled pages are kept in cache under (PAGE, filename, scale)"""
+        self.index = index
+        self.cache = cache
+        self.sprites = None # (page filename, rect) by image filename
+        self.served = 0
+
+    def load(self):
+        self.sprites = {}
+        if not content.exists(self.index):
+            return
+        with content.open_file(self.index) as file:
+            data = json.loads(file.read().decode("utf-8"))
+        for atlas in data["atlases"]:
+            for filename, rect in atlas["sprites"].items():
+                self.sprites[filename] = (atlas["image"], pygame.Rect(rect))
+
+    def __contains__(self, filename):
+        if self.sprites is None:
+            self.load()
+        return filename in self.sprites
+
+    def page(self, filename, scale):
+        key = (self.PAGE, filename, scale)
+        surface = self.cache.get(key)
+        if surface is None:
+            if scale == 1:
+                surface = pygame.image.load(content.source(filename),
+                    filename).convert_alpha()
+            else:
+                surface = persistent(("atlas", filename, scale), (filename,),
+                    lambda: self.scale(filename, scale))
+            self.cache.put(key, surface)
+        return surface
+
+    def scale(self, filename, scale):
+        page = self.page(filename, 1)
+        return pygame.transform.scale(page,
+            (page.get_width() * scale, page.get_height() * scale))
+
+    def sprite(self, filename, scale=1):
+        """Returns the image as a subsurface of its page scaled up by
+        scale. None if it is not in the atlases."""
+        if filename not in self:
+            return None
+        page, rect = self.sprites[filename]
+        self.served += 1
+        return self.page(page, scale).subsurface(pygame.Rect(
+            rect.x * scale, rect.y * scale, rect.w * scale, rect.h * scale))
+
+    def stats(self):
+        """Returns how many images were handed out and pages loaded"""
+        pages = [page for key, page in self.cache.surfaces.items()
+            if key[0] == self.PAGE]
+        return {"sprites": len(self.sprites or ()), "served": self.served,
+            "pages": len(pages),
+            "bytes": sum(self.cache.get_bytes(page) for page in pages)}
+
+
+# Atlases draw_image takes images from
+atlas = Atlas()
@@ -0,0 +1,127 @@
+"""Defines the SurfaceCache used to keep drawn surfaces around"""
+from collections import OrderedDict
+
+class SurfaceCache(object):
+    """Least recently used cache of surfaces bounded by the memory their
+    pixels take up. Counts hits, misses and evictions so the budget can be
+    tuned.
+
+    Pinned keys are never evicted, even if the cache goes over its budget
+    because of them.
+
+    Subsurfaces take up no bytes of their own. Evicting the surface they
+    are part of evicts them with it, and it is kept while one is pinned."""
+
+    def __init__(self, name, budget):
+        """budget is the most bytes of pixels kept"""
+        self.name = name
+        self.budget = budget
+        self.surfaces = OrderedDict()
+        self.pinned = set()
+        self.children = {} # keys of the cached subsurfaces of each surface
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_bytes(surface):
+        if surface.get_parent() is not None:
+            return 0
+        return surface.get_width() * surface.get_height() * \
+            surface.get_bytesize()
+
+    def get(self, key):
+        """Returns the surface stored under the key. None if there is none"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.surfaces.move_to_end(key)
+        return surface
+
+    def __contains__(self, key):
+        return key in self.surfaces
+
+    def put(self, key, surface):
+        """Stores the surface, evicting the least recently used ones until
+        the cache fits its budget again"""
+        if key in self.surfaces:
+            self.remove(key)
+        self.surfaces[key] = surface
+        self.size += self.get_bytes(surface)
+        parent = self.get_parent(surface)
+        if parent is not None:
+            self.children.setdefault(parent, set()).add(key)
+        self.evict(key)
+
+    @staticmethod
+    def get_parent(surface):
+        # Sounds and other values without parents are never subsurfaces
+        get_parent = getattr(surface, "get_parent", None)
+        return get_parent and get_parent()
+
+    def remove(self, key):
+        surface = self.surfaces.pop(key)
+        self.size -= self.get_bytes(surface)
+        parent = self.get_parent(surface)
+        if parent is not None and parent in self.children:
+            self.children[parent].discard(key)
+            if not self.children[parent]:
+                del self.children[parent]
+        return surface
+
+    def evict(self, keep=None):
+        """Evicts the least recently used unpinned surfaces, other than
+        keep, until the cache fits its budget"""
+        if self.size <= self.budget:
+            return
+        for key in list(self.surfaces):
+            if self.size <= self.budget:
+                break
+            if key == keep or key in self.pinned or key not in self.surfaces:
+                continue
+            surface = self.surfaces[key]
+            children = self.children.get(surface, set())
+            if keep in children or self.pinned & children:
+                continue
+            self.remove(key)
+            self.evictions += 1
+            for child in list(children):
+                self.remove(child)
+                self.evictions += 1
+
+    def pin(self, key):
+        """Keeps the surface under the key from being evicted, whether it
+        is stored yet or not"""
+        self.pinned.add(key)
+
+    def unpin(self, key=None):
+        """Lets the surface under the key be evicted again, or every
+        surface when no key is given"""
+        if key is None:
+            self.pinned.clear()
+        else:
+            self.pinned.discard(key)
+        self.evict()
+
+    def clear(self):
+        self.surfaces.clear()
+        self.children.clear()
+        self.size = 0
+
+    def stats(self):
+        """Returns the counters of the cache as a dictionary"""
+        lookups = self.hits + self.misses
+        return {"name": self.name, "entries": len(self.surfaces),
+            "bytes": self.size, "budget": self.budget, "hits": self.hits,
+            "misses": self.misses, "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "pinned": len(self.pinned)}
+
+
+# Converted images by (filename, scale, alpha) and the atlas pages they are
+# cut from. The surfaces are shared, callers copy them before drawing on
+# them.
+image_cache = SurfaceCache("images", 64 * 1024 * 1024)
@@ -0,0 +1,166 @@
+"""Defines the DiskCache keeping derived surfaces between runs
+
+Surfaces that are deterministic functions of their inputs, like frames,
+scaled sprites and labels, are stored as raw RGBA pixels in files named
+after a hash of the inputs and the modification times of the files they
+were made from, so changing a source file leaves its old surfaces unused
+until they are evicted. Each file starts with a header holding the size
+and a checksum of the pixels, and is dropped if they do not match.
+
+SURFACE_CACHE names the directory the surfaces are kept in. The cache is
+off when it is not set, as in the tests; main.py sets it for the game."""
+from collections import OrderedDict
+import hashlib
+import struct
+import zlib
+import os
+
+import pygame
+
+from engine import content
+
+class DiskCache(object):
+    """Content addressed cache of surfaces in a directory, bounded by the
+    total size of its files. The least recently used files are removed
+    when it grows over its cap."""
+
+    MAGIC = b"SURF1"
+    HEADER = struct.Struct("<5sIII") # magic, width, height, checksum
+    SUFFIX = ".surface"
+
+    def __init__(self, directory, cap):
+        """cap is the most bytes of files kept"""
+        self.directory = directory
+        self.cap = cap
+        self.files = None # size of each file by name, least recently used
+                          # first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalid = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(inputs, sources=()):
+        """Returns the hash of the inputs and the modification times of the
+        source files"""
+        mtimes = tuple(content.mtime(source) for source in sources)
+        return hashlib.sha1(repr((inputs, sources, mtimes)).encode(
+            "utf-8")).hexdigest()
+
+    def scan(self):
+        """Reads the files of the directory, ordered by when they were last
+        used in earlier runs. Afterwards the order is kept in memory."""
+        if self.files is not None:
+            return
+        self.files = OrderedDict()
+        if not os.path.isdir(self.directory):
+            return
+        entries = [(entry.stat(), entry.name)
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(self.SUFFIX)]
+        for stat, name in sorted(entries, key=lambda entry: entry[0].st_mtime):
+            self.files[name] = stat.st_size
+        self.size = sum(self.files.values())
+
+    def __contains__(self, key):
+        self.scan()
+        return key + self.SUFFIX in self.files
+
+    def path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key):
+        """Returns the surface stored under the key, converted for the
+        display. None if there is none or it is damaged"""
+        try:
+            with open(self.path(key), "rb") as file:
+                data = file.read()
+        except OSError:
+            self.misses += 1
+            return None
+        size = self.HEADER.size
+        if len(data) >= size:
+            magic, width, height, checksum = self.HEADER.unpack(data[:size])
+            pixels = memoryview(data)[size:]
+            if magic == self.MAGIC and len(pixels) == width * height * 4 \
+                    and zlib.crc32(pixels) == checksum:
+                self.hits += 1
+                # Marked on disk too, for the order of the next run
+                os.utime(self.path(key))
+                self.scan()
+                if key + self.SUFFIX in self.files:
+                    self.files.move_to_end(key + self.SUFFIX)
+                return pygame.image.frombuffer(pixels, (width, height),
+                    "RGBA").convert_alpha()
+        self.invalid += 1
+        self.remove(key + self.SUFFIX)
+        return None
+
+    def put(self, key, surface):
+        """Stores the surface under the key, removing the least recently
+        used files if the cache goes over its cap"""
+        self.scan()
+        pixels = pygame.image.tostring(surface, "RGBA")
+        name = key + self.SUFFIX
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temporary = self.path(key) + ".tmp"
+            with open(temporary, "wb") as file:
+                file.write(self.HEADER.pack(self.MAGIC, surface.get_width(),
+                    surface.get_height(), zlib.crc32(pixels)))
+                file.write(pixels)
+            os.replace(temporary, self.path(key))
+        except OSError:
+            return
+        self.size += self.HEADER.size + len(pixels) - self.files.get(name, 0)
+        self.files[name] = self.HEADER.size + len(pixels)
+        self.files.move_to_end(name)
+        if self.size > self.cap:
+            self.evict()
+
+    def evict(self):
+        """Removes the least recently used files until the cache is under
+        its cap"""
+        while self.files and self.size > self.cap:
+            self.remove(next(iter(self.files)))
+            self.evictions += 1
+
+    def remove(self, name):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+        if self.files is not None and name in self.files:
+            self.size -= self.files.pop(name)
+
+    def stats(self):
+        """Returns the counters of the cache as a dictionary"""
+        self.scan()
+        return {"directory": self.directory, "files": len(self.files),
+            "bytes": self.size, "cap": self.cap, "hits": self.hits,
+            "misses": self.misses, "invalid": self.invalid,
+            "evictions": self.evictions}
+
+
+# Surfaces kept between runs, None when turned off
+disk_cache = None
+if os.environ.get("SURFACE_CACHE"):
+    disk_cache = DiskCache(os.environ["SURFACE_CACHE"], 64 * 1024 * 1024)
+
+def stored(inputs, sources):
+    """Returns if the surface of the inputs and source files is on disk"""
+    return disk_cache is not None and \
+        disk_cache.key(inputs, sources) in disk_cache
+
+def persistent(inputs, sources, draw):
+    """Returns the surface draw makes from the inputs and source files,
+    loading it from the disk cache when it was made in an earlier run"""
+    if disk_cache is None:
+        return draw()
+    key = disk_cache.key(inputs, sources)
+    surface = disk_cache.get(key)
+    if surface is None:
+        surface = draw()
+        disk_cache.put(key, surface)
+    return surface
@@ -0,0 +1,42 @@
+"""Registry of the fonts used by the ui. Each face and size is only loaded
+once and shared by every element, so fonts must not be restyled with
+set_bold, set_italic or set_underline."""
+import pygame
+
+from engine import content
+from engine.profiling.startup import profiled
+
+DEFAULT_FACE = "assets/fonts/VT323-Regular.ttf"
+
+# Loaded fonts by (face, size), and the other way around
+_fonts = {}
+_names = {}
+_requests = 0
+_file_bytes = 0 # size of the font file of every loaded font
+
+def get_font(size, face=DEFAULT_FACE):
+    """Returns the shared font of the face at the size"""
+    global _requests, _file_bytes
+    _requests += 1
+    font = _fonts.get((face, size))
+    if font is None:
+        font = _fonts[(face, size)] = _load_font(face, size)
+        _names[font] = (face, size)
+        _file_bytes += content.size(face)
+    return font
+
+def describe(font):
+    """Returns the (face, size) of a shared font. None for other fonts"""
+    return _names.get(font)
+
+@profiled("font", lambda face, size: "%s %s" % (face, size))
+def _load_font(face, size):
+    return pygame.font.Font(content.source(face), size)
+
+def font_stats():
+    """Returns how many fonts are live, how often one was asked for and the
+    size of the font files they were loaded from. The memory the loaded
+    fonts take up is not known."""
+    faces = set(face for face, size in _fonts)
+    return {"fonts": len(_fonts), "requests": _requests,
+        "file_bytes": _file_bytes, "faces": len(faces)}
@@ -4,13 +4,43 @@ import random
 
 import pygame
 
+from engine.profiling.startup import phase
+from engine.ui.draw.cache import SurfaceCache, image_cache
+from engine.ui.draw.disk import persistent
+from engine.ui.draw.simple import draw_image
+
+TEXTURE = "image/ui/texture.png"
+BORDER = "image/ui/border.png"
+
 # Used to draw seeded frames
 _random_seed = random.randint(0, sys.maxsize)
 
+# Every frame drawn so far. Callers get copies so they can draw on them.
+# Frames are also kept on disk between runs by the texture offset they were
+# drawn at, since the seeds mean something else in every run.
+frame_cache = SurfaceCache("frames", 32 * 1024 * 1024)
+
 def draw_highlight_frame(width, height, highlight, scale=4, borderwidth=1,
         seed=None):
     """draws a highlighted frame with a given colour"""
     scale = 4
+    if seed is None:
+        seed = _random_frame_seed(scale)
+    key = (width, height, scale, borderwidth, seed,
+        tuple(pygame.Color(highlight)))
+    cached = frame_cache.get(key)
+    if cached is not None:
+        return cached.copy()
+
+    frame = persistent(("highlight", width, height, scale, borderwidth,
+        _texture_offset(seed, scale), key[-1]), (TEXTURE, BORDER),
+        lambda: _draw_highlight_frame(width, height, highlight, scale,
+            borderwidth, seed))
+    frame_cache.put(key, frame)
+    return frame.copy()
+
+def _draw_highlight_frame(width, height, highlight, scale, borderwidth,
+        seed):
     frame = draw_frame(width, height, scale, borderwidth, seed)
     frame.fill(highlight, (0, 0, scale, frame.get_height()))
     frame.fill(highlight, (0, 0, frame.get_width(), scale))
@@ -36,26 +66,52 @@ def draw_highlight_frame(width, height, highlight, scale=4, borderwidth=1,
          (scale, scale)))
     return frame
 
+def load_texture(filename, scale):
+    """Returns a frame texture scaled up by scale. Loads that are not
+    cached are recorded as startup phases."""
+    if (filename, scale, False) in image_cache:
+        return draw_image(filename, scale, alpha=False)
+    with phase(filename, "texture"):
+        return draw_image(filename, scale, alpha=False)
+
+def _random_frame_seed(scale):
+    """Picks one of the seeds that give a distinct texture offset"""
+    return random.randint(0,
+        load_texture(TEXTURE, scale).get_width() // scale)
+
+def _texture_offset(seed, scale):
+    """Returns where in the texture a frame with the seed starts"""
+    texture = load_texture(TEXTURE, scale)
+    return (seed * _random_seed % texture.get_width(),
+        seed * _random_seed % texture.get_height())
+
 def draw_frame(width, height, scale=4, borderwidth=1, seed=None):
     """Method for drawing a frame surface."""
+    if seed is None:
+        seed = _random_frame_seed(scale)
+    key = (width, height, scale, borderwidth, seed, None)
+    surface = frame_cache.get(key)
+    if surface is None:
+        surface = persistent(("frame", width, height, scale, borderwidth,
+            _texture_offset(seed, scale)), (TEXTURE, BORDER),
+            lambda: _draw_frame(width, height, scale, borderwidth, seed))
+        frame_cache.put(key, surface)
+    return surface.copy()
+
+def _draw_frame(width, height, scale, borderwidth, seed):
+    """Draws a frame surface without looking in the cache"""
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
     surface.fill((0, 0, 0, 0))
 
-    texture = pygame.image.load("image/ui/texture.png").convert()
-    texture = pygame.transform.scale(texture,
-        (texture.get_width() * scale, texture.get_height() * scale))
-    border = pygame.image.load("image/ui/border.png").convert()
-    border = pygame.transform.scale(border,
-        (border.get_width() * scale, border.get_height() * scale))
+    texture = load_texture(TEXTURE, scale)
+    border = load_texture(BORDER, scale)
     border_vertical = pygame.transform.rotate(border, 90)
 
     texture_w = int(math.ceil(width / scale)) + 1
     texture_h = int(math.ceil(height / scale)) +1
 
-    if seed is None:
-        seed = random.randint(0, texture.get_width() // scale)
-    start_x = -(seed * _random_seed % texture.get_width())
-    start_y = -(seed * _random_seed % texture.get_height())
+    start_x, start_y = _texture_offset(seed, scale)
+    start_x, start_y = -start_x, -start_y
 
     # fill in texture
     for i in range(texture_w):
@@ -1,48 +1,87 @@
-from functools import lru_cache
-
 import pygame
 
+from engine.loader import loader, IMAGE
+from engine.ui.draw.atlas import atlas
+from engine.ui.draw.cache import image_cache
+from engine.ui.draw.disk import persistent, stored
+from engine.ui.draw.font import describe
+from engine.ui.draw.text import layout, cached_text
+
 LEFT = "left"
 RIGHT = "right"
 CENTER = "center"
 
-@lru_cache()
-def draw_image(filename, scale=1):
-    img = pygame.image.load(filename).convert_alpha()
-    return pygame.transform.scale(
-        img, (img.get_width() * scale, img.get_height() * scale))
+def draw_image(filename, scale=1, alpha=True):
+    """Returns the image scaled up by scale, from the sprite atlases when
+    it is in them. Without alpha it is converted to the display format
+    without per pixel alpha. Other images scaled up are kept on disk
+    between runs, including the ones the loader decoded."""
+    key = (filename, scale, alpha)
+    surface = image_cache.get(key)
+    if surface is None:
+        surface = atlas.sprite(filename, scale)
+        if surface is None:
+            if scale == 1:
+                surface = loader.image(filename, scale)
+            else:
+                surface = persistent(("image", filename, scale),
+                    (filename,), lambda: loader.image(filename, scale))
+        if not alpha:
+            surface = surface.convert()
+        image_cache.put(key, surface)
+    return surface
 
-def draw_text(text, font, colour, width=None, textwrap=True, justify=LEFT):
-    """Returns a drawn surface of a text given a font. """
-    if width is not None and width > 0:
-        # Text wrapping
-        lines = []
-        for paragraph in map(
-                lambda line: _word_wrap(line, width, font),
-                text.split('\n')):
-            lines.extend(paragraph)
-        height = sum(font.size(line)[1] for line in lines)
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        surface.fill((0, 0, 0, 0))
+def prefetch_image(filename, scale=1):
+    """Has the loader decode the image in the background unless it is
+    cached, in the sprite atlases or kept on disk"""
+    if (filename, scale, True) in image_cache or filename in atlas or \
+            (scale != 1 and stored(("image", filename, scale), (filename,))):
+        return
+    loader.request((IMAGE, filename, scale))
 
-        # drawing the line
-        line_height = 0
-        for line in lines:
-            tmp_line_surf = font.render(line, 1, colour)
-            if justify == LEFT:
-                surface.blit(tmp_line_surf, (0, line_height))
-            elif justify == RIGHT:
-                surface.blit(tmp_line_surf,
-                    (width - tmp_line_surf.get_width(), line_height))
-            elif justify == CENTER:
-                surface.blit(tmp_line_surf,
-                    ((width - tmp_line_surf.get_width()) // 2, line_height))
-            else:
-                raise ValueError("Invalid justify argument")
+def pin_image(filename, scale=1, alpha=True):
+    """Keeps the image from being evicted until unpin_images is called"""
+    image_cache.pin((filename, scale, alpha))
 
-            line_height += font.size(line)[1]
+def unpin_images():
+    image_cache.unpin()
+
+def draw_text(text, font, colour, width=None, textwrap=True, justify=LEFT,
+        persist=False):
+    """Returns a drawn surface of a text given a font. With persist the
+    text is kept on disk between runs, for labels that rarely change."""
+    if width is not None and width > 0:
+        if justify not in (LEFT, RIGHT, CENTER):
+            raise ValueError("Invalid justify argument")
+        key = (text, font, tuple(pygame.Color(colour)), width, justify)
+        draw = lambda: _draw_wrapped(text, font, colour, width, justify)
     else:
-        surface = font.render(text, 1, colour)
+        key = (text, font, tuple(pygame.Color(colour)), None, None)
+        draw = lambda: font.render(text, 1, colour)
+    name = describe(font)
+    if persist and name is not None:
+        return cached_text(key, lambda: persistent(("text", name) + key[:1]
+            + key[2:], name[:1], draw))
+    return cached_text(key, draw)
+
+def _draw_wrapped(text, font, colour, width, justify):
+    """Draws the text wrapped to width"""
+    lines = layout(text, width, font)
+    line_height = font.get_height()
+    surface = pygame.Surface((width, line_height * len(lines)),
+        pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+
+    # drawing the line
+    for i, line in enumerate(lines):
+        tmp_line_surf = font.render(line, 1, colour)
+        if justify == LEFT:
+            x = 0
+        elif justify == RIGHT:
+            x = width - tmp_line_surf.get_width()
+        else:
+            x = (width - tmp_line_surf.get_width()) // 2
+        surface.blit(tmp_line_surf, (x, i * line_height))
     return surface
 
 def draw_rect(width, height, colour):
@@ -50,17 +89,3 @@ def draw_rect(width, height, colour):
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
     surface.fill(colour)
     return surface
-
-def _word_wrap(text, width, font):
-    """Helper function. Breaks string into a list of strings based on width
-    specified"""
-    words = text.split(' ')
-    lines = []
-    cur_line = [words.pop(0)]
-    while words:
-        if font.size(' '.join(cur_line))[0] > width:
-            lines.append(' '.join(cur_line[:-1]))
-            cur_line = [cur_line[-1]]
-        cur_line.append(words.pop(0))
-    lines.append(' '.join(cur_line))
-    return lines
@@ -0,0 +1,57 @@
+"""Text layout used by draw_text. Word widths are measured once per font
+and rendered text is kept in a SurfaceCache."""
+from engine.ui.draw.cache import SurfaceCache
+
+WORD_CACHE_SIZE = 4096 # words remembered per font before starting over
+
+# Rendered text surfaces. Callers get copies so they can draw on them.
+text_cache = SurfaceCache("text", 8 * 1024 * 1024)
+
+# Word widths per font
+_widths = {}
+
+def word_width(font, word):
+    """Returns the width of a word in the font, measuring it only once"""
+    widths = _widths.get(font)
+    if widths is None or len(widths) > WORD_CACHE_SIZE:
+        widths = _widths[font] = {}
+    width = widths.get(word)
+    if width is None:
+        width = widths[word] = font.size(word)[0]
+    return width
+
+def wrap(text, width, font):
+    """Breaks a paragraph into lines no wider than width. A word wider than
+    width gets a line of its own."""
+    words = text.split(" ")
+    space = word_width(font, " ")
+    lines = []
+    line = [words[0]]
+    line_width = word_width(font, words[0])
+    for word in words[1:]:
+        current = word_width(font, word)
+        if line_width + space + current > width:
+            lines.append(" ".join(line))
+            line = [word]
+            line_width = current
+        else:
+            line.append(word)
+            line_width += space + current
+    lines.append(" ".join(line))
+    return lines
+
+def layout(text, width, font):
+    """Returns the wrapped lines of every paragraph of the text"""
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(wrap(paragraph, width, font))
+    return lines
+
+def cached_text(key, draw):
+    """Returns a copy of the surface cached under the key, calling draw to
+    make it on a miss"""
+    surface = text_cache.get(key)
+    if surface is None:
+        surface = draw()
+        text_cache.put(key, surface)
+    return surface.copy()
@@ -85,8 +85,7 @@ class AbstractButton(Renderable):
             self.refresh(game)
             self.dirty = False
 
-        prev_state = self.zone.state
-        self.zone.update(game)
+        prev_state = self.zone.update(game)
 
         # Handling
         if self.zone.state == Zone.CLICKED and prev_state == Zone.HOVERED:
@@ -6,6 +6,7 @@ from engine.system import Message
 from engine.ui.core.zone import Zone
 from engine.ui.element.abstractbutton import AbstractButton
 import engine.ui.draw as draw
+from engine.ui.draw.font import get_font
 
 class Button(AbstractButton):
     """Implemented AbstractButton to handle nice rendering. Does not
@@ -30,8 +31,7 @@ class Button(AbstractButton):
 
         # Create font
         self.draw_seed = random.randint(0, 100)
-        self.font = pygame.font.Font("assets/fonts/VT323-Regular.ttf",
-            self.size)
+        self.font = get_font(self.size)
 
         # Width defaults (width, height > text > None)
         if self.width and self.height:
@@ -1,6 +1,5 @@
-import pygame
-
 from engine.system import Message
+from engine.ui.draw.simple import draw_image
 from engine.ui.element.abstractslot import AbstractSlot
 
 class CastBarSlot(AbstractSlot):
@@ -38,42 +37,33 @@ class CastBarSlot(AbstractSlot):
             system.message("battle", Message("select-move", self.get()))
 
     def render_neutral(self, game):
-        surface = pygame.image.load(self.SLOTIMAGE).convert()
-        surface = pygame.transform.scale(surface, (surface.get_width()*3, surface.get_height()*3))
+        surface = draw_image(self.SLOTIMAGE, 3, alpha=False).copy()
         if self.value: # we draw the image on top
             if self.value.icon: # if we have a given icon
-                icon_image = pygame.image.load(self.value.icon).convert()
+                icon_image = draw_image(self.value.icon, 3, alpha=False)
             else: # do a default icon
-                icon_image = pygame.image.load(self.DEFAULTICON).convert()
-            icon_image = pygame.transform.scale(icon_image,
-                (icon_image.get_width()*3, icon_image.get_height()*3))
+                icon_image = draw_image(self.DEFAULTICON, 3, alpha=False)
             surface.blit(icon_image, (3, 3))
         return surface
 
     def render_hover(self, game):
         """Draw method when highlighted"""
-        surface = pygame.image.load(self.HIGHLIGHTIMAGE).convert()
-        surface = pygame.transform.scale(surface, (surface.get_width()*3, surface.get_height()*3))
+        surface = draw_image(self.HIGHLIGHTIMAGE, 3, alpha=False).copy()
         if self.value: # we draw the image on top
             # do some move blah blah....
             if self.value.icon: # if we have a given icon
-                icon_image = pygame.image.load(self.value.icon).convert()
+                icon_image = draw_image(self.value.icon, 3, alpha=False)
             else: # do a default icon
-                icon_image = pygame.image.load(self.DEFAULTICON).convert()
-            icon_image = pygame.transform.scale(icon_image,
-                (icon_image.get_width()*3, icon_image.get_height()*3))
+                icon_image = draw_image(self.DEFAULTICON, 3, alpha=False)
             surface.blit(icon_image, (3, 3))
         return surface
 
     def render_clicked(self, game):
-        surface = pygame.image.load(self.SLOTIMAGE).convert()
-        surface = pygame.transform.scale(surface, (surface.get_width()*3, surface.get_height()*3))
+        surface = draw_image(self.SLOTIMAGE, 3, alpha=False).copy()
         if self.value:
             if self.value.icon: # if we have a given icon
-                icon_image = pygame.image.load(self.value.icon).convert()
+                icon_image = draw_image(self.value.icon, 3, alpha=False)
             else: # do a default icon
-                icon_image = pygame.image.load(self.DEFAULTICON).convert()
-            icon_image = pygame.transform.scale(icon_image,
-                (icon_image.get_width()*3, icon_image.get_height()*3))
+                icon_image = draw_image(self.DEFAULTICON, 3, alpha=False)
             surface.blit(icon_image, (3, 3))
         return surface
\ No newline at end of file
@@ -7,16 +7,17 @@ from engine.system import Message
 
 from engine.ui.element.abstractbutton import AbstractButton
 from engine.ui.element.bar import PercentBar
+from engine.ui.core.binding import Binding, update_bindings
 import engine.ui.draw.frame as frame
 import engine.ui.draw.simple as simple
+from engine.ui.draw.font import get_font
 
 class CharacterCard(AbstractButton):
     """Manager for the character class"""
 
     def __init__(self, name, x, y, position):
         super().__init__(name, (x, y + 30, 280, 156))
-        self.font = pygame.font.Font("assets/fonts/VT323-Regular.ttf",
-            20)
+        self.font = get_font(20)
         self.set_size(280, 150)
         self.draw_seed = random.randint(0, 100)
         self.x = x
@@ -27,6 +28,12 @@ class CharacterCard(AbstractButton):
             simple.draw_rect(128, 8, (50, 255, 50)))
         self.action = PercentBar("player-action", x + 136, y + 56,
             simple.draw_rect(128, 8, (50, 100, 50)))
+        self.bindings = [
+            Binding(lambda c, alpha: c.get_cur_health() / c.get_stat("health"),
+                self.health.set_percent),
+            Binding(lambda c, alpha:
+                c.get_shown_action(alpha) / c.get_stat("action"),
+                self.action.set_percent)]
 
     def on_hovered(self, game, system):
         system.message("sound", Message("ui",
@@ -144,9 +151,6 @@ class CharacterCard(AbstractButton):
             self.character = game.party.get_player(self.position)
         if self.character is not None:
             super().render(surface, game, system)
-            self.health.set_percent(self.character.get_cur_health() / \
-                self.character.get_stat("health"))
-            self.action.set_percent(self.character.get_cur_action() / \
-                self.character.get_stat("action"))
+            update_bindings(self.bindings, self.character, system.alpha)
             self.health.render(surface, game, system)
             self.action.render(surface, game, system)
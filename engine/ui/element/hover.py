@@ -54,8 +54,7 @@ class Hover(Renderable):
             self.refresh(game)
             self.dirty = False
 
-        prev_state = self.zone.state
-        self.zone.update(game)
+        prev_state = self.zone.update(game)
 
         # Handling
         if self.zone.state != Zone.NEUTRAL and prev_state == Zone.NEUTRAL:
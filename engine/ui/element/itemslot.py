@@ -1,6 +1,5 @@
-import pygame
-
 from engine.system import Message
+from engine.ui.draw.simple import draw_image
 
 from engine.ui.element.abstractslot import AbstractSlot
 
@@ -32,42 +31,33 @@ class ItemSlot(AbstractSlot):
         return False
 
     def render_neutral(self, game):
-        surface = pygame.image.load(ItemSlot.SLOTIMAGE).convert()
-        surface = pygame.transform.scale(surface, (surface.get_width()*3, surface.get_height()*3))
+        surface = draw_image(ItemSlot.SLOTIMAGE, 3, alpha=False).copy()
         if self.value: # we draw the image on top
             if self.value.icon: # if we have a given icon
-                icon_image = pygame.image.load(self.value.icon).convert()
+                icon_image = draw_image(self.value.icon, 3, alpha=False)
             else: # do a default icon
-                icon_image = pygame.image.load(ItemSlot.DEFAULTICON).convert()
-            icon_image = pygame.transform.scale(icon_image,
-                (icon_image.get_width()*3, icon_image.get_height()*3))
+                icon_image = draw_image(ItemSlot.DEFAULTICON, 3, alpha=False)
             surface.blit(icon_image, (3, 3))
         return surface
 
     def render_hover(self, game):
         """Draw method when highlighted"""
-        surface = pygame.image.load(ItemSlot.HIGHLIGHTIMAGE).convert()
-        surface = pygame.transform.scale(surface, (surface.get_width()*3, surface.get_height()*3))
+        surface = draw_image(ItemSlot.HIGHLIGHTIMAGE, 3, alpha=False).copy()
         if self.value: # we draw the image on top
             # do some move blah blah....
             if self.value.icon: # if we have a given icon
-                icon_image = pygame.image.load(self.value.icon).convert()
+                icon_image = draw_image(self.value.icon, 3, alpha=False)
             else: # do a default icon
-                icon_image = pygame.image.load(ItemSlot.DEFAULTICON).convert()
-            icon_image = pygame.transform.scale(icon_image,
-                (icon_image.get_width()*3, icon_image.get_height()*3))
+                icon_image = draw_image(ItemSlot.DEFAULTICON, 3, alpha=False)
             surface.blit(icon_image, (3, 3))
         return surface
 
     def render_clicked(self, game):
-        surface = pygame.image.load(ItemSlot.SLOTIMAGE).convert()
-        surface = pygame.transform.scale(surface, (surface.get_width()*3, surface.get_height()*3))
+        surface = draw_image(ItemSlot.SLOTIMAGE, 3, alpha=False).copy()
         if self.cloneable and self.value:
             if self.value.icon: # if we have a given icon
-                icon_image = pygame.image.load(self.value.icon).convert()
+                icon_image = draw_image(self.value.icon, 3, alpha=False)
             else: # do a default icon
-                icon_image = pygame.image.load(ItemSlot.DEFAULTICON).convert()
-            icon_image = pygame.transform.scale(icon_image,
-                (icon_image.get_width()*3, icon_image.get_height()*3))
+                icon_image = draw_image(ItemSlot.DEFAULTICON, 3, alpha=False)
             surface.blit(icon_image, (3, 3))
         return surface
\ No newline at end of file
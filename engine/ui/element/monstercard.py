@@ -8,21 +8,28 @@ from engine.system import Message
 
 from engine.ui.element.abstractbutton import AbstractButton
 from engine.ui.element.bar import PercentBar
+from engine.ui.core.binding import Binding, update_bindings
 import engine.ui.draw.frame as frame
 import engine.ui.draw.simple as simple
+from engine.ui.draw.font import get_font
 
 class MonsterCard(AbstractButton):
     """Manager for the character class"""
 
     def __init__(self, name, x, y, monster):
         super().__init__(name, (x, y, 240, 156))
-        self.font = pygame.font.Font("assets/fonts/VT323-Regular.ttf",
-            20)
+        self.font = get_font(20)
         self.monster = monster
         self.base_x = x
         self.base_y = y
         self.health = PercentBar("player-health", x, y + 8, simple.draw_rect(160, 8, (50, 255, 50)))
         self.action = PercentBar("player-action", x, y + 20, simple.draw_rect(160, 8, (50, 100, 50)))
+        self.bindings = [
+            Binding(lambda m, alpha: m.get_cur_health() / m.get_stat("health"),
+                self.health.set_percent),
+            Binding(lambda m, alpha:
+                m.get_shown_action(alpha) / m.get_stat("action"),
+                self.action.set_percent)]
 
     def on_hovered(self, game, system):
         system.message("sound", Message("ui",
@@ -110,9 +117,6 @@ class MonsterCard(AbstractButton):
     def render(self, surface, game, system):
         if self.monster is not None:
             super().render(surface, game, system)
-            self.health.set_percent(self.monster.get_cur_health() / \
-                self.monster.get_stat("health"))
-            self.action.set_percent(self.monster.get_cur_action() / \
-                self.monster.get_stat("action"))
+            update_bindings(self.bindings, self.monster, system.alpha)
             self.health.render(surface, game, system)
             self.action.render(surface, game, system)
\ No newline at end of file
@@ -1,5 +1,4 @@
 import random
-import pygame
 
 from engine.system import Message
 
@@ -7,15 +6,15 @@ from engine.ui.element.abstractbutton import AbstractButton
 from engine.ui.element.itemslot import ItemSlot
 import engine.ui.draw.frame as frame
 import engine.ui.draw.simple as simple
+from engine.ui.draw.font import get_font
 
 class MoveCard(AbstractButton):
     """Handles the rendering of a single move in the level up manager"""
 
     def __init__(self, name, x, y, width, height):
         super().__init__(name, (x, y, width, height))
-        self.title_font = pygame.font.Font("assets/fonts/VT323-Regular.ttf",
-            40)
-        self.font = pygame.font.Font("assets/fonts/VT323-Regular.ttf", 20)
+        self.title_font = get_font(40)
+        self.font = get_font(20)
         self.move = None
         self.width = width
         self.height = height
@@ -2,16 +2,17 @@ import pygame
 
 from engine.ui.element.image import Image
 from engine.ui.draw.simple import draw_text
+from engine.ui.draw.font import get_font
 
 class Text(Image):
-    """Text object for displaying strings."""
+    """Text object for displaying strings. With persist the text it is
+    made with is kept on disk between runs, for labels that never change."""
 
     def __init__(self, name, x, y, text, size, colour=pygame.Color("white"),
-            width=None, justify="left"):
-        self.font = pygame.font.Font("assets/fonts/VT323-Regular.ttf",
-            size)
+            width=None, justify="left", persist=False):
+        self.font = get_font(size)
         surface = draw_text(text, self.font, colour,
-            width, True, justify)
+            width, True, justify, persist=persist)
         super().__init__(name, x, y, surface)
         self.text = text
         self.size = size
@@ -24,11 +25,16 @@ class Text(Image):
         self.dirty = dirty
 
     def set_colour(self, colour):
+        if colour == self.colour:
+            return
         self.colour = colour
         self.set_dirty(True)
 
     def set_text(self, text):
-        """Convenience function that will update the text for the object"""
+        """Convenience function that will update the text for the object.
+        Nothing is redrawn if the text is unchanged."""
+        if text == self.text:
+            return
         self.text = text
         self.set_dirty(True)
 
@@ -39,4 +45,5 @@ class Text(Image):
     def render(self, surface, game, system):
         if self.dirty:
             self.refresh(game)
+            self.dirty = False
         super().render(surface, game, system)
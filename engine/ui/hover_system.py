@@ -35,6 +35,7 @@ class HoverSystem(System):
             surface = pygame.display.get_surface()
             x, y = game.mouse_x, game.mouse_y
             pygame.draw.rect(surface, (255, 255, 255), (x-8, y-8, 16, 16))
+            self.game.mark_dirty((x-8, y-8, 16, 16))
 
     def dispatch(self, message, game):
         """Function for determining what action to call depending on the
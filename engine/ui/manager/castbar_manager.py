@@ -25,7 +25,7 @@ class CastBarManager(Manager):
             self.add_renderable(skill)
             self.add_renderable(element.Text("slot-text-%d" % i,
                 x + i * 56, y + 40, str(i + 1), 16, width=56,
-                justify="right"))
+                justify="right", persist=True))
 
     def set_player(self, player):
         for i, slot in enumerate(self.skill_elements):
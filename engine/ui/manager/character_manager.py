@@ -8,12 +8,15 @@ from engine.system import Message
 
 from engine.ui.draw.simple import draw_rect
 from engine.ui.core.manager import Manager
+from engine.ui.core.binding import Binding, update_bindings
 import engine.ui.element as element
 
 class CharacterManager(Manager):
     """Manages the rendering of the character card ui and all
     relevant variables and updates (inventory, moves, etc.)"""
 
+    retained = True
+
     _stat_text = \
         "Attack: \n" + \
         "Defense: \n" + \
@@ -40,6 +43,16 @@ class CharacterManager(Manager):
             draw_rect(128, 8, (50, 100, 50)))
         self.action_text = element.Text("action-text", x + 20, y + 172, "",
             16, width=132, justify="right")
+        self.bindings = [
+            Binding(lambda c, alpha: c.get_cur_health() / c.get_stat("health"),
+                self.health.set_percent),
+            Binding(lambda c, alpha:
+                c.get_shown_action(alpha) / c.get_stat("action"),
+                self.action.set_percent),
+            Binding(lambda c, alpha: "%d/%d" % (c.get_cur_health(),
+                c.get_stat("health")), self.health_text.set_text),
+            Binding(lambda c, alpha: "%d/%d" % (c.get_shown_action(alpha),
+                c.get_stat("action")), self.action_text.set_text)]
 
         self.add_renderable(element.Frame("frame", x, y, width,
             height))
@@ -51,11 +64,11 @@ class CharacterManager(Manager):
         self.add_renderable(self.image_element)
         self.add_renderable(self.stats_element)
         self.add_renderable(element.Text("health-btext", x + 20, y + 138,
-            "Health:", 16, width=132, justify="left"))
+            "Health:", 16, width=132, justify="left", persist=True))
         self.add_renderable(element.Text("action-btext", x + 20, y + 172,
-            "Action:", 16, width=132, justify="left"))
+            "Action:", 16, width=132, justify="left", persist=True))
         self.add_renderable(element.Text("stat-text", x + 16, y + 216,
-            self._stat_text, 18, width=132))
+            self._stat_text, 18, width=132, persist=True))
         self.add_renderable(element.Image("health-border", x + 16, y + 124,
             "image/ui/player_bar.png", 4))
         self.add_renderable(element.Image("action-border", x + 16, y + 158,
@@ -66,7 +79,7 @@ class CharacterManager(Manager):
             "", 20, width=200)
         self.add_renderable(self.shard_element)
         self.add_renderable(element.Text("required-text", x + 280, y + 16,
-            "Shards Required: ", 20, width=200))
+            "Shards Required: ", 20, width=200, persist=True))
         self.add_renderable(element.Button("level-up",
             self.level_up,
             text = "Level Up",
@@ -82,51 +95,59 @@ class CharacterManager(Manager):
         equipment_y = y + 16
         # Hand
         self.add_renderable(element.Text("text-hand1", equipment_x,
-            equipment_y + 56, "Hand", 16, width=54, justify="center"))
+            equipment_y + 56, "Hand", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["hand1"] = element.ItemSlot("equipment-hand1",
             equipment_x, equipment_y, "hand", None, self.update_stats())
 
         # Hand
         self.add_renderable(element.Text("text-hand2", equipment_x + 60,
-            equipment_y + 56, "Hand", 16, width=54, justify="center"))
+            equipment_y + 56, "Hand", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["hand2"] = element.ItemSlot("equipment-hand2",
             equipment_x + 60, equipment_y, "hand", None, self.update_stats())
 
         # Body
         self.add_renderable(element.Text("text-body", equipment_x,
-            equipment_y + 136, "Body", 16, width=54, justify="center"))
+            equipment_y + 136, "Body", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["body"] = element.ItemSlot("equipment-body",
             equipment_x, equipment_y + 80, "body", None, self.update_stats())
 
         # Legs
         self.add_renderable(element.Text("text-legs", equipment_x + 60,
-            equipment_y + 136, "Legs", 16, width=54, justify="center"))
+            equipment_y + 136, "Legs", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["legs"] = element.ItemSlot("equipment-legs",
             equipment_x + 60, equipment_y + 80, "legs", None,
             self.update_stats())
 
         # Feet
         self.add_renderable(element.Text("text-feet", equipment_x,
-            equipment_y + 216, "Feet", 16, width=54, justify="center"))
+            equipment_y + 216, "Feet", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["feet"] = element.ItemSlot("equipment-feet",
             equipment_x, equipment_y + 160, "feet", None, self.update_stats())
 
         # Head
         self.add_renderable(element.Text("text-head", equipment_x + 60,
-            equipment_y + 216, "Head", 16, width=54, justify="center"))
+            equipment_y + 216, "Head", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["head"] = element.ItemSlot("equipment-head",
             equipment_x + 60, equipment_y + 160, "head", None,
             self.update_stats())
 
         # Extra
         self.add_renderable(element.Text("text-extra1", equipment_x,
-            equipment_y + 296, "Extra", 16, width=54, justify="center"))
+            equipment_y + 296, "Extra", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["extra1"] = element.ItemSlot(
             "equipment-extra1", equipment_x, equipment_y + 240, "extra", None, self.update_stats())
 
         # Extra
         self.add_renderable(element.Text("text-extra2", equipment_x + 60,
-            equipment_y + 296, "Extra", 16, width=54, justify="center"))
+            equipment_y + 296, "Extra", 16, width=54, justify="center",
+            persist=True))
         self.equipment_elements["extra2"] = element.ItemSlot(
             "equipment-extra2", equipment_x + 60, equipment_y + 240, "extra",
             None, self.update_stats())
@@ -139,7 +160,7 @@ class CharacterManager(Manager):
         move_y = y + 152
         self.move_elements = []
         self.add_renderable(element.Text("moves-text", move_x + 4, move_y - 32,
-            "Abilities", 24, width=132, justify="left"))
+            "Abilities", 24, width=132, justify="left", persist=True))
         for i in range(12):
             item_element = element.MoveSlot("move-slot-%d" % i,
                 move_x + (i % 4) * 60, move_y + (i // 4) * 60, None)
@@ -178,16 +199,7 @@ class CharacterManager(Manager):
             self.character = game.current_player
 
         if self.character is not None:
-            self.health.set_percent(self.character.get_cur_health() /
-                self.character.get_stat("health"))
-            self.action.set_percent(self.character.get_cur_action() /
-                self.character.get_stat("action"))
-            self.health_text.set_text("%d/%d" % \
-                (self.character.get_cur_health(),
-                 self.character.get_stat("health")))
-            self.action_text.set_text("%d/%d" % \
-                (self.character.get_cur_action(),
-                 self.character.get_stat("action")))
+            update_bindings(self.bindings, self.character, system.alpha)
 
     def update_stats(self):
         def on_change(game, system):
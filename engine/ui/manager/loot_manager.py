@@ -10,6 +10,8 @@ import engine.ui.element as element
 class LootManager(Manager):
     """Deals with the travel UI when moving through the Dungeon"""
 
+    retained = True
+
     def __init__(self, x, y, width, height):
         """Travel manager handles the movement"""
         super().__init__("loot", x, y)
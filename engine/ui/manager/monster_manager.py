@@ -5,6 +5,7 @@ from engine.system import Message
 from engine.ui.core.manager import Manager
 from engine.ui.core.zone import Zone
 import engine.ui.element as element
+from engine.ui.draw.simple import draw_image
 
 class MonsterManager(Manager):
     """Manager for the monster class"""
@@ -17,10 +18,7 @@ class MonsterManager(Manager):
 
         # Load monster neutral image
         try:
-            raw_image = pygame.image.load( \
-                monster.graphic["neutral"]).convert_alpha()
-            raw_image = pygame.transform.scale(raw_image, \
-                (raw_image.get_width()*SCALE, raw_image.get_height()*SCALE))
+            raw_image = draw_image(monster.graphic["neutral"], SCALE)
         except pygame.error:
             raw_image = pygame.Surface((70*SCALE, 20*SCALE))
             raw_image.fill((255, 255, 255))
@@ -46,19 +44,16 @@ class MonsterManager(Manager):
         self.selection_element = element.Image(selection_image,
             x-raw_image.get_width()//2-5, y-raw_image.get_height()-80)
 
-        # Load monster hover image
+        # Load and store monster hover image
         try:
-            raw_image = pygame.image.load( \
-                monster.graphic["hover"]).convert_alpha()
+            self.hover_image = draw_image(monster.graphic["hover"], SCALE)
         except pygame.error:
             raw_image = pygame.Surface((70, 20))
             raw_image.fill((255, 255, 0))
             raw_image.blit(element.Text.draw(monster.name, 20, (0, 0, 0),
                            70*SCALE, element.Text.CENTER), (0, 10))
-
-        # Store hover image
-        self.hover_image = pygame.transform.scale(raw_image,
-            (raw_image.get_width()*SCALE, raw_image.get_height()*SCALE))
+            self.hover_image = pygame.transform.scale(raw_image,
+                (raw_image.get_width()*SCALE, raw_image.get_height()*SCALE))
 
         # Create text element
         self.text_element = element.Text(monster.name.title(), 20, x,
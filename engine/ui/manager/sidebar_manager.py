@@ -9,6 +9,8 @@ import engine.ui.element as element
 class SideBarManager(Manager):
     """Manages the side bars"""
 
+    retained = True
+
     def __init__(self, x, y, width):
         super().__init__("sidebar", x, y)
 
@@ -49,7 +51,7 @@ class SideBarManager(Manager):
         system.message("ui", Message("layout", "loot"))
         system.message("game", Message("select-player", None))
 
-    def render(self, surface, game, system):
+    def render_children(self, surface, game, system):
         if game.loot is not None:
             self.loot_button.render(surface, game, system)
         if game.current_location and game.current_location.room_type == "shop":
@@ -78,7 +78,9 @@ class TravelManager(Manager):
             node.visible = True
             node.set_ntype("unknown")
 
-        surface = self.lines.surface
+        # Drawn on a copy so the change is noticed by dirty rect rendering
+        surface = self.lines.surface.copy()
+        self.lines.set_surface(surface)
         for i, node in enumerate(self.path):
             frame = self.dungeon.frame[i+1]
             width = len(frame)+1
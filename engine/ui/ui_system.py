@@ -1,11 +1,24 @@
 """Implements the UI System"""
 import logging
+import time
 from collections import OrderedDict
 
 import pygame
 
 from engine.system import System, Message
 import engine.ui.manager as manager
+from engine.ui.core.dirty import DirtyRenderer
+from engine.ui.core.batch import RenderBatch
+from engine.loader import loader, IMAGE
+from engine.ui.draw.simple import prefetch_image, pin_image, unpin_images
+
+def party_portraits(game):
+    return [(IMAGE, player.portrait, 4) for player in game.party.players
+        if player is not None]
+
+def encounter_graphics(game):
+    return [(IMAGE, filename, 4) for monster in game.encounter
+        for filename in monster.graphic.values() if filename]
 
 class UISystem(System):
     """System responsible for handling game related events"""
@@ -21,11 +34,22 @@ class UISystem(System):
         "level" : ["background", "level"]
     }
 
+    # Assets loaded before a layout is shown, by layout. Entries are asset
+    # loader keys or functions of the game object returning a list of them.
+    prefetch = {
+        "scenario" : [party_portraits],
+        "battle" : [encounter_graphics]
+    }
+
+    PREFETCH_TIMEOUT = 0.5 # seconds a layout waits for its assets at most
+
     def __init__(self, game):
         super().__init__(game, "ui")
         self.managers = OrderedDict()
         self.image_stack = []
         self.rendering = []
+        self.dirty = DirtyRenderer()
+        self.next_layout = None # (layout, asset keys, time requested)
 
     def init(self, game):
         width, height = pygame.display.get_surface().get_size()
@@ -47,28 +71,80 @@ class UISystem(System):
             width // 2 - 400, 72, 552, 348)
         self.managers["party-info"] = manager.PartyInfoManager(
             width // 2 + 162, 72, 260, 348, game)
-        self.rendering = self.layouts["scenario"]
+        self.set_layout("scenario", self.prefetch_layout("scenario", game))
 
     def update(self, delta, game):
         messages = self.flush_messages()
         for message in messages:
             self.dispatch(message, game)
+        loader.finalize()
+        if self.next_layout is not None:
+            layout, keys, requested = self.next_layout
+            if loader.ready(keys) or \
+                    time.perf_counter() - requested > self.PREFETCH_TIMEOUT:
+                self.next_layout = None
+                self.set_layout(layout, keys)
 
         # Render Managers
         surface = pygame.display.get_surface()
-        surface.fill((0, 0, 0))
+        if self.game.dirty_rects:
+            # Managers render onto a recording that is only drawn where it
+            # differs from the last frame or was drawn over by other systems
+            target = self.dirty.record(surface)
+        else:
+            surface.fill((0, 0, 0))
+            target = surface
         for manager in self.rendering:
-            self.managers[manager].render(surface, game, self.game)
+            with self.game.profiler.measure("managers", manager):
+                if self.game.dirty_rects:
+                    # Replayed with Surface.blits by the DirtyRenderer
+                    self.managers[manager].render(target, game, self.game)
+                else:
+                    # Each manager is a layer drawn with one Surface.blits
+                    batch = RenderBatch(target)
+                    self.managers[manager].render(batch, game, self.game)
+                    batch.flush()
+        if self.game.dirty_rects:
+            self.game.present(self.dirty.render(target,
+                self.game.last_overlays))
 
-    def set_layout(self, layout):
+    def set_layout(self, layout, keys=()):
+        """Shows the layout. The images of the keys stay cached while it is
+        shown."""
         self.rendering = self.layouts[layout]
+        unpin_images()
+        for key in keys:
+            if key[0] == IMAGE:
+                pin_image(key[1], key[2])
+
+    def prefetch_layout(self, layout, game):
+        """Requests the assets the layout declares that are not cached.
+        Returns all their keys"""
+        keys = []
+        for entry in self.prefetch.get(layout, []):
+            if callable(entry):
+                keys.extend(entry(game))
+            else:
+                keys.append(entry)
+        for key in keys:
+            if key[0] == IMAGE:
+                prefetch_image(key[1], key[2])
+            else:
+                loader.request(key)
+        return keys
 
     def dispatch(self, message, game):
         """Function for determining what action to call depending on the
         message"""
         if message.mtype == "layout": # Travels the part
             layout = message.args[0]
-            self.set_layout(layout)
+            keys = self.prefetch_layout(layout, game)
+            if loader.ready(keys):
+                self.next_layout = None
+                self.set_layout(layout, keys)
+            else:
+                # Shown once its assets are decoded
+                self.next_layout = (layout, keys, time.perf_counter())
         elif message.mtype == "toggle":
             manager = message.args[0]
             if manager in self.rendering:
@@ -1,4 +1,12 @@
 #!python3.5
+import os
+
+# Keeps drawn frames, sprites and labels on disk between runs. Set it to
+# an empty value to turn that off.
+os.environ.setdefault("SURFACE_CACHE", "cache/surfaces")
+
+from engine.profiling import startup
+startup.start_from_environment()
 
 from engine.main_game import Game
 from engine.game.game_system import GameSystem
@@ -7,8 +15,11 @@ from engine.ui.ui_system import UISystem
 from engine.ui.hover_system import HoverSystem
 from engine.ui.animation_system import AnimationSystem
 from engine.sound.sound_system import SoundSystem
+from engine.serialization.registry import preload
 
-game = Game()
+# TICK_RATE is how many times a second battles are updated, 0 every frame
+game = Game(dirty_rects=True,
+    tick_rate=int(os.environ.get("TICK_RATE", 30)) or None)
 # attach systems
 game.add_system(GameSystem(game))
 game.add_system(BattleSystem(game))
@@ -17,4 +28,6 @@ game.add_system(HoverSystem(game))
 game.add_system(AnimationSystem(game))
 game.add_system(SoundSystem(game))
 
+# load the game data while the window opens
+preload(background=startup.get_profiler() is None)
 game.run()
\ No newline at end of file
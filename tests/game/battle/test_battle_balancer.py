@@ -0,0 +1,92 @@
+import unittest
+
+from engine.game.battle_balancer import BattleBalancer, BalanceReport, \
+    percentile
+from engine.game.battle_simulator import BattleResult
+from tests.game.battle.test_battle_simulator import Hero, Foe
+
+class FoeBalancer(BattleBalancer):
+    """Plays against Foes instead of monsters from the game data"""
+
+    def generate_monsters(self):
+        return [Foe("foe %d" % i) for i in range(self.challenge)]
+
+
+class TestPercentile(unittest.TestCase):
+
+    def test_nearest_rank(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 90), 5)
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertIsNone(percentile([], 50))
+
+
+class TestBalanceReport(unittest.TestCase):
+
+    def test_aggregate(self):
+        results = [
+            BattleResult("players", 10, [],
+                {"players": {"attack": 30}, "monsters": {"bite": 10}}),
+            BattleResult("players", 20, [],
+                {"players": {"attack": 30, "heal": 20}, "monsters": {}}),
+            BattleResult("monsters", 5, [],
+                {"players": {}, "monsters": {"bite": 30, "claw": 40}}),
+            BattleResult("players", 30, [],
+                {"players": {}, "monsters": {}})]
+        report = BalanceReport(results, (50, 90))
+        self.assertEqual(report.battles, 4)
+        self.assertEqual(report.win_rate, 0.75)
+        self.assertDictEqual(report.time_to_kill, {50: 20, 90: 30})
+        # Each side's moves are a share of that side's damage
+        self.assertDictEqual(report.move_damage, {
+            "players": {"attack": 0.75, "heal": 0.25},
+            "monsters": {"bite": 0.5, "claw": 0.5}})
+        self.assertIn("Win rate: 75.0%", str(report))
+        self.assertIn("claw: 50.0% of monsters damage", str(report))
+
+    def test_no_winner(self):
+        results = [BattleResult(None, 600, [],
+            {"players": {}, "monsters": {}})] * 2
+        report = BalanceReport(results, (50,))
+        self.assertEqual(report.win_rate, 0)
+        self.assertDictEqual(report.time_to_kill, {50: None})
+        self.assertDictEqual(report.move_damage,
+            {"players": {}, "monsters": {}})
+        self.assertIn("Time to kill p50: -", str(report))
+
+    def test_empty(self):
+        report = BalanceReport([], (50,))
+        self.assertEqual(report.battles, 0)
+        self.assertEqual(report.win_rate, 0)
+
+
+class TestBattleBalancer(unittest.TestCase):
+
+    def setUp(self):
+        self.balancer = FoeBalancer([Hero("hero")], "catacombs", 2,
+            processes=2)
+
+    def test_play_seeded(self):
+        first = self.balancer.play(3)
+        second = self.balancer.play(3)
+        self.assertEqual(first.duration, second.duration)
+        self.assertListEqual(first.damage, second.damage)
+        self.assertNotEqual(self.balancer.play(4).damage, first.damage)
+        # The party is copied for every battle
+        self.assertFalse(self.balancer.party[0].fallen)
+        self.assertEqual(self.balancer.party[0].action, 0)
+
+    def test_run_across_processes(self):
+        report = self.balancer.run(6, seed=10)
+        self.assertEqual(report.battles, 6)
+        self.assertEqual(report.win_rate, 1)
+        # Every battle plays out the same in the workers and in process
+        expected = BalanceReport([self.balancer.play(seed)
+            for seed in range(10, 16)], BattleBalancer.PERCENTILES)
+        self.assertDictEqual(report.time_to_kill, expected.time_to_kill)
+        self.assertDictEqual(report.move_damage, expected.move_damage)
+        single = FoeBalancer([Hero("hero")], "catacombs", 2, processes=1)
+        self.assertDictEqual(single.run(6, seed=10).move_damage,
+            report.move_damage)
@@ -0,0 +1,43 @@
+import unittest
+
+from engine.game.character.character import Character
+from engine.game.battle_scheduler import BattleScheduler
+from assets.effects.Stun import Stun
+
+class TestBattleScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = BattleScheduler()
+        self.character = Character("test")
+
+    def test_turn(self):
+        self.scheduler.add(self.character)
+        character, turn = self.scheduler.pop()
+        self.assertIs(character, self.character)
+        self.assertTrue(turn)
+        self.assertAlmostEqual(self.scheduler.now,
+            self.character.stats["action"] /
+            self.character.get_action_rate())
+
+    def test_stunned(self):
+        self.character.add_effect(Stun(2))
+        self.scheduler.add(self.character)
+        character, turn = self.scheduler.pop()
+        self.assertFalse(turn)
+        self.assertAlmostEqual(self.scheduler.now, 1)
+
+    def test_reschedule(self):
+        other = Character("other")
+        self.scheduler.add(self.character)
+        self.scheduler.add(other)
+        self.scheduler.schedule(self.character, 10)
+        character, turn = self.scheduler.pop()
+        self.assertIs(character, other)
+        character, turn = self.scheduler.pop()
+        self.assertIs(character, self.character)
+        self.assertIsNone(self.scheduler.pop())
+
+    def test_fallen(self):
+        self.character.hard_kill()
+        self.scheduler.add(self.character)
+        self.assertIsNone(self.scheduler.pop())
@@ -0,0 +1,61 @@
+import unittest
+
+from engine.game.character.character import Character
+from engine.game.move.move import Move
+from engine.game.battle_simulator import BattleSimulator
+from assets.moves.components.Damage import Damage
+from assets.moves.components.SingleCast import SingleCast
+from assets.moves.components.RandomEnemyCast import RandomEnemyCast
+from assets.moves.components.TargetOneOnly import TargetOneOnly
+from assets.moves.components.EnemiesOnly import EnemiesOnly
+
+class Hero(Character):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.add_move(Move("attack", components=[SingleCast(),
+            TargetOneOnly(), EnemiesOnly(), Damage(20, "physical")]))
+
+
+class Foe(Character):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.add_move(Move("bite", components=[RandomEnemyCast(),
+            Damage(5, "physical")]))
+
+    def handle_battle(self, delta, game, system):
+        super().handle_battle(delta, game, system)
+        if self.ready:
+            self.selected_move = self.moves[0]
+
+
+class TestBattleSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.simulator = BattleSimulator()
+
+    def test_players_win(self):
+        result = self.simulator.run([Hero("hero")], [Foe("foe")])
+        self.assertEqual(result.winner, "players")
+        self.assertTrue(result.duration > 0)
+
+    def test_damage(self):
+        players = [Hero("hero")]
+        monsters = [Foe("foe 1"), Foe("foe 2")]
+        result = self.simulator.run(players, monsters)
+        names = [name for name, damage in result.damage]
+        self.assertListEqual(names, ["hero", "foe 1", "foe 2"])
+        self.assertGreaterEqual(result.damage[0][1],
+            sum(m.stats["health"] for m in monsters))
+
+    def test_timeout(self):
+        simulator = BattleSimulator(max_duration=1)
+        result = simulator.run([Hero("hero")], [Foe("foe")])
+        self.assertIsNone(result.winner)
+
+    def test_scheduled(self):
+        simulator = BattleSimulator(scheduled=True)
+        result = simulator.run([Hero("hero")], [Foe("foe 1"), Foe("foe 2")])
+        self.assertEqual(result.winner, "players")
+        self.assertEqual(result.moves["players"]["attack"], result.damage[0][1])
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy
+
+from engine.game.battle_simulator import BattleSimulator
+from engine.game.vector_simulator import VectorBattleSimulator, BattleArrays
+from assets.effects.DoT import DoT
+from assets.effects.Stun import Stun
+from tests.game.battle.test_battle_simulator import Hero, Foe
+
+class TestVectorBattleSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.simulator = VectorBattleSimulator(seed=0)
+
+    def test_matches_simulator(self):
+        expected = BattleSimulator().run([Hero("hero")], [Foe("foe")])
+        result = self.simulator.run([Hero("hero")], [Foe("foe")])
+        self.assertEqual(result.winner, expected.winner)
+        self.assertListEqual(result.damage, expected.damage)
+        self.assertAlmostEqual(result.duration, expected.duration,
+            delta=BattleSimulator.TIMESTEP * 2)
+
+    def test_run_all(self):
+        encounters = [([Hero("hero")], [Foe("foe %d" % i)])
+            for i in range(10)]
+        results = self.simulator.run_all(encounters)
+        self.assertEqual(len(results), 10)
+        for i, result in enumerate(results):
+            self.assertEqual(result.winner, "players")
+            self.assertEqual(result.damage[1][0], "foe %d" % i)
+
+    def test_damage_over_time(self):
+        hero = Hero("hero")
+        hero.add_effect(DoT("poison", 6, 5, 1))
+        arrays = BattleArrays([([hero], [Foe("foe")])], 1)
+        live = numpy.ones(2, dtype=bool)
+        for i in range(int(round(2 / self.simulator.timestep))):
+            self.simulator.advance(arrays, live)
+        self.assertEqual(arrays.health[0], hero.stats["health"] - 12)
+        self.assertAlmostEqual(arrays.duration[0, 0], 3)
+
+    def test_effects_expire(self):
+        hero = Hero("hero")
+        hero.add_effect(Stun(1))
+        arrays = BattleArrays([([hero], [Foe("foe")])], 1)
+        self.assertEqual(arrays.rate[0], 0)
+        live = numpy.ones(2, dtype=bool)
+        for i in range(int(round(1 / self.simulator.timestep)) + 1):
+            self.simulator.advance(arrays, live)
+        self.assertFalse(arrays.used[0, 0])
+        self.assertListEqual(hero.effects, [])
+        self.assertGreater(arrays.rate[0], 0)
@@ -0,0 +1,96 @@
+import pickle
+import unittest
+
+from engine.game.character.character import Character
+from engine.game.effect.effect import Effect
+from engine.game.item.item import Item
+from engine.game.player.player import Player
+from assets.effects.StatChange import StatChange
+from assets.effects.StatChangeTilMove import StatChangeTilMove
+
+class Growing(Effect):
+    """Effect whose attack bonus grows every time it is asked for"""
+
+    cacheable = False
+
+    def __init__(self):
+        super().__init__("growing", Effect.PERMANENT)
+        self.bonus = 0
+
+    def on_get_stat(self, value, stat_type):
+        self.bonus += 1
+        return value + self.bonus
+
+
+class TestStatCache(unittest.TestCase):
+
+    def setUp(self):
+        self.character = Character("test")
+
+    def test_cached(self):
+        self.assertEqual(self.character.get_stat("attack"), 10)
+        self.character.stats["attack"] = 20
+        self.assertEqual(self.character.get_stat("attack"), 10)
+        self.character.invalidate_stats()
+        self.assertEqual(self.character.get_stat("attack"), 20)
+
+    def test_add_remove_effect(self):
+        self.assertEqual(self.character.get_stat("attack"), 10)
+        self.character.add_effect(StatChange("strong", 5, "attack", 2))
+        self.assertEqual(self.character.get_stat("attack"), 15)
+        self.character.remove_effect("strong")
+        self.assertEqual(self.character.get_stat("attack"), 10)
+
+    def test_decrease_durations(self):
+        self.character.add_effect(StatChange("strong", 5, "attack", 2))
+        self.assertEqual(self.character.get_stat("attack"), 15)
+        self.character.decrease_durations(1)
+        self.assertEqual(self.character.get_stat("attack"), 15)
+        self.character.decrease_durations(1)
+        self.assertEqual(self.character.get_stat("attack"), 10)
+
+    def test_effect_removed(self):
+        self.character.add_effect(StatChangeTilMove("focus", 5, "magic"))
+        self.assertEqual(self.character.get_stat("magic"), 15)
+        self.character.effects[0].on_cast(self.character, None)
+        self.assertEqual(self.character.get_stat("magic"), 10)
+
+    def test_cleanse(self):
+        self.character.add_effect(StatChange("strong", 5, "attack", 2))
+        self.assertEqual(self.character.get_stat("attack"), 15)
+        self.character.cleanse()
+        self.assertEqual(self.character.get_stat("attack"), 10)
+
+    def test_not_cacheable(self):
+        self.character.add_effect(Growing())
+        self.assertEqual(self.character.get_stat("attack"), 11)
+        self.assertEqual(self.character.get_stat("attack"), 12)
+
+
+class TestEquipment(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player("test")
+        self.sword = Item("sword", "weapon", self.stats(attack=5), "hand")
+
+    def stats(self, **stats):
+        values = dict.fromkeys(self.player.stats, 0)
+        values.update(stats)
+        return values
+
+    def test_swap(self):
+        axe = Item("axe", "weapon", self.stats(attack=8), "hand")
+        self.assertEqual(self.player.get_stat("attack"), 10)
+        # The way item slots change equipment
+        self.player.equipment["hand1"] = self.sword
+        self.assertEqual(self.player.get_stat("attack"), 15)
+        self.player.equipment["hand1"] = axe
+        self.assertEqual(self.player.get_stat("attack"), 18)
+        self.player.equipment["hand1"] = None
+        self.assertEqual(self.player.get_stat("attack"), 10)
+
+    def test_pickled(self):
+        player = pickle.loads(pickle.dumps(self.player))
+        self.assertEqual(player.get_stat("attack"), 10)
+        player.equipment["hand2"] = self.sword
+        self.assertEqual(player.get_stat("attack"), 15)
@@ -0,0 +1,51 @@
+from unittest import mock
+import unittest
+import tempfile
+import shutil
+import time
+import os
+
+from engine.serialization.registry import LazyData, lazy, preload
+from engine.serialization.serialization import serialize
+from engine.serialization.dmanager import DataManager
+
+class TestLazyData(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "moves.p")
+        serialize({"attack": 1, "heal": 2}, self.filename)
+
+    def tearDown(self):
+        DataManager.cache.pop(self.filename, None)
+        shutil.rmtree(self.directory)
+
+    def test_lazy(self):
+        data = LazyData(self.filename)
+        self.assertFalse(data.loaded())
+        self.assertEqual(data["heal"], 2)
+        self.assertTrue(data.loaded())
+        self.assertListEqual(sorted(data), ["attack", "heal"])
+
+    def test_shared(self):
+        self.assertIs(lazy(self.filename), lazy(self.filename))
+
+    def test_preload(self):
+        data = lazy(self.filename)
+        preload([self.filename]).join()
+        self.assertTrue(data.loaded())
+        self.assertIs(data.get_data(), DataManager.cache[self.filename])
+
+    def test_preload_race(self):
+        import engine.serialization.dmanager as dmanager
+        loads = []
+        def slow_load(filename):
+            loads.append(filename)
+            time.sleep(0.05)
+            return {"attack": 1}
+        with mock.patch.object(dmanager, "load", slow_load):
+            thread = preload([self.filename])
+            manager = DataManager(self.filename)
+            thread.join()
+        self.assertEqual(len(loads), 1)
+        self.assertIs(manager.get(), lazy(self.filename).get_data())
@@ -0,0 +1,65 @@
+import unittest
+import sqlite3
+import tempfile
+import shutil
+import os
+
+from engine.serialization.store import DataStore
+from engine.serialization.serialization import serialize
+
+class TestDataStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = DataStore(os.path.join(self.directory, "game.db"),
+            self.directory)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_version(self):
+        self.assertEqual(self.store.version(), DataStore.SCHEMA_VERSION)
+
+    def test_newer_version(self):
+        filename = os.path.join(self.directory, "newer.db")
+        connection = sqlite3.connect(filename)
+        connection.execute("PRAGMA user_version = %d"
+            % (DataStore.SCHEMA_VERSION + 1))
+        connection.close()
+        with self.assertRaises(ValueError):
+            DataStore(filename, self.directory)
+
+    def test_collection(self):
+        filename = os.path.join(self.directory, "item", "items.p")
+        self.assertEqual(self.store.collection(filename), "item/items")
+        self.assertIsNone(self.store.collection("elsewhere/items.p"))
+
+    def test_import_pickle(self):
+        filename = os.path.join(self.directory, "moves.p")
+        serialize({"attack": 1, "heal": 2}, filename)
+        self.assertEqual(self.store.import_pickle(filename), "moves")
+        self.assertListEqual(self.store.keys("moves"), ["attack", "heal"])
+        self.assertEqual(self.store.get("moves", "heal"), 2)
+        self.assertDictEqual(self.store.load("moves"), {"attack": 1,
+            "heal": 2})
+
+    def test_value(self):
+        self.store.write("floors", ["any", "catacombs"])
+        self.assertListEqual(self.store.load("floors"), ["any", "catacombs"])
+
+    def test_put(self):
+        self.store.write("moves", {"attack": 1})
+        self.store.put("moves", "heal", 2)
+        self.store.put("moves", "attack", 3)
+        self.assertDictEqual(self.store.load("moves"), {"attack": 3,
+            "heal": 2})
+        self.store.delete("moves", "attack")
+        self.assertListEqual(self.store.keys("moves"), ["heal"])
+        with self.assertRaises(KeyError):
+            self.store.get("moves", "attack")
+
+    def test_write_removes(self):
+        self.store.write("moves", {"attack": 1, "heal": 2})
+        self.store.write("moves", {"heal": 2})
+        self.assertDictEqual(self.store.load("moves"), {"heal": 2})
@@ -0,0 +1,65 @@
+import io
+import os
+import tempfile
+import unittest
+
+import dill as pickle
+import pygame
+
+from engine import content
+from engine.content import ContentPack, build
+from engine.serialization.serialization import deserialize
+
+class TestContentPack(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.data = os.path.join(self.directory.name, "values.p")
+        with open(self.data, "wb") as file:
+            pickle.dump({"a": 1, "b": [2, 3]}, file)
+        self.filename = os.path.join(self.directory.name, "content.pak")
+        self.index = build(self.filename, ("image/ui/slot.png",
+            "data/sound/click.wav", self.data))
+        self.pack = ContentPack(self.filename)
+
+    def tearDown(self):
+        content.set_pack(None)
+        self.pack.close()
+        self.directory.cleanup()
+
+    def test_index(self):
+        self.assertIn("image/ui/slot.png", self.pack)
+        self.assertIn("./image/ui/slot.png", self.pack)
+        self.assertNotIn("image/ui/health.png", self.pack)
+        self.assertEqual(self.pack.size("data/sound/click.wav"),
+            os.path.getsize("data/sound/click.wav"))
+        with open("image/ui/slot.png", "rb") as file:
+            self.assertEqual(self.pack.open("image/ui/slot.png").read(),
+                file.read())
+
+    def test_file(self):
+        file = self.pack.open("data/sound/click.wav")
+        self.assertEqual(file.read(4), b"RIFF")
+        file.seek(0, io.SEEK_END)
+        self.assertEqual(file.tell(), self.pack.size("data/sound/click.wav"))
+        file.seek(0)
+        buffer = bytearray(4)
+        self.assertEqual(file.readinto(buffer), 4)
+        self.assertEqual(bytes(buffer), b"RIFF")
+
+    def test_image(self):
+        image = pygame.image.load(self.pack.open("image/ui/slot.png"),
+            "image/ui/slot.png")
+        self.assertEqual(image.get_size(),
+            pygame.image.load("image/ui/slot.png").get_size())
+
+    def test_deserialize(self):
+        content.set_pack(self.pack)
+        with self.assertRaises(FileNotFoundError):
+            deserialize("missing.p")
+        os.rename(self.data, self.data + ".moved")
+        self.assertEqual(deserialize(self.data), {"a": 1, "b": [2, 3]})
+        self.assertEqual(self.pack.stats()["opens"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from engine.main_game import Game
+from engine.system import System
+from engine.game.character.character import Character
+
+class Recorder(System):
+
+    def __init__(self, game, name, simulated):
+        super().__init__(game, name)
+        self.simulated = simulated
+        self.deltas = []
+        self.frames = []
+
+    def update(self, delta, game):
+        self.deltas.append(delta)
+
+    def update_frame(self, delta, game):
+        self.frames.append(delta)
+
+
+class TestFixedTimestep(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(tick_rate=20)
+        self.battle = Recorder(self.game, "battle", True)
+        self.ui = Recorder(self.game, "ui", False)
+        self.game.add_system(self.battle)
+        self.game.add_system(self.ui)
+
+    def test_ticks(self):
+        for delta in (16, 16, 16, 16):
+            self.game.update(delta, None)
+        # 64ms is one 50ms tick and 14ms left over
+        self.assertListEqual(self.battle.deltas, [50])
+        self.assertListEqual(self.ui.deltas, [16, 16, 16, 16])
+        # Input is still handled every frame
+        self.assertListEqual(self.battle.frames, [16, 16, 16, 16])
+        self.assertAlmostEqual(self.game.alpha, 14 / 50)
+
+    def test_same_simulation(self):
+        # Slow and fast frames run the same ticks for the same time
+        slow = self.battle
+        for i in range(3):
+            self.game.update(100, None)
+        game = Game(tick_rate=20)
+        fast = Recorder(game, "battle", True)
+        game.add_system(fast)
+        for i in range(30):
+            game.update(10, None)
+        self.assertListEqual(slow.deltas, fast.deltas)
+        self.assertEqual(self.game.ticks, 6)
+
+    def test_max_ticks(self):
+        self.game.update(10000, None)
+        self.assertEqual(len(self.battle.deltas), Game.MAX_TICKS)
+        self.assertEqual(self.game.alpha, 0)
+
+    def test_variable(self):
+        game = Game()
+        system = Recorder(game, "battle", True)
+        game.add_system(system)
+        game.update(16, None)
+        self.assertListEqual(system.deltas, [16])
+        self.assertEqual(game.alpha, 1)
+
+
+class TestShownAction(unittest.TestCase):
+
+    def test_interpolated(self):
+        character = Character("test")
+        character.previous_action = 20
+        character.action = 40
+        self.assertEqual(character.get_shown_action(0), 20)
+        self.assertEqual(character.get_shown_action(0.5), 30)
+        self.assertEqual(character.get_shown_action(), 40)
+        # Spent action is not drawn going back down
+        character.previous_action = 100
+        character.action = 0
+        self.assertEqual(character.get_shown_action(0.5), 0)
@@ -0,0 +1,63 @@
+import unittest
+import tempfile
+import shutil
+import json
+import csv
+import os
+
+import pygame
+
+from engine.profiling.frame import FrameProfiler
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = FrameProfiler(window=2)
+        self.directory = tempfile.mkdtemp()
+        for i in range(3):
+            self.profiler.start_frame()
+            with self.profiler.measure("systems", "ui"):
+                with self.profiler.measure("managers", "party"):
+                    pass
+            self.profiler.count_message("ui")
+            self.profiler.count_message("ui")
+            self.profiler.end_frame()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_window(self):
+        self.assertEqual(len(self.profiler.frames), 2)
+        self.assertEqual(self.profiler.frames[0]["frame"], 1)
+
+    def test_averages(self):
+        self.assertDictEqual(self.profiler.averages("messages"), {"ui": 2})
+        systems = self.profiler.averages("systems")
+        managers = self.profiler.averages("managers")
+        self.assertGreaterEqual(systems["ui"], managers["party"])
+
+    def test_csv(self):
+        filename = os.path.join(self.directory, "frames.csv")
+        self.profiler.write(filename)
+        with open(filename) as file:
+            rows = list(csv.reader(file))
+        self.assertListEqual(rows[0], ["frame", "time", "systems:ui",
+            "managers:party", "messages:ui"])
+        self.assertEqual(len(rows), 3)
+
+    def test_json(self):
+        filename = os.path.join(self.directory, "frames.json")
+        self.profiler.write(filename)
+        with open(filename) as file:
+            frames = json.load(file)
+        self.assertEqual(frames[1]["messages"]["ui"], 2)
+
+    def test_overlay(self):
+        pygame.font.init()
+        surface = pygame.Surface((640, 480))
+        surface.fill((255, 255, 255))
+        self.profiler.render(surface)
+        self.assertEqual(surface.get_at((630, 6)), (255, 255, 255, 255))
+        self.profiler.toggle_overlay()
+        self.profiler.render(surface)
+        self.assertNotEqual(surface.get_at((630, 6)), (255, 255, 255, 255))
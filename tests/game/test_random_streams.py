@@ -0,0 +1,43 @@
+import unittest
+
+from engine.game.random_streams import RandomStreams, set_streams, \
+    get_streams, stream, COMBAT, LOOT, MAP
+from engine.game.battle_simulator import BattleSimulator
+from tests.game.battle.test_battle_simulator import Hero, Foe
+
+class TestRandomStreams(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = get_streams()
+
+    def tearDown(self):
+        set_streams(self.previous)
+
+    def test_same_seed(self):
+        first = RandomStreams(42)
+        second = RandomStreams(42)
+        for name in (COMBAT, LOOT, MAP):
+            self.assertListEqual(
+                [first.get(name).random() for i in range(10)],
+                [second.get(name).random() for i in range(10)])
+
+    def test_independent(self):
+        first = RandomStreams(42)
+        second = RandomStreams(42)
+        for i in range(100):
+            first.get(COMBAT).random()
+        self.assertEqual(first.get(LOOT).random(), second.get(LOOT).random())
+
+    def test_set_streams(self):
+        streams = RandomStreams(7)
+        set_streams(streams)
+        self.assertIs(stream(MAP), streams.get(MAP))
+
+    def test_reproducible_battle(self):
+        results = []
+        for i in range(2):
+            set_streams(RandomStreams(3))
+            result = BattleSimulator().run([Hero("hero")],
+                [Foe("foe 1"), Foe("foe 2")])
+            results.append((result.winner, result.duration, result.damage))
+        self.assertEqual(results[0], results[1])
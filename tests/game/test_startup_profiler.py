@@ -0,0 +1,85 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+
+import pygame
+
+from engine.profiling import startup
+from engine.profiling.startup import StartupProfiler, ImportTimer
+from engine.ui.draw.frame import load_texture
+from engine.ui.draw.simple import image_cache
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = StartupProfiler({"data": 0, "fonts": 1000})
+
+    def tearDown(self):
+        self.profiler.finish()
+
+    def test_nested(self):
+        with self.profiler.phase("outer", "data"):
+            with self.profiler.phase("inner", "import"):
+                list(range(10000))
+        outer, inner = self.profiler.phases
+        self.assertEqual(inner["depth"], 1)
+        self.assertGreaterEqual(outer["seconds"], inner["seconds"])
+        self.assertAlmostEqual(outer["self_seconds"],
+            outer["seconds"] - inner["seconds"])
+        self.assertAlmostEqual(sum(self.profiler.categories().values()),
+            outer["seconds"])
+
+    def test_violations(self):
+        with self.profiler.phase("outer", "data"):
+            list(range(10000))
+        keys = [key for key, milliseconds, budget
+            in self.profiler.violations()]
+        self.assertListEqual(keys, ["data"])
+        self.assertEqual(len(self.profiler.report()["violations"]), 1)
+
+    def test_profiled(self):
+        @startup.profiled("test", lambda value: "double %d" % value)
+        def double(value):
+            return value * 2
+
+        self.assertEqual(double(2), 4)
+        startup._profiler = self.profiler
+        try:
+            self.assertEqual(double(3), 6)
+        finally:
+            startup._profiler = None
+        self.assertEqual(self.profiler.phases[0]["name"], "double 3")
+
+    def test_texture(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filename = os.path.join(directory.name, "texture.png")
+        pygame.image.save(pygame.Surface((2, 2)), filename)
+        image_cache.clear()
+        self.addCleanup(image_cache.clear)
+        startup._profiler = self.profiler
+        try:
+            load_texture(filename, 2)
+            # Cached textures are not recorded again
+            load_texture(filename, 2)
+        finally:
+            startup._profiler = None
+        self.assertListEqual([(record["name"], record["category"])
+            for record in self.profiler.phases], [(filename, "texture")])
+
+    def test_imports(self):
+        module = sys.modules.pop("engine.game.battle_scheduler", None)
+        timer = ImportTimer(self.profiler)
+        sys.meta_path.insert(0, timer)
+        try:
+            importlib.import_module("engine.game.battle_scheduler")
+        finally:
+            sys.meta_path.remove(timer)
+            if module is not None:
+                sys.modules["engine.game.battle_scheduler"] = module
+        names = [record["name"] for record in self.profiler.phases]
+        self.assertIn("engine.game.battle_scheduler", names)
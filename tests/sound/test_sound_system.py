@@ -0,0 +1,67 @@
+from unittest import mock
+import os
+import unittest
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from pygame import mixer
+
+from engine.sound.cache import SoundCache
+from engine.sound.sound_system import SoundSystem
+from engine.system import Message
+
+class TestSoundSystem(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        mixer.init(44100, -16, 2, 2048)
+
+    @classmethod
+    def tearDownClass(cls):
+        mixer.quit()
+
+    def setUp(self):
+        self.system = SoundSystem(None)
+        self.system.init(None)
+        self.system.set_bg("data/sound/click.wav")
+
+    def test_cache(self):
+        self.system.cache.budget = 1
+        self.system.message(Message("play", "data/sound/drop-off.wav"))
+        self.system.message(Message("play", "data/sound/pick-up.wav"))
+        self.system.message(Message("play", "data/sound/pick-up.wav"))
+        self.system.update(0, None)
+        stats = self.system.stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["entries"], 1)
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_music_fades(self):
+        self.system.update(0, None)
+        self.assertEqual(self.system.music, "data/sound/click.wav")
+        self.system.update(SoundSystem.FADE, None)
+        self.assertEqual(self.system.volume, 1)
+        self.system.message(Message("bg", "data/sound/drop-off.wav"))
+        self.system.update(SoundSystem.FADE // 2, None)
+        self.assertEqual(self.system.volume, 0.5)
+        self.assertEqual(self.system.music, "data/sound/click.wav")
+        self.system.update(SoundSystem.FADE // 2, None)
+        self.system.update(0, None)
+        self.assertEqual(self.system.music, "data/sound/drop-off.wav")
+        self.assertEqual(self.system.volume, 0)
+
+    def test_same_music(self):
+        self.system.update(SoundSystem.FADE, None)
+        self.system.set_bg("data/sound/click.wav")
+        self.assertIsNone(self.system.next_music)
+
+    def test_bytes_without_mixer(self):
+        sound = self.system.load_sound("data/sound/click.wav")
+        self.assertGreater(SoundCache.get_bytes(sound), 0)
+        with mock.patch.object(mixer, "get_init", return_value=None):
+            self.assertEqual(SoundCache.get_bytes(sound), 0)
+
+if __name__ == '__main__':
+    unittest.main()
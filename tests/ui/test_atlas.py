@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from engine.ui.draw.atlas import Atlas, build, pack
+from engine.ui.draw.cache import SurfaceCache
+
+class TestAtlas(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.index = os.path.join(self.directory.name, "index.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pack(self):
+        sizes = [(30, 10), (30, 20), (30, 20), (30, 5)]
+        self.assertListEqual(pack(sizes, 64, 40),
+            [(0, 0, 20), (0, 0, 0), (0, 30, 0), (0, 30, 20)])
+        self.assertListEqual(pack(sizes, 64, 24),
+            [(1, 0, 0), (0, 0, 0), (0, 30, 0), (1, 30, 0)])
+
+    def test_sprites(self):
+        data = build(("image/icon", "image/ui"), self.index)
+        self.assertEqual(len(data["atlases"]), 2)
+        atlas = Atlas(self.index, SurfaceCache("test", 64 * 1024 * 1024))
+        self.assertIn("image/ui/slot.png", atlas)
+        self.assertNotIn("image/ui/catacomb-background-COPYRIGHTED.jpg",
+            atlas)
+        for scale in (1, 3):
+            sprite = atlas.sprite("image/ui/slot.png", scale)
+            image = pygame.image.load("image/ui/slot.png").convert_alpha()
+            image = pygame.transform.scale(image,
+                (image.get_width() * scale, image.get_height() * scale))
+            self.assertIsNotNone(sprite.get_parent())
+            self.assertEqual(pygame.image.tostring(sprite, "RGBA"),
+                pygame.image.tostring(image, "RGBA"))
+        self.assertEqual(atlas.stats()["pages"], 2)
+
+    def test_no_index(self):
+        atlas = Atlas(self.index)
+        self.assertIsNone(atlas.sprite("image/ui/slot.png"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import pygame
+
+from engine.ui.core.batch import RenderBatch
+from engine.ui.core.dirty import RecordingSurface, replay
+
+class TestRenderBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = pygame.Surface((100, 100))
+        self.batch = RenderBatch(self.surface)
+        self.red = pygame.Surface((10, 10))
+        self.red.fill((255, 0, 0))
+        self.blue = pygame.Surface((10, 10))
+        self.blue.fill((0, 0, 255))
+
+    def test_queued(self):
+        self.batch.blit(self.red, (0, 0))
+        self.batch.blit(self.blue, (5, 5))
+        self.assertEqual(self.surface.get_at((7, 7)), (0, 0, 0, 255))
+        self.batch.flush()
+        self.assertEqual(self.batch.flushes, 1)
+        self.assertEqual(self.batch.blitted, 2)
+        # Later blits stay on top
+        self.assertEqual(self.surface.get_at((2, 2)), (255, 0, 0, 255))
+        self.assertEqual(self.surface.get_at((7, 7)), (0, 0, 255, 255))
+
+    def test_area(self):
+        rect = self.batch.blit(self.red, (20, 20), (0, 0, 5, 5))
+        self.assertEqual(rect, pygame.Rect(20, 20, 5, 5))
+        self.batch.flush()
+        self.assertEqual(self.surface.get_at((22, 22)), (255, 0, 0, 255))
+        self.assertEqual(self.surface.get_at((27, 27)), (0, 0, 0, 255))
+
+    def test_keeps_order(self):
+        self.batch.blit(self.red, (0, 0))
+        self.batch.fill((0, 255, 0), (0, 0, 5, 5))
+        self.batch.blit(self.blue, (8, 8))
+        self.batch.flush()
+        self.assertEqual(self.surface.get_at((2, 2)), (0, 255, 0, 255))
+        self.assertEqual(self.surface.get_at((6, 6)), (255, 0, 0, 255))
+        self.assertEqual(self.surface.get_at((9, 9)), (0, 0, 255, 255))
+
+    def test_replay(self):
+        recording = RecordingSurface(self.surface)
+        recording.blits([(self.red, (0, 0)), (self.blue, (5, 5))])
+        recording.fill((0, 255, 0), (0, 0, 3, 3))
+        target = pygame.Surface((100, 100))
+        replay(target, recording.ops, (-10, -10))
+        self.assertEqual(target.get_at((11, 11)), (0, 255, 0, 255))
+        self.assertEqual(target.get_at((14, 14)), (255, 0, 0, 255))
+        self.assertEqual(target.get_at((17, 17)), (0, 0, 255, 255))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import pygame
+
+from engine.ui.core.binding import Binding, binding_stats
+from engine.ui.element.text import Text
+
+class Model(object):
+    health = 10
+
+
+class TestBinding(unittest.TestCase):
+
+    def setUp(self):
+        self.values = []
+        self.binding = Binding(lambda model: model.health,
+            self.values.append)
+        self.model = Model()
+
+    def test_change(self):
+        stats = binding_stats()
+        self.binding.update(self.model)
+        self.binding.update(self.model)
+        self.model.health = 5
+        self.binding.update(self.model)
+        self.assertListEqual(self.values, [10, 5])
+        after = binding_stats()
+        self.assertEqual(after["performed"] - stats["performed"], 2)
+        self.assertEqual(after["skipped"] - stats["skipped"], 1)
+
+    def test_reset(self):
+        self.binding.update(self.model)
+        self.binding.reset()
+        self.binding.update(self.model)
+        self.assertListEqual(self.values, [10, 10])
+
+
+class TestText(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def test_unchanged(self):
+        text = Text("text", 0, 0, "same", 20)
+        text.set_text("same")
+        self.assertFalse(text.dirty)
+        text.set_text("other")
+        self.assertTrue(text.dirty)
+        text.render(pygame.Surface((100, 100)), None, None)
+        self.assertFalse(text.dirty)
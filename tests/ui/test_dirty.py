@@ -0,0 +1,60 @@
+import unittest
+
+import pygame
+
+from engine.ui.core.dirty import DirtyRenderer
+
+class TestDirtyRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = pygame.Surface((200, 100))
+        self.renderer = DirtyRenderer()
+        self.red = pygame.Surface((10, 10))
+        self.red.fill((255, 0, 0))
+        self.blue = pygame.Surface((10, 10))
+        self.blue.fill((0, 0, 255))
+
+    def frame(self, *blits, extra=()):
+        recording = self.renderer.record(self.surface)
+        for source, position in blits:
+            recording.blit(source, position)
+        return self.renderer.render(recording, extra)
+
+    def test_first_frame(self):
+        rects = self.frame((self.red, (0, 0)))
+        self.assertListEqual(rects, [self.surface.get_rect()])
+        self.assertEqual(self.surface.get_at((5, 5)), (255, 0, 0, 255))
+
+    def test_unchanged(self):
+        self.frame((self.red, (0, 0)))
+        self.assertListEqual(self.frame((self.red, (0, 0))), [])
+
+    def test_moved(self):
+        self.frame((self.red, (0, 0)), (self.blue, (50, 50)))
+        rects = self.frame((self.red, (20, 0)), (self.blue, (50, 50)))
+        self.assertListEqual(rects, [pygame.Rect(0, 0, 10, 10),
+            pygame.Rect(20, 0, 10, 10)])
+        self.assertEqual(self.surface.get_at((5, 5)), (0, 0, 0, 255))
+        self.assertEqual(self.surface.get_at((25, 5)), (255, 0, 0, 255))
+
+    def test_extra(self):
+        self.frame((self.red, (0, 0)))
+        self.surface.fill((255, 255, 255), (100, 50, 4, 4))
+        rects = self.frame((self.red, (0, 0)), extra=[(100, 50, 4, 4)])
+        self.assertListEqual(rects, [pygame.Rect(100, 50, 4, 4)])
+        self.assertEqual(self.surface.get_at((101, 51)), (0, 0, 0, 255))
+
+    def test_check_in_place(self):
+        self.renderer = DirtyRenderer(check=True)
+        self.frame((self.red, (0, 0)))
+        self.red.fill((0, 255, 0))
+        with self.assertLogs(level="WARNING"):
+            rects = self.frame((self.red, (0, 0)))
+        self.assertListEqual(rects, [pygame.Rect(0, 0, 10, 10)])
+        self.assertEqual(self.surface.get_at((5, 5)), (0, 255, 0, 255))
+
+    def test_merge(self):
+        rects = self.renderer.merge([(0, 0, 10, 10), (5, 5, 10, 10),
+            (50, 50, 5, 5)], self.surface.get_rect())
+        self.assertListEqual(rects, [pygame.Rect(0, 0, 15, 15),
+            pygame.Rect(50, 50, 5, 5)])
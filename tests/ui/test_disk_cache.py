@@ -0,0 +1,123 @@
+from unittest import mock
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from engine.loader import loader, IMAGE
+from engine.ui.draw import disk
+from engine.ui.draw.disk import DiskCache
+from engine.ui.draw.simple import draw_image, prefetch_image, image_cache
+
+class TestDiskCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.directory.name,
+            3 * (DiskCache.HEADER.size + 10 * 10 * 4))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def surface(self, colour):
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill(colour)
+        return surface
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", self.surface((10, 20, 30, 40)))
+        # A new cache reads what an earlier run left
+        cache = DiskCache(self.directory.name, self.cache.cap)
+        surface = cache.get("a")
+        self.assertEqual(surface.get_size(), (10, 10))
+        self.assertEqual(tuple(surface.get_at((5, 5))), (10, 20, 30, 40))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["files"], 1)
+
+    def test_damaged(self):
+        self.cache.put("a", self.surface((255, 0, 0, 255)))
+        with open(self.cache.path("a"), "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b"\x00")
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()["invalid"], 1)
+        self.assertFalse(os.path.exists(self.cache.path("a")))
+
+    def test_cap(self):
+        for key in "abcd":
+            self.cache.put(key, self.surface((255, 0, 0, 255)))
+            if key == "c":
+                # Reading a file counts as using it
+                self.cache.get("a")
+        self.assertTrue(os.path.exists(self.cache.path("a")))
+        self.assertFalse(os.path.exists(self.cache.path("b")))
+        stats = self.cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["bytes"], self.cache.cap)
+
+    def test_order_between_runs(self):
+        for i, key in enumerate("abc"):
+            self.cache.put(key, self.surface((255, 0, 0, 255)))
+            os.utime(self.cache.path(key), ((2 - i), (2 - i)))
+        cache = DiskCache(self.directory.name, self.cache.cap)
+        cache.scan()
+        self.assertListEqual(list(cache.files), [
+            key + DiskCache.SUFFIX for key in "cba"])
+
+    def test_key(self):
+        source = os.path.join(self.directory.name, "source.png")
+        with open(source, "wb") as file:
+            file.write(b"1")
+        os.utime(source, (1, 1))
+        key = DiskCache.key(("frame", 1), (source,))
+        self.assertEqual(key, DiskCache.key(("frame", 1), (source,)))
+        self.assertNotEqual(key, DiskCache.key(("frame", 2), (source,)))
+        os.utime(source, (2, 2))
+        self.assertNotEqual(key, DiskCache.key(("frame", 1), (source,)))
+
+
+class TestPersistentImages(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "sprite.png")
+        surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 255))
+        pygame.image.save(surface, self.filename)
+        self.cache = DiskCache(os.path.join(self.directory.name, "cache"),
+            1024 * 1024)
+        patch = mock.patch.object(disk, "disk_cache", self.cache)
+        patch.start()
+        self.addCleanup(patch.stop)
+        image_cache.clear()
+
+    def tearDown(self):
+        image_cache.clear()
+        self.directory.cleanup()
+
+    def test_prefetched_warm_start(self):
+        key = (IMAGE, self.filename, 4)
+        prefetch_image(self.filename, 4)
+        self.assertIn(key, loader)
+        # What the loader decoded is kept on disk
+        self.assertEqual(draw_image(self.filename, 4).get_size(), (16, 16))
+        self.assertEqual(len(self.cache.files), 1)
+
+        image_cache.clear()
+        prefetch_image(self.filename, 4)
+        self.assertNotIn(key, loader)
+        surface = draw_image(self.filename, 4)
+        self.assertEqual(tuple(surface.get_at((15, 15))), (10, 20, 30, 255))
+        self.assertEqual(self.cache.hits, 1)
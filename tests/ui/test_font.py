@@ -0,0 +1,26 @@
+import unittest
+
+import pygame
+
+from engine.ui.draw.font import get_font, font_stats
+
+class TestFontRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def test_shared(self):
+        self.assertIs(get_font(21), get_font(21))
+        self.assertIsNot(get_font(21), get_font(22))
+
+    def test_stats(self):
+        get_font(23)
+        stats = font_stats()
+        requests = stats["requests"]
+        get_font(23)
+        self.assertEqual(font_stats()["fonts"], stats["fonts"])
+        self.assertEqual(font_stats()["requests"], requests + 1)
+        self.assertGreater(stats["file_bytes"], 0)
+        # Recorded when a font loads, not looked up again
+        self.assertEqual(font_stats()["file_bytes"], stats["file_bytes"])
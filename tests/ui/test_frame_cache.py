@@ -0,0 +1,91 @@
+import unittest
+
+import pygame
+
+from engine.ui.draw.cache import SurfaceCache
+import engine.ui.draw.frame as frame
+
+class TestSurfaceCache(unittest.TestCase):
+
+    def test_lru(self):
+        cache = SurfaceCache("test", 2 * 10 * 10 * 4)
+        for key in ("a", "b"):
+            cache.put(key, pygame.Surface((10, 10), pygame.SRCALPHA))
+        cache.get("a")
+        cache.put("c", pygame.Surface((10, 10), pygame.SRCALPHA))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["bytes"], 2 * 10 * 10 * 4)
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+    def test_pinned(self):
+        cache = SurfaceCache("test", 2 * 10 * 10 * 4)
+        cache.pin("a")
+        for key in ("a", "b", "c"):
+            cache.put(key, pygame.Surface((10, 10), pygame.SRCALPHA))
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        cache.pin("c")
+        cache.put("d", pygame.Surface((10, 10), pygame.SRCALPHA))
+        # Over budget while pinned
+        self.assertEqual(cache.stats()["entries"], 3)
+        cache.unpin()
+        self.assertListEqual(list(cache.surfaces), ["c", "d"])
+
+    def test_subsurfaces(self):
+        cache = SurfaceCache("test", 2 * 10 * 10 * 4)
+        page = pygame.Surface((10, 10), pygame.SRCALPHA)
+        cache.put("page", page)
+        cache.put("sprite", page.subsurface((0, 0, 5, 5)))
+        # Sprites cut from the page take up no bytes of their own
+        self.assertEqual(cache.stats()["bytes"], 10 * 10 * 4)
+        cache.pin("sprite")
+        for key in ("a", "b"):
+            cache.put(key, pygame.Surface((10, 10), pygame.SRCALPHA))
+        self.assertIn("page", cache)
+        self.assertNotIn("a", cache)
+        cache.unpin()
+        cache.put("c", pygame.Surface((10, 10), pygame.SRCALPHA))
+        # The page goes with its sprites
+        self.assertNotIn("page", cache)
+        self.assertNotIn("sprite", cache)
+        self.assertEqual(cache.stats()["bytes"], 2 * 10 * 10 * 4)
+
+
+class TestFrameCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        frame.frame_cache.clear()
+
+    def test_hit(self):
+        first = frame.draw_frame(64, 48, seed=3)
+        hits = frame.frame_cache.hits
+        second = frame.draw_frame(64, 48, seed=3)
+        self.assertEqual(frame.frame_cache.hits, hits + 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(pygame.image.tostring(first, "RGBA"),
+            pygame.image.tostring(second, "RGBA"))
+
+    def test_copies(self):
+        first = frame.draw_frame(64, 48, seed=3)
+        first.fill((255, 0, 0))
+        second = frame.draw_frame(64, 48, seed=3)
+        self.assertNotEqual(second.get_at((20, 20)), (255, 0, 0, 255))
+
+    def test_highlight(self):
+        plain = frame.draw_frame(64, 48, seed=3)
+        yellow = frame.draw_highlight_frame(64, 48, (255, 255, 0), seed=3)
+        green = frame.draw_highlight_frame(64, 48, (0, 255, 0), seed=3)
+        self.assertEqual(yellow.get_at((0, 20)), (255, 255, 0, 255))
+        self.assertEqual(green.get_at((0, 20)), (0, 255, 0, 255))
+        self.assertNotEqual(plain.get_at((0, 20)), (255, 255, 0, 255))
+        self.assertEqual(len(frame.frame_cache.surfaces), 3)
@@ -0,0 +1,42 @@
+import unittest
+
+import pygame
+
+from engine.ui.draw.simple import draw_image, image_cache, pin_image, \
+    unpin_images
+
+class TestImageCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        image_cache.clear()
+        unpin_images()
+
+    def test_scaled_variants(self):
+        image = draw_image("image/ui/slot.png", 3)
+        self.assertIs(draw_image("image/ui/slot.png", 3), image)
+        original = draw_image("image/ui/slot.png")
+        self.assertEqual(image.get_width(), original.get_width() * 3)
+        opaque = draw_image("image/ui/slot.png", 3, alpha=False)
+        self.assertFalse(opaque.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(image_cache.stats()["entries"], 3)
+
+    def test_pinned(self):
+        pin_image("image/ui/slot.png", 3)
+        budget = image_cache.budget
+        image_cache.budget = 0
+        try:
+            draw_image("image/ui/slot.png", 3)
+            draw_image("image/ui/slot.png", 2)
+            draw_image("image/ui/slot.png", 1)
+            self.assertIn(("image/ui/slot.png", 3, True), image_cache)
+            self.assertNotIn(("image/ui/slot.png", 2, True), image_cache)
+        finally:
+            image_cache.budget = budget
+
+if __name__ == '__main__':
+    unittest.main()
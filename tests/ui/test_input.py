@@ -0,0 +1,68 @@
+import unittest
+
+import pygame
+
+from engine.ui.core.input import dispatcher
+from engine.ui.core.zone import Zone
+
+def motion(x, y):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0),
+        buttons=(0, 0, 0))
+
+def button(down, x, y):
+    kind = pygame.MOUSEBUTTONDOWN if down else pygame.MOUSEBUTTONUP
+    return pygame.event.Event(kind, pos=(x, y), button=1)
+
+class TestInputDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        dispatcher.__init__()
+        self.zone = Zone((10, 10, 20, 20))
+        self.far = Zone((500, 500, 20, 20))
+
+    def frame(self, *events):
+        dispatcher.dispatch(events)
+        return self.zone.update(None), self.zone.state
+
+    def test_cells(self):
+        self.assertListEqual(self.zone.cells, [(0, 0)])
+        self.assertListEqual(dispatcher.cells_of(pygame.Rect(60, 0, 10, 70)),
+            [(0, 0), (0, 1), (1, 0), (1, 1)])
+
+    def test_hover_and_click(self):
+        self.assertEqual(self.frame(), (Zone.NEUTRAL, Zone.NEUTRAL))
+        self.assertEqual(self.frame(motion(15, 15)),
+            (Zone.NEUTRAL, Zone.HOVERED))
+        self.assertEqual(self.frame(button(True, 15, 15)),
+            (Zone.HOVERED, Zone.CLICKED))
+        self.assertEqual(self.frame(button(False, 15, 15)),
+            (Zone.CLICKED, Zone.HOVERED))
+        self.assertEqual(self.frame(motion(100, 100)),
+            (Zone.HOVERED, Zone.NEUTRAL))
+
+    def test_only_affected_zones(self):
+        self.frame()
+        self.far.update(None)
+        tests = dispatcher.tests
+        self.frame(motion(15, 15))
+        self.assertEqual(dispatcher.tests, tests + 1)
+        self.frame()
+        self.assertEqual(dispatcher.tests, tests + 1)
+
+    def test_inactive(self):
+        self.frame()
+        dispatcher.dispatch([motion(15, 15)])
+        dispatcher.dispatch([])
+        dispatcher.dispatch([])
+        # Not rendered for a while, tested again when shown
+        self.zone.state = Zone.NEUTRAL
+        self.assertEqual(self.frame(), (Zone.NEUTRAL, Zone.HOVERED))
+
+    def test_moved(self):
+        self.frame(motion(100, 100))
+        self.zone.update_rect(pygame.Rect(90, 90, 20, 20))
+        self.assertListEqual(self.zone.cells, [(1, 1)])
+        self.assertEqual(self.zone.state, Zone.HOVERED)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+import pygame
+
+from engine.loader import AssetLoader, IMAGE
+
+class TestAssetLoader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.loader = AssetLoader()
+        self.key = (IMAGE, "image/ui/health.png", 2)
+
+    def test_prefetch(self):
+        self.loader.request(self.key)
+        self.assertFalse(self.loader.ready([self.key]))
+        while not self.loader.ready([self.key]):
+            self.loader.finalize(None)
+        image = self.loader.image("image/ui/health.png", 2)
+        original = pygame.image.load("image/ui/health.png")
+        self.assertEqual(image.get_width(), original.get_width() * 2)
+        stats = self.loader.stats()
+        self.assertEqual(stats["prefetched"], 1)
+        self.assertEqual(stats["synchronous"], 0)
+
+    def test_wait(self):
+        self.loader.request(self.key)
+        self.assertIsNotNone(self.loader.image("image/ui/health.png", 2))
+        self.assertEqual(self.loader.stats()["synchronous"], 0)
+
+    def test_synchronous(self):
+        self.loader.image("image/ui/health.png")
+        self.assertEqual(self.loader.stats()["synchronous"], 1)
+
+    def test_failed(self):
+        key = (IMAGE, "image/missing.png", 1)
+        self.loader.request(key)
+        while not self.loader.ready([key]):
+            self.loader.finalize(None)
+        self.assertEqual(self.loader.stats()["failed"], 1)
+        with self.assertRaises((pygame.error, FileNotFoundError)):
+            self.loader.image("image/missing.png")
+
+if __name__ == '__main__':
+    unittest.main()
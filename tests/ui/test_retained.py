@@ -0,0 +1,74 @@
+import unittest
+
+import pygame
+
+from engine.ui.core.dirty import RecordingSurface
+from engine.ui.core.manager import Manager
+from engine.ui.core.renderable import Renderable
+
+class Square(Renderable):
+
+    def __init__(self, name, x, y, colour):
+        super().__init__(name, x, y)
+        self.surface = pygame.Surface((10, 10))
+        self.surface.fill(colour)
+        self.renders = 0
+
+    def render(self, surface, game, system):
+        self.renders += 1
+        surface.blit(self.surface, (self.x, self.y))
+
+class Retained(Manager):
+
+    retained = True
+
+    def update(self, game, system):
+        pass
+
+class TestRetainedManager(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = pygame.Surface((100, 100))
+        self.manager = Retained("retained", 0, 0)
+        self.red = Square("red", 10, 10, (255, 0, 0))
+        self.blue = Square("blue", 30, 10, (0, 0, 255))
+        self.manager.add_renderable(self.red)
+        self.manager.add_renderable(self.blue)
+
+    def test_reused(self):
+        self.manager.render(self.surface, None, None)
+        offscreen = self.manager.retained_surface.surface
+        self.manager.render(self.surface, None, None)
+        self.assertIs(self.manager.retained_surface.surface, offscreen)
+        self.assertEqual(self.manager.retained_surface.draws, 1)
+        self.assertEqual(self.manager.retained_surface.reuses, 1)
+        self.assertEqual(offscreen.get_size(), (30, 10))
+        # Renderables still run to handle input
+        self.assertEqual(self.red.renders, 2)
+        self.assertEqual(self.surface.get_at((15, 15)), (255, 0, 0, 255))
+        self.assertEqual(self.surface.get_at((35, 15)), (0, 0, 255, 255))
+
+    def test_changed(self):
+        self.manager.render(self.surface, None, None)
+        offscreen = self.manager.retained_surface.surface
+        self.blue.surface = pygame.Surface((10, 10))
+        self.blue.surface.fill((0, 255, 0))
+        self.manager.render(self.surface, None, None)
+        self.assertIsNot(self.manager.retained_surface.surface, offscreen)
+        self.assertEqual(self.manager.retained_surface.draws, 2)
+        self.assertEqual(self.surface.get_at((35, 15)), (0, 255, 0, 255))
+
+    def test_recording(self):
+        recording = RecordingSurface(self.surface)
+        self.manager.render(recording, None, None)
+        self.assertEqual(len(recording.ops), 1)
+
+    def test_not_cacheable(self):
+        self.blue.render = lambda surface, game, system: \
+            surface.fill((0, 0, 255, 128), pygame.Rect(30, 10, 10, 10))
+        self.manager.render(self.surface, None, None)
+        self.assertIsNone(self.manager.retained_surface.recording)
+        self.assertEqual(self.manager.retained_surface.draws, 0)
+
+if __name__ == '__main__':
+    unittest.main()
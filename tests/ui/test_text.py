@@ -0,0 +1,39 @@
+import unittest
+
+import pygame
+
+from engine.ui.draw.simple import draw_text
+from engine.ui.draw.text import wrap, layout, text_cache
+
+class TestTextLayout(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+        cls.font = pygame.font.Font("assets/fonts/VT323-Regular.ttf", 20)
+
+    def test_wrap(self):
+        text = "the quick brown fox jumps over the lazy dog " * 5
+        lines = wrap(text, 100, self.font)
+        self.assertEqual(" ".join(lines), text)
+        for line in lines:
+            self.assertLessEqual(self.font.size(line)[0], 100)
+
+    def test_long_word(self):
+        self.assertListEqual(wrap("a " + "w" * 40 + " b", 50, self.font),
+            ["a", "w" * 40, "b"])
+
+    def test_paragraphs(self):
+        self.assertListEqual(layout("one\ntwo three", 500, self.font),
+            ["one", "two three"])
+
+    def test_cache(self):
+        text_cache.clear()
+        first = draw_text("cached text", self.font, (255, 255, 255), 200)
+        hits = text_cache.hits
+        second = draw_text("cached text", self.font, (255, 255, 255), 200)
+        self.assertEqual(text_cache.hits, hits + 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.get_size(), (200, self.font.get_height()))
+        draw_text("cached text", self.font, (255, 0, 0), 200)
+        self.assertEqual(len(text_cache.surfaces), 2)